@@ -1,31 +1,121 @@
 import sys
 import qdarkstyle
+import atexit
 import logging
+import logging.handlers
+import queue
 from PySide6.QtWidgets import QApplication, QSplashScreen
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QStandardPaths
 from PySide6.QtGui import QPixmap
-from src.mainwindow import MainWindow
-import _icons_rc
+from src.startup import StartupTimer, load_cached_stylesheet
+from src.icon_resources import load_icon_resources
 import os
 
+LOG_FORMAT = '%(asctime)s - %(name)s - %(threadName)s - %(levelname)s - %(message)s'
+LOG_FILE_NAME = "remote_gui.log"
+LOG_FILE_MAX_BYTES = 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 5
+
+LOG_LEVEL_ENV = "REMOTE_GUI_LOG_LEVEL"    # 전체 기본 레벨 (예: DEBUG)
+LOG_LEVELS_ENV = "REMOTE_GUI_LOG_LEVELS"  # 서브시스템별 레벨 (예: protocol=DEBUG,io=WARNING,src.home_page=DEBUG)
+LOG_FILE_ENV = "REMOTE_GUI_LOG_FILE"      # 로그 파일 경로 (빈 값이면 파일에 기록하지 않음)
+
+# 서브시스템 이름 -> 로거 이름 (LOG_LEVELS_ENV 에서는 로거 이름을 직접 써도 됨)
+LOG_SUBSYSTEMS = {
+    'protocol': ('src.widgets.serial_protocol', 'src.widgets.serial_crc', 'src.widgets.serial_requests'),
+    'io': ('src.widgets.serial_reader', 'src.widgets.serial_writer', 'src.widgets.serial_threads',
+           'src.widgets.port_watcher'),
+    'serial': ('src.serial_manager', 'src.widgets.link_monitor'),
+    'gui': ('src.mainwindow', 'src.home_page', 'src.setting_page', 'src.jog_page', 'src.help_page',
+            'src.startup', 'src.icon_resources'),
+    'diagnostics': ('src.metrics_server', 'src.widgets.packet_tracer', 'src.widgets.packet_capture',
+                    'src.widgets.capture_replay'),
+}
+
+
+def _default_log_file() -> str:
+    """사용자 데이터 경로 아래의 로그 파일 경로"""
+    base = QStandardPaths.writableLocation(QStandardPaths.AppLocalDataLocation)
+    if not base:
+        base = os.path.join(QStandardPaths.writableLocation(QStandardPaths.TempLocation), "remote_gui")
+    return os.path.join(base, "logs", LOG_FILE_NAME)
+
+
+def _apply_log_levels(spec: str) -> None:
+    """'이름=레벨,...' 형식의 서브시스템별 레벨을 적용합니다."""
+    for item in spec.split(','):
+        name, _, level = item.partition('=')
+        name, level = name.strip(), level.strip().upper()
+        if not name or not isinstance(logging.getLevelName(level), int):
+            continue
+        for logger_name in LOG_SUBSYSTEMS.get(name, (name,)):
+            logging.getLogger(logger_name).setLevel(level)
+
+
 def setup_logging():
-    """로깅 설정을 초기화합니다."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    """
+    로깅 설정을 초기화합니다.
+    모든 기록은 QueueHandler 로 큐에 넣기만 하고, 콘솔/파일 출력은 QueueListener 쓰레드가 담당하므로
+    시리얼 송수신 쓰레드가 디스크나 콘솔 출력을 기다리지 않습니다.
+    파일은 크기 기준으로 교체됩니다. (LOG_FILE_MAX_BYTES x LOG_FILE_BACKUP_COUNT)
+
+    Returns:
+        logging.handlers.QueueListener: 종료 시 stop() 으로 남은 기록을 비움 (atexit 에도 등록됨)
+    """
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = []
+    if sys.stderr is not None:  # pyinstaller -w 빌드에는 콘솔이 없음
+        console = logging.StreamHandler()
+        console.setFormatter(formatter)
+        handlers.append(console)
+
+    log_file = os.environ.get(LOG_FILE_ENV)
+    if log_file is None:
+        log_file = _default_log_file()
+    if log_file:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUP_COUNT,
+                encoding='utf-8', delay=True
+            )
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
+        except OSError as e:
+            print(f"로그 파일을 열 수 없습니다 ({log_file}): {e}", file=sys.stderr)
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    level = os.environ.get(LOG_LEVEL_ENV, '').strip().upper()
+    root.setLevel(level if isinstance(logging.getLevelName(level), int) else logging.INFO)
+    _apply_log_levels(os.environ.get(LOG_LEVELS_ENV, ''))
+    return listener
 
 
 def main():
     """애플리케이션의 메인 진입점입니다."""
     try:
-        # 로깅 설정
+        # 로깅 설정 (로그 파일 기본 경로에 애플리케이션 이름이 사용됨)
+        QApplication.setApplicationName("remote_gui")  # 캐시 경로 등에 사용
         setup_logging()
         logger = logging.getLogger(__name__)
         logger.info("애플리케이션 시작")
+        startup = StartupTimer.get_instance()
 
         # QApplication 인스턴스 생성
         app = QApplication(sys.argv)
+        startup.mark("QApplication")
+
+        # 아이콘 리소스 (_icons.rcc 가 있으면 메모리 매핑, 없으면 _icons_rc 모듈)
+        load_icon_resources()
+        startup.mark("resources")
 
         # 스플래시 스크린 설정 (리소스 경로 사용)
         splash_pix = QPixmap(u":/font_awesome_solid/icons/user/splash.png")
@@ -50,16 +140,22 @@ def main():
         
         splash.show()
         app.processEvents()
+        startup.mark("splash")
 
-        # 다크 스타일 시트 설정
-        light_stylesheet = qdarkstyle.load_stylesheet(palette=qdarkstyle.LightPalette)
+        # 스타일 시트 설정 (버전별 캐시 파일 사용)
+        light_stylesheet = load_cached_stylesheet(app, qdarkstyle.LightPalette)
         app.setStyleSheet(light_stylesheet)
+        startup.mark("stylesheet")
         
-        # 메인 윈도우 생성
+        # 메인 윈도우 생성 (홈 이외의 페이지는 처음 이동할 때 생성)
+        from src.mainwindow import MainWindow
         window = MainWindow()
+        startup.mark("MainWindow")
         
-        # 스플래시 스크린을 2초 동안 표시 후 메인 윈도우 표시
-        QTimer.singleShot(2000, lambda: [window.show(), splash.finish(window)])
+        # 준비가 끝나면 바로 메인 윈도우 표시, 첫 프레임까지의 시간을 로그로 남김
+        startup.watch_first_frame(window)
+        window.show()
+        splash.finish(window)
         
         # 이벤트 루프 실행
         exit_code = app.exec()
@@ -68,7 +164,7 @@ def main():
         sys.exit(exit_code)
         
     except Exception as e:
-        logger.error(f"예기치 않은 오류 발생: {str(e)}", exc_info=True)
+        logger.error("예기치 않은 오류 발생: %s", e, exc_info=True)
         sys.exit(1)
 
 if __name__ == '__main__':
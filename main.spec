@@ -1,16 +1,25 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
 
+# 아이콘은 바이너리 리소스(_icons.rcc)로 포함하고 _icons_rc 모듈은 번들에서 제외
+# (pyside6-rcc --binary src/resources/icons/_icons.qrc -o _icons.rcc 로 생성, README 참고)
+if os.path.exists('_icons.rcc'):
+    icon_datas = [('_icons.rcc', '.')]
+    icon_excludes = ['_icons_rc']
+else:
+    icon_datas = []
+    icon_excludes = []
 
 a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=icon_datas,
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=icon_excludes,
     noarchive=False,
     optimize=0,
 )
@@ -2,8 +2,14 @@ from PySide6.QtWidgets import QWidget, QMessageBox
 from PySide6.QtGui import QPixmap
 from src.ui.home_page_ui import Ui_HomePage
 from src.widgets.serial_commands import SerialCommands
+from src.widgets.serial_protocol import PlayControlState, StatusSnapshot
+from src.widgets.refresh_scheduler import RefreshScheduler
 import _icons_rc   
-from PySide6.QtCore import QTimer, QDateTime
+from PySide6.QtCore import QDateTime
+import logging
+
+
+logger = logging.getLogger(__name__)
 
 
 class HomePage(QWidget):
@@ -25,24 +31,16 @@ class HomePage(QWidget):
         self._power_status_connected = False
         self._current_protocol = None
         
-        # 전원 버튼 관련 변수 추가
-        self._power_cooldown_timer = QTimer(self)
-        self._power_cooldown_timer.setInterval(1000)  # 1초 간격
-        self._power_cooldown_timer.timeout.connect(self._update_power_cooldown)
-        self._power_cooldown_count = 0
+        # 전원 버튼: 장치 응답(또는 RTT 기반 타임아웃)까지 비활성화
         self._power_button_enabled = True
         
-        # 재생 제어 관련 변수 추가
-        self._play_control_timer = QTimer(self)
-        self._play_control_timer.setInterval(3000)  # 3초 타임아웃
-        self._play_control_timer.timeout.connect(self._handle_play_control_timeout)
+        # 재생 제어: 응답을 기다리는 요청 수 (응답/타임아웃은 요청 핸들 콜백으로 통지)
+        self._pending_play_requests = 0
         self._waiting_play_control_ack = False
+        self._play_reply_failed = False  # 응답 대기 중인 요청 중 응답 없이 끝난 것이 있는지 여부
         
-        # 모션 시간 UI 업데이트를 위한 타이머 추가
-        self._motion_update_timer = QTimer(self)
-        self._motion_update_timer.setInterval(50)  # 50ms 간격으로 업데이트
-        self._motion_update_timer.timeout.connect(self._update_motion_time_display)
-        self._motion_update_timer.start()
+        # 화면 갱신 스케줄러 (최신 값만 최대 갱신률로 반영, 재생 중에만 모션 시간 애니메이션)
+        self._scheduler = RefreshScheduler.get_instance()
         
         # 모션 시간 관련 변수 (모두 ms 단위)
         self._last_current_time = 0
@@ -94,13 +92,20 @@ class HomePage(QWidget):
             self.connect_protocol_signals()
         else:
             self.disconnect_protocol_signals()
+            # 연결 해제 시 모션 시간 애니메이션 중지
+            self._scheduler.set_animation('home.motion', None)
         
     def disconnect_protocol_signals(self):
         """프로토콜 시그널 연결 해제"""
         if self._power_status_connected and self._current_protocol:
             try:
                 self._current_protocol.main_power_status_changed.disconnect(self.update_power_status)
-                self._current_protocol.status_sync_changed.disconnect(self.update_status_info)
+                self._current_protocol.status_power_changed.disconnect(self._on_status_power_changed)
+                self._current_protocol.status_play_state_changed.disconnect(self._on_status_play_state_changed)
+                self._current_protocol.status_runtime_changed.disconnect(self._on_status_runtime_changed)
+                self._current_protocol.status_count_changed.disconnect(self._on_status_count_changed)
+                self._current_protocol.status_energy_changed.disconnect(self._on_status_energy_changed)
+                self._current_protocol.status_motion_time_changed.disconnect(self._on_status_motion_time_changed)
                 self._current_protocol.play_control_status_changed.disconnect(self.on_play_control_status_changed)
             except:
                 pass
@@ -118,19 +123,29 @@ class HomePage(QWidget):
             # 새로운 연결 설정
             if not self._power_status_connected:
                 protocol.main_power_status_changed.connect(self.update_power_status)
-                protocol.status_sync_changed.connect(self.update_status_info)
+                # 상태 동기화는 실제로 바뀐 필드만 갱신
+                protocol.status_power_changed.connect(self._on_status_power_changed)
+                protocol.status_play_state_changed.connect(self._on_status_play_state_changed)
+                protocol.status_runtime_changed.connect(self._on_status_runtime_changed)
+                protocol.status_count_changed.connect(self._on_status_count_changed)
+                protocol.status_energy_changed.connect(self._on_status_energy_changed)
+                protocol.status_motion_time_changed.connect(self._on_status_motion_time_changed)
                 protocol.play_control_status_changed.connect(self.on_play_control_status_changed)
                 self._power_status_connected = True
                 self._current_protocol = protocol
+                # 변경 시그널은 바뀐 필드만 오므로 연결 전에 받은 상태는 한 번 전부 반영
+                if protocol.lastStatus is not None:
+                    self.update_status_info(protocol.lastStatus)
         
     def on_main_power_clicked(self):
         """메인 전원 버튼 클릭 핸들러"""
         if not self._power_button_enabled:
-            return  # 쿨다운 중이면 동작하지 않음
+            return  # 응답 대기 중이면 동작하지 않음
         
-        success = self.serial_commands.send_main_power_control(self.ui.MainPowerButton.isChecked())
+        future = self.serial_commands.request_main_power_control(
+            self.ui.MainPowerButton.isChecked(), self._on_main_power_reply)
         
-        if not success:
+        if future is None:
             # 실패 시 에러 메시지 표시 및 버튼 상태 되돌리기
             if not self.serial_commands.serial_manager.is_port_connected():
                 QMessageBox.warning(self, "경고", "시리얼 포트가 연결되지 않았습니다.")
@@ -138,30 +153,25 @@ class HomePage(QWidget):
                 QMessageBox.critical(self, "오류", "메인 전원 제어 실패")
             self.ui.MainPowerButton.setChecked(not self.ui.MainPowerButton.isChecked())
         else:
-            # 성공 시 쿨다운 시작
+            # 장치 응답까지 버튼 비활성화
             self._power_button_enabled = False
-            self._power_cooldown_count = 3  # 3초 카운트다운
             self.ui.MainPowerButton.setEnabled(False)  # 버튼 비활성화
-            self.ui.mainPowerCountDownLabel.setText(f"대기시간: {self._power_cooldown_count}초")
-            self._power_cooldown_timer.start()
+            self.ui.mainPowerCountDownLabel.setText("응답 대기 중")
     
-    def _update_power_cooldown(self):
-        """전원 버튼 쿨다운 타이머 업데이트"""
-        self._power_cooldown_count -= 1
-        
-        if self._power_cooldown_count <= 0:
-            # 쿨다운 종료
-            self._power_cooldown_timer.stop()
-            self._power_button_enabled = True
-            self.ui.MainPowerButton.setEnabled(True)
-            self.ui.mainPowerCountDownLabel.setText("")
+    def _on_main_power_reply(self, future):
+        """메인 전원 제어 응답/타임아웃 처리 (응답 시 전원 상태는 update_power_status 로 반영)"""
+        self._power_button_enabled = True
+        self.ui.MainPowerButton.setEnabled(True)
+        if not future.cancelled() and future.exception() is not None:
+            # 응답이 없으면 버튼을 요청 전 상태로 되돌림
+            self.ui.MainPowerButton.setChecked(not self.ui.MainPowerButton.isChecked())
+            self.ui.mainPowerCountDownLabel.setText("응답 없음")
         else:
-            # 카운트다운 표시 업데이트
-            self.ui.mainPowerCountDownLabel.setText(f"대기시간: {self._power_cooldown_count}초")
+            self.ui.mainPowerCountDownLabel.setText("")
 
     def update_power_status(self, is_on: bool):
         """전원 상태에 따라 LED 이미지 업데이트"""
-        print(f"전원 상태 업데이트: {'켜짐' if is_on else '꺼짐'}")
+        logger.debug("전원 상태 업데이트: %s", "켜짐" if is_on else "꺼짐")
         self.ui.MainPowerIndicator.setPixmap(self.led_on if is_on else self.led_off)
         # 버튼 상태 동기화 (쿨다운 중이 아닐 때만)
         if self._power_button_enabled:
@@ -191,71 +201,90 @@ class HomePage(QWidget):
             progress = (self._display_current_time / self._last_end_time) * 100
             self.ui.motionTimeHorizontalSlider.setValue(int(progress))
 
-    def update_status_info(self, status_data: dict):
-        """상태 정보 업데이트"""
+    def update_status_info(self, status: StatusSnapshot):
+        """상태 정보 전체 업데이트 (다음 화면 갱신 프레임에 반영)"""
+        self._on_status_power_changed(status.main_power)
+        self._on_status_play_state_changed(status.play_state)
+        self._on_status_runtime_changed(status.hours, status.minutes, status.seconds)
+        self._on_status_count_changed(status.current_count, status.total_count)
+        self._on_status_energy_changed(status.voltage, status.current)
+        self._on_status_motion_time_changed(status.motion_current, status.motion_end)
+
+    def _on_status_power_changed(self, main_power: bool):
+        self._scheduler.post('home.power', self._show_status_power, main_power)
+
+    def _on_status_play_state_changed(self, play_state):
+        # 재생 중일 때만 모션 시간을 프레임마다 보간하여 표시
+        playing = play_state is PlayControlState.PLAY_ONE or play_state is PlayControlState.PLAY_REPEAT
+        self._scheduler.set_animation('home.motion', self._update_motion_time_display if playing else None)
+        self._scheduler.post('home.play_state', self._show_status_play_state, play_state)
+
+    def _on_status_runtime_changed(self, hours: int, minutes: int, seconds: int):
+        self._scheduler.post('home.runtime', self._show_status_runtime, hours, minutes, seconds)
+
+    def _on_status_count_changed(self, current_count: int, total_count: int):
+        self._scheduler.post('home.count', self._show_status_count, current_count, total_count)
 
-        # 메인 전원 상태 업데이트
-        main_power_status = status_data['main_power']['status']
-        self.ui.MainPowerIndicator.setPixmap(self.led_on if main_power_status else self.led_off)
+    def _on_status_energy_changed(self, voltage_raw: int, current_raw: int):
+        self._scheduler.post('home.energy', self._show_status_energy, voltage_raw, current_raw)
+
+    def _on_status_motion_time_changed(self, current_time: int, end_time: int):
+        self._scheduler.post('home.motion_time', self._show_status_motion_time, current_time, end_time)
+
+    def _show_status_power(self, main_power: bool):
+        """메인 전원 상태 업데이트"""
+        self.ui.MainPowerIndicator.setPixmap(self.led_on if main_power else self.led_off)
         # 버튼 상태 동기화 (쿨다운 중이 아닐 때만)
         if self._power_button_enabled:
-            self.ui.MainPowerButton.setChecked(main_power_status)
+            self.ui.MainPowerButton.setChecked(main_power)
 
-        # 모션 재생 상태 업데이트
-        motion_play_status = status_data['motion']['status']        
-        # 모션 재생 상태에 따른 버튼 활성화/비활성화
-        if motion_play_status == "PLAY_ONE" or motion_play_status == "PLAY_REPEAT":
+    def _show_status_play_state(self, play_state):
+        """모션 재생 상태에 따른 버튼 활성화/비활성화"""
+        if play_state is PlayControlState.PLAY_ONE or play_state is PlayControlState.PLAY_REPEAT:
             # 재생 중일 때
             self.ui.playButton.setEnabled(False)
             self.ui.pauseButton.setEnabled(True) 
             self.ui.stopButton.setEnabled(True)
             self.ui.repeatButton.setEnabled(False)
             # repeat 버튼 상태 동기화
-            self.ui.repeatButton.setChecked(motion_play_status == "PLAY_REPEAT")
-        elif motion_play_status == "PAUSE":
+            self.ui.repeatButton.setChecked(play_state is PlayControlState.PLAY_REPEAT)
+        elif play_state is PlayControlState.PAUSE:
             # 일시정지 상태일 때
             self.ui.playButton.setEnabled(True)
             self.ui.pauseButton.setEnabled(False)
             self.ui.stopButton.setEnabled(True)
             self.ui.repeatButton.setEnabled(True)
-        elif motion_play_status == "STOP":
+        elif play_state is PlayControlState.STOP:
             # 정지 상태일 때
             self.ui.playButton.setEnabled(True)
             self.ui.pauseButton.setEnabled(False)
             self.ui.stopButton.setEnabled(False)
             self.ui.repeatButton.setEnabled(True)
-        else:  # "UNKNOWN" 등 기타 상태
+        else:  # 알 수 없는 상태
             self.ui.playButton.setEnabled(False)
             self.ui.pauseButton.setEnabled(False)
             self.ui.stopButton.setEnabled(False)
             self.ui.repeatButton.setEnabled(False)
 
-        
+    def _show_status_runtime(self, hours: int, minutes: int, seconds: int):
+        """연속구동시간 업데이트 (00h00m00s 형식)"""
+        self.ui.runTimeLabel.setText(f"{hours:02d}h{minutes:02d}m{seconds:02d}s")
 
-        # 연속구동시간 업데이트 (00h00m00s 형식)
-        time_info = status_data['time']
-        runtime_text = f"{time_info['hours']:02d}h{time_info['minutes']:02d}m{time_info['seconds']:02d}s"
-        self.ui.runTimeLabel.setText(runtime_text)
-        
-        # 회차 정보 업데이트 (0/0 형식)
-        count_info = status_data['count']
-        round_text = f"{count_info['current']}/{count_info['total']}"
-        self.ui.roundLabel.setText(round_text)
-        
-        # 에너지 정보 업데이트 (000V / 000A / 000W 형식)
-        power_info = status_data['power']
-        voltage = power_info['voltage'] / 100.0  # 전압값이 100배로 전송된다고 가정
-        current = power_info['current'] / 100.0  # 전류값이 100배로 전송된다고 가정
+    def _show_status_count(self, current_count: int, total_count: int):
+        """회차 정보 업데이트 (0/0 형식)"""
+        self.ui.roundLabel.setText(f"{current_count}/{total_count}")
+
+    def _show_status_energy(self, voltage_raw: int, current_raw: int):
+        """에너지 정보 업데이트 (000V / 000A / 000W 형식)"""
+        voltage = voltage_raw / 100.0  # 전압값이 100배로 전송된다고 가정
+        current = current_raw / 100.0  # 전류값이 100배로 전송된다고 가정
         power = voltage * current  # 전력 계산
         
         energy_text = f"{voltage:.1f}V / {current:.1f}A / {power:.1f}W"
         self.ui.energyLabel.setText(energy_text)
-        
-        # 모션 시간 정보 업데이트 (이미 ms 단위로 수신)
-        motion_info = status_data.get('motion', {})
-        current_time = motion_info.get('current', 0)  # ms 단위
-        end_time = motion_info.get('end', 0)  # ms 단위
-        
+
+    def _show_status_motion_time(self, current_time: int, end_time: int):
+        """모션 시간 정보 업데이트 (이미 ms 단위로 수신)"""
         # 새로운 시간 값 저장
         self._last_current_time = current_time
         self._last_end_time = end_time
@@ -279,62 +308,49 @@ class HomePage(QWidget):
             return
             
         play_state = 2 if self.ui.repeatButton.isChecked() else 1  # PLAY_REPEAT or PLAY_ONE
-        success = self.serial_commands.send_play_control(play_state)
-        
-        if success:
-            self._waiting_play_control_ack = True
-            self._play_control_timer.start()
-        else:
-            if not self.serial_commands.serial_manager.is_port_connected():
-                QMessageBox.warning(self, "경고", "시리얼 포트가 연결되지 않았습니다.")
-            else:
-                QMessageBox.critical(self, "오류", "재생 제어 명령 전송 실패")
+        self._request_play_control(play_state, "재생 제어 명령 전송 실패")
     
     def on_pause_clicked(self):
         """일시정지 버튼 클릭 처리"""
         if self._waiting_play_control_ack:
             return
             
-        success = self.serial_commands.send_play_control(3)  # PAUSE
-        
-        if success:
-            self._waiting_play_control_ack = True
-            self._play_control_timer.start()
-        else:
-            if not self.serial_commands.serial_manager.is_port_connected():
-                QMessageBox.warning(self, "경고", "시리얼 포트가 연결되지 않았습니다.")
-            else:
-                QMessageBox.critical(self, "오류", "일시정지 명령 전송 실패")
+        self._request_play_control(3, "일시정지 명령 전송 실패")  # PAUSE
     
     def on_stop_clicked(self):
-        """정지 버튼 클릭 처리"""
-        if self._waiting_play_control_ack:
-            return
-            
-        success = self.serial_commands.send_play_control(4)  # STOP
+        """정지 버튼 클릭 처리 (응답 대기 중이어도 정지는 항상 즉시 전송)"""
+        self._request_play_control(4, "정지 명령 전송 실패")  # STOP
+
+    def _request_play_control(self, play_state: int, error_message: str):
+        """재생 제어 요청을 보내고 응답 대기 상태로 전환"""
+        future = self.serial_commands.request_play_control(play_state, self._on_play_control_reply)
         
-        if success:
+        if future is not None:
+            self._pending_play_requests += 1
             self._waiting_play_control_ack = True
-            self._play_control_timer.start()
         else:
             if not self.serial_commands.serial_manager.is_port_connected():
                 QMessageBox.warning(self, "경고", "시리얼 포트가 연결되지 않았습니다.")
             else:
-                QMessageBox.critical(self, "오류", "정지 명령 전송 실패")
+                QMessageBox.critical(self, "오류", error_message)
+
+    def _on_play_control_reply(self, future):
+        """
+        재생 제어 응답/타임아웃 처리 (응답 내용은 on_play_control_status_changed 로 반영)
+        응답 없음 경고는 대기 중인 요청이 모두 끝난 뒤 한 번만 표시합니다.
+        """
+        self._pending_play_requests = max(0, self._pending_play_requests - 1)
+        self._waiting_play_control_ack = self._pending_play_requests > 0
+        if not future.cancelled() and future.exception() is not None:
+            self._play_reply_failed = True
+        if self._pending_play_requests == 0 and self._play_reply_failed:
+            self._play_reply_failed = False
+            QMessageBox.warning(self, "경고", "재생 제어 응답 없음")
     
     def on_play_control_status_changed(self, status: int):
         """재생 제어 상태 변경 처리"""
-        self._play_control_timer.stop()
-        self._waiting_play_control_ack = False
-        
         # 상태에 따른 UI 업데이트
         self.ui.playButton.setEnabled(status != 1 and status != 2)  # 재생 중이 아닐 때만 활성화
         self.ui.pauseButton.setEnabled(status == 1 or status == 2)  # 재생 중일 때만 활성화
         self.ui.stopButton.setEnabled(status != 4)  # 정지 상태가 아닐 때만 활성화
         self.ui.repeatButton.setEnabled(True)
-    
-    def _handle_play_control_timeout(self):
-        """재생 제어 응답 타임아웃 처리"""
-        self._play_control_timer.stop()
-        self._waiting_play_control_ack = False
-        QMessageBox.warning(self, "경고", "재생 제어 응답 없음")
@@ -0,0 +1,83 @@
+import logging
+import os
+import sys
+import types
+from typing import List, Optional
+
+from PySide6.QtCore import QResource
+
+
+logger = logging.getLogger(__name__)
+
+RCC_FILE_NAME = "_icons.rcc"
+RCC_ENV_VAR = "REMOTE_GUI_ICONS_RCC"  # .rcc 경로 직접 지정 (빈 문자열이면 .rcc 사용 안 함)
+
+BACKEND_RCC = 'rcc'
+BACKEND_MODULE = 'module'
+
+_backend: Optional[str] = None
+
+
+def _candidate_paths() -> List[str]:
+    """.rcc 파일을 찾을 경로 목록 (우선순위 순)"""
+    override = os.environ.get(RCC_ENV_VAR)
+    if override is not None:
+        return [override] if override else []
+
+    dirs = []
+    if getattr(sys, 'frozen', False):
+        # PyInstaller: 단일 파일 빌드는 _MEIPASS, 폴더 빌드는 실행 파일 옆
+        if hasattr(sys, '_MEIPASS'):
+            dirs.append(sys._MEIPASS)
+        dirs.append(os.path.dirname(sys.executable))
+    # 개발 환경: 프로젝트 루트 (main.py 와 같은 위치)
+    dirs.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return [os.path.join(d, RCC_FILE_NAME) for d in dirs]
+
+
+def _install_module_shim() -> None:
+    """
+    생성된 UI 코드의 `import _icons_rc` 가 아이콘 바이트를 다시 올리지 않도록
+    빈 _icons_rc 모듈을 sys.modules 에 등록합니다.
+    """
+    shim = types.ModuleType('_icons_rc')
+    shim.__doc__ = f"{RCC_FILE_NAME} 로 등록된 리소스를 대신하는 빈 모듈"
+    shim.qInitResources = lambda: None
+    shim.qCleanupResources = lambda: None
+    sys.modules['_icons_rc'] = shim
+
+
+def load_icon_resources() -> str:
+    """
+    아이콘 리소스를 등록합니다. 다른 모듈이 `import _icons_rc` 하기 전에 호출해야 합니다.
+
+    바이너리 .rcc 파일이 있으면 QResource.registerResource 로 등록합니다.
+    Qt 가 파일을 메모리 매핑하므로 아이콘 데이터는 실제로 사용할 때 읽힙니다.
+    .rcc 파일이 없으면 기존 _icons_rc 모듈을 import 합니다. (개발 환경용)
+
+    Returns:
+        str: 사용한 방식 ('rcc' 또는 'module')
+    """
+    global _backend
+    if _backend is not None:
+        return _backend
+
+    for path in _candidate_paths():
+        if not os.path.isfile(path):
+            continue
+        if QResource.registerResource(path):
+            _install_module_shim()
+            _backend = BACKEND_RCC
+            logger.info("아이콘 리소스 등록: %s", path)
+            return _backend
+        logger.warning("아이콘 리소스 등록 실패: %s", path)
+
+    import _icons_rc  # noqa: F401
+    _backend = BACKEND_MODULE
+    logger.info("아이콘 리소스: _icons_rc 모듈 사용")
+    return _backend
+
+
+def get_icon_backend() -> Optional[str]:
+    """load_icon_resources() 에서 선택된 방식 (호출 전이면 None)"""
+    return _backend
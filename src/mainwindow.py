@@ -1,24 +1,44 @@
 # mainwindow.py
 
-from PySide6.QtWidgets import QMainWindow, QApplication
+from PySide6.QtWidgets import QMainWindow, QApplication, QWidget
 from PySide6.QtCore import Qt  # Qt 플래그를 사용하기 위해 추가
 
 from src.ui.mainwindow_ui import Ui_MainWindow  # Designer에서 uic로 생성된 UI 클래스
 from src.home_page import HomePage  # HomePage UI 클래스 import 추가
-from src.jog_page import JogPage  # JogPage UI 클래스 import 추가
-from src.setting_page import SettingPage  # SettingPage UI 클래스 import 추가
-from src.help_page import HelpPage  # HelpPage UI 클래스 import 추가
 
 import _icons_rc  # 수정된 import 경로
 from PySide6.QtGui import QIcon
 from PySide6.QtCore import QSize
 import logging
-from PySide6.QtCore import QThread
 from src.serial_manager import SerialManager
-from PySide6.QtCore import QTimer
+from src.widgets.refresh_scheduler import RefreshScheduler
+from src.widgets.activity_indicator import ActivityIndicator
+from PySide6.QtCore import QTimer, QEvent
+
+
+def _create_jog_page():
+    from src.jog_page import JogPage
+    return JogPage()
+
+
+def _create_setting_page():
+    from src.setting_page import SettingPage
+    return SettingPage()
+
+
+def _create_help_page():
+    from src.help_page import HelpPage
+    return HelpPage()
 
 
 class MainWindow(QMainWindow):
+    # 처음 이동할 때 생성하는 페이지: 스택 인덱스 -> (속성 이름, 생성 함수)
+    LAZY_PAGES = {
+        1: ('jog_page', _create_jog_page),
+        2: ('setting_page', _create_setting_page),
+        3: ('help_page', _create_help_page),
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         # 로거 설정
@@ -36,54 +56,26 @@ class MainWindow(QMainWindow):
         # SerialManager 인스턴스 가져오기
         self.serial_manager = SerialManager.get_instance()
         self.serial_manager.set_main_window(self)  # MainWindow 참조 설정
+        self.serial_manager.start_port_watcher()  # 설정 페이지를 열기 전에 포트 목록을 미리 조회
+        self.serial_manager.start_metrics_server()  # REMOTE_GUI_METRICS_PORT 가 설정된 경우에만
         
-        # 스레드 초기화
-        self.serial_thread = SerialReaderThread()
-        self.serial_thread.start()
+        # 화면 갱신 스케줄러 (최소화 시 일시정지)
+        self.refresh_scheduler = RefreshScheduler.get_instance()
 
         # 마우스 드래그를 위한 변수 초기화
         self._drag_pos = None
 
-        # LED 타이머 초기화
-        self.tx_timer = QTimer(self)
-        self.rx_timer = QTimer(self)
-        self.tx_timer.timeout.connect(self.turn_off_tx)
-        self.rx_timer.timeout.connect(self.turn_off_rx)
-        
-        # LED 스타일시트
-        self.LED_TX_ON_STYLE = """
-            background-color: #ff0000;
-            border: 2px solid black;
-            border-radius: 5px;
-            color: white;
-            min-width: 12px;
-            min-height: 12px;
-            qproperty-alignment: AlignCenter;
-        """
-        
-        self.LED_RX_ON_STYLE = """
-            background-color: #00ff00;
-            border: 2px solid black;
-            border-radius: 5px;
-            color: white;
-            min-width: 12px;
-            min-height: 12px;
-            qproperty-alignment: AlignCenter;
-        """
-        
-        self.LED_OFF_STYLE = """
-            background-color: #808080;
-            border: 2px solid black;
-            border-radius: 5px;
-            color: white;
-            min-width: 12px;
-            min-height: 12px;
-            qproperty-alignment: AlignCenter;
-        """
-        
         # 초기 LED 상태 설정
         self.init_ui()
 
+        # 자동 재연결 진행 상황은 어느 페이지에 있든 보이도록 상태 표시줄에 표시
+        self.serial_manager.reconnecting.connect(self._on_reconnecting)
+        self.serial_manager.reconnected.connect(self._on_reconnected)
+        self.serial_manager.reconnect_failed.connect(self._on_reconnect_failed)
+
+        # 캡처 재생은 페이지가 프로토콜 시그널에 연결된 뒤 시작 (REMOTE_GUI_REPLAY 가 설정된 경우에만)
+        QTimer.singleShot(0, self.serial_manager.start_capture_replay)
+
     def init_ui(self):
         """
         UI 초기화 작업을 수행하는 함수입니다.
@@ -93,17 +85,12 @@ class MainWindow(QMainWindow):
         self.home_page = HomePage()
         self.ui.mainPage.addWidget(self.home_page)
 
-        # JogPage UI 초기화
-        self.jog_page = JogPage()
-        self.ui.mainPage.addWidget(self.jog_page)
-        
-        # SettingPage UI 초기화
-        self.setting_page = SettingPage()
-        self.ui.mainPage.addWidget(self.setting_page)
-        
-        # HelpPage UI 초기화
-        self.help_page = HelpPage()
-        self.ui.mainPage.addWidget(self.help_page)
+        # JogPage, SettingPage, HelpPage 는 빈 자리만 잡아두고 처음 이동할 때 생성 (_ensure_page)
+        self._pending_pages = dict(self.LAZY_PAGES)
+        for index in sorted(self._pending_pages):
+            name, _ = self._pending_pages[index]
+            setattr(self, name, None)
+            self.ui.mainPage.insertWidget(index, QWidget())
         
         # 창 제어 버튼 시그널 연결
         if hasattr(self.ui, 'closeBtn'):
@@ -127,9 +114,17 @@ class MainWindow(QMainWindow):
         self.ui.centralwidget.setAttribute(Qt.WA_TransparentForMouseEvents, False)
         self.ui.headerContainer.setAttribute(Qt.WA_TransparentForMouseEvents, False)
 
-        # LED 초기 스타일 설정
-        self.ui.labelTx.setStyleSheet(self.LED_OFF_STYLE)
-        self.ui.labelRx.setStyleSheet(self.LED_OFF_STYLE)
+        # TX/RX LED: Designer 라벨을 직접 그리는 활동 표시 위젯으로 교체
+        self.tx_indicator = self._replace_with_indicator(self.ui.labelTx, "T", "#ff0000")
+        self.rx_indicator = self._replace_with_indicator(self.ui.labelRx, "R", "#00ff00")
+
+    def _replace_with_indicator(self, label, text, on_color):
+        """라벨 자리에 ActivityIndicator 를 배치하고 라벨은 제거합니다."""
+        indicator = ActivityIndicator(text, on_color, label.parentWidget())
+        indicator.setObjectName(label.objectName())
+        label.parentWidget().layout().replaceWidget(label, indicator)
+        label.deleteLater()
+        return indicator
 
     def toggle_maximize_restore(self):
         if self.isMaximized():
@@ -146,13 +141,28 @@ class MainWindow(QMainWindow):
         스택 위젯의 페이지를 전환하는 메서드
         :param index: 전환할 페이지의 인덱스
         """
+        self._ensure_page(index)
         self.ui.mainPage.setCurrentIndex(index)
 
+    def _ensure_page(self, index):
+        """아직 생성되지 않은 페이지라면 생성해서 빈 자리와 교체합니다."""
+        entry = self._pending_pages.pop(index, None)
+        if entry is None:
+            return
+        name, factory = entry
+        page = factory()
+        placeholder = self.ui.mainPage.widget(index)
+        self.ui.mainPage.insertWidget(index, page)
+        self.ui.mainPage.removeWidget(placeholder)
+        placeholder.deleteLater()
+        setattr(self, name, page)
+        self.logger.debug("페이지 생성: %s", name)
+
     def on_pushButton_clicked(self):
         """
         pushButton 클릭 이벤트 핸들러 예시입니다.
         """
-        print("PushButton이 클릭되었습니다.")
+        self.logger.debug("PushButton이 클릭되었습니다.")
 
     def mousePressEvent(self, event):
         """마우스 클릭 이벤트"""
@@ -174,49 +184,33 @@ class MainWindow(QMainWindow):
         event.accept()
 
     def closeEvent(self, event):
-        """프로그램 종료 시 정리 작업"""
-        self.serial_manager.stop_serial_thread()
+        """프로그램 종료 시 정리 작업 (시리얼 관련 스레드는 SerialManager 가 정지/대기)"""
+        self.serial_manager.shutdown()
         super().closeEvent(event)
 
-    def __del__(self):
-        """소멸자"""
-        try:
-            if hasattr(self, 'serial_thread'):
-                self.serial_thread.stop()
-                self.serial_thread.wait()
-        except Exception as e:
-            self.logger.error(f"객체 삭제 중 에러 발생: {str(e)}")
+    def changeEvent(self, event):
+        """최소화 상태에서는 화면 갱신을 멈춥니다."""
+        if event.type() == QEvent.WindowStateChange:
+            self.refresh_scheduler.set_paused(self.isMinimized())
+        super().changeEvent(event)
 
-    def indicate_tx(self):
-        """TX LED를 켜고 타이머 시작"""
-        self.ui.labelTx.setStyleSheet(self.LED_TX_ON_STYLE)
-        self.tx_timer.start(100)  # 100ms 후 LED 끄기
+    def _on_reconnecting(self, attempt: int, delay: float):
+        """자동 재연결 대기 표시 (다음 시도 후 갱신되지 않으면 사라짐, 예: 사용자가 재연결 취소)"""
+        self.ui.statusbar.showMessage(
+            f"연결이 끊어졌습니다. 재연결 중... ({attempt}/{SerialManager.RECONNECT_MAX_ATTEMPTS})",
+            int((delay + 1.0) * 1000))
 
-    def indicate_rx(self):
-        """RX LED를 켜고 타이머 시작"""
-        self.ui.labelRx.setStyleSheet(self.LED_RX_ON_STYLE)
-        self.rx_timer.start(100)  # 100ms 후 LED 끄기
+    def _on_reconnected(self, port_name: str):
+        self.ui.statusbar.showMessage(f"{port_name} 재연결됨", 3000)
 
-    def turn_off_tx(self):
-        """TX LED 끄기"""
-        self.ui.labelTx.setStyleSheet(self.LED_OFF_STYLE)
-        self.tx_timer.stop()
+    def _on_reconnect_failed(self, port_name: str):
+        self.ui.statusbar.showMessage(f"{port_name} 재연결 실패")
 
-    def turn_off_rx(self):
-        """RX LED 끄기"""
-        self.ui.labelRx.setStyleSheet(self.LED_OFF_STYLE)
-        self.rx_timer.stop()
+    def indicate_tx(self):
+        """TX 활동 표시 (패킷마다 호출해도 LED 갱신은 일정 주기로 제한됨)"""
+        self.tx_indicator.pulse()
 
+    def indicate_rx(self):
+        """RX 활동 표시 (패킷마다 호출해도 LED 갱신은 일정 주기로 제한됨)"""
+        self.rx_indicator.pulse()
 
-class SerialReaderThread(QThread):
-    def __init__(self):
-        super().__init__()
-        self._is_running = True
-        
-    def run(self):
-        while self._is_running:
-            # 시리얼 읽기 작업
-            pass
-            
-    def stop(self):
-        self._is_running = False
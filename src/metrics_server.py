@@ -0,0 +1,235 @@
+import logging
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+from PySide6.QtCore import QObject, QTimer, Slot
+
+from src.widgets.protocol_metrics import ProtocolMetrics
+
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+PREFIX = "remote_gui"
+
+# ProtocolMetrics 카운터 설명 (HELP 문자열)
+_COUNTER_HELP = {
+    'rx_bytes': "Bytes read from the serial port",
+    'rx_frames': "Frames received with a valid CRC",
+    'rx_crc_errors': "Candidate frames rejected by CRC",
+    'rx_discarded_bytes': "Bytes skipped while searching for a frame start",
+    'rx_missing': "Frames missing according to sequence numbers",
+    'rx_out_of_order': "Frames that arrived with an already passed sequence number",
+    'rx_duplicates': "Frames repeating the previous sequence number",
+    'tx_bytes': "Bytes written to the serial port",
+    'tx_frames': "Frames written to the serial port",
+    'tx_write_timeouts': "Serial write timeouts",
+    'tx_retries': "Frames rewritten after a write timeout",
+    'tx_failures': "Frames that could not be written",
+}
+
+
+def _format_value(value) -> str:
+    """정수는 그대로, 실수는 정밀도 손실 없이 표기 (큰 카운터가 지수 표기로 잘리지 않도록)"""
+    if isinstance(value, int):
+        return str(int(value))
+    return repr(float(value))
+
+
+def _ms_to_seconds(value):
+    """ms 값을 Prometheus 기본 단위(초)로 변환 (None 은 그대로)"""
+    return None if value is None else value / 1000.0
+
+
+class _MetricsWriter:
+    """Prometheus text exposition 형식 출력 도우미"""
+
+    def __init__(self):
+        self._lines: List[str] = []
+
+    def metric(self, name: str, kind: str, help_text: str, samples) -> None:
+        """
+        Args:
+            samples: [(labels dict 또는 None, 값), ...] 값이 None 인 샘플은 생략
+        """
+        samples = [(labels, value) for labels, value in samples if value is not None]
+        if not samples:
+            return
+        full_name = f"{PREFIX}_{name}"
+        self._lines.append(f"# HELP {full_name} {help_text}")
+        self._lines.append(f"# TYPE {full_name} {kind}")
+        for labels, value in samples:
+            label_text = ""
+            if labels:
+                label_text = "{" + ",".join(f'{key}="{val}"' for key, val in labels.items()) + "}"
+            self._lines.append(f"{full_name}{label_text} {_format_value(value)}")
+
+    def gauge(self, name: str, help_text: str, value, labels=None) -> None:
+        self.metric(name, 'gauge', help_text, [(labels, value)])
+
+    def text(self) -> bytes:
+        return ("\n".join(self._lines) + "\n").encode('utf-8')
+
+
+def render_metrics(serial_manager) -> bytes:
+    """
+    SerialManager 의 현재 상태를 Prometheus 텍스트로 만듭니다. (GUI 쓰레드에서 호출)
+    송수신 카운터, 링크 품질, 요청 RTT, 마지막 상태 동기화 값, 쓰레드 CPU 시간을 포함합니다.
+    """
+    out = _MetricsWriter()
+    out.gauge('serial_connected', "1 if a serial port is open", int(serial_manager.is_port_connected()))
+
+    metrics = serial_manager.get_protocol_metrics()
+    if metrics is not None:
+        for name in ProtocolMetrics.COUNTERS:
+            out.metric(f"protocol_{name}_total", 'counter', _COUNTER_HELP[name], [(None, metrics[name])])
+        for direction in ('rx', 'tx'):
+            out.metric(f"protocol_{direction}_command_frames_total", 'counter',
+                       f"Frames per command ({direction.upper()})",
+                       [({'cmd': f"0x{cmd:04X}"}, count)
+                        for cmd, count in sorted(metrics[f"{direction}_commands"].items())])
+
+    quality = serial_manager.get_link_quality()
+    if quality is not None:
+        out.gauge('link_score', "Link quality score (0-100)", quality.score)
+        out.metric('link_rtt_seconds', 'gauge', "PING round trip time percentiles", [
+            ({'quantile': '0.5'}, _ms_to_seconds(quality.rtt_p50_ms)),
+            ({'quantile': '0.9'}, _ms_to_seconds(quality.rtt_p90_ms)),
+            ({'quantile': '0.99'}, _ms_to_seconds(quality.rtt_p99_ms)),
+        ])
+        out.gauge('link_jitter_seconds', "PING jitter", _ms_to_seconds(quality.jitter_ms))
+        out.gauge('link_loss_ratio', "Unanswered PING ratio", quality.loss_pct / 100.0)
+
+    rtt = serial_manager.get_rtt_stats()
+    if rtt is not None:
+        link = rtt['link']
+        out.gauge('request_srtt_seconds', "Smoothed request/ACK round trip time", _ms_to_seconds(link['srtt_ms']))
+        out.gauge('request_rto_seconds', "Current request timeout", _ms_to_seconds(link['rto_ms']))
+        out.metric('request_timeouts_total', 'counter', "Requests without an ACK in time",
+                   [(None, rtt['timeouts'])])
+
+    protocol = serial_manager.get_protocol()
+    status = protocol.lastStatus if protocol is not None else None
+    if status is not None:
+        out.gauge('status_main_power', "Main power state reported by the device", int(status.main_power))
+        out.gauge('status_play_state', "Play state (1 once, 2 repeat, 3 pause, 4 stop, 0 unknown)",
+                  status.play_state.value if status.play_state is not None else 0)
+        out.gauge('status_runtime_seconds', "Continuous run time",
+                  status.hours * 3600 + status.minutes * 60 + status.seconds)
+        out.gauge('status_current_count', "Current cycle count", status.current_count)
+        out.gauge('status_total_count', "Total cycle count", status.total_count)
+        out.gauge('status_voltage_volts', "Supply voltage", status.voltage / 100.0)
+        out.gauge('status_current_amperes', "Supply current", status.current / 100.0)
+        out.gauge('status_motion_position_seconds', "Current motion time", status.motion_current / 1000.0)
+        out.gauge('status_motion_length_seconds', "Motion end time", status.motion_end / 1000.0)
+
+    cpu_times = serial_manager.get_thread_cpu_times()
+    out.metric('thread_cpu_seconds_total', 'counter', "CPU time used by serial threads",
+               [({'thread': name}, seconds) for name, seconds in sorted(cpu_times.items())])
+    out.metric('process_cpu_seconds_total', 'counter', "CPU time used by the process",
+               [(None, time.process_time())])
+    out.gauge('metrics_snapshot_timestamp_seconds', "Unix time the values were collected", time.time())
+    return out.text()
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    """캐시된 텍스트만 돌려주는 요청 처리기 (시리얼/GUI 쓰레드에 접근하지 않음)"""
+
+    def do_GET(self):
+        if self.path.split('?', 1)[0] not in ('/metrics', '/'):
+            self.send_error(404)
+            return
+        body = self.server.body
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+class MetricsServer(QObject):
+    """
+    Prometheus 형식 메트릭을 제공하는 로컬 HTTP 서버.
+    GUI 쓰레드의 타이머가 interval 마다 render_metrics() 결과를 캐시하고,
+    HTTP 쓰레드는 캐시된 bytes 만 응답하므로 scrape 가 시리얼 경로나 GUI 를 기다리게 하지 않습니다.
+
+    환경 변수 REMOTE_GUI_METRICS_PORT 로 포트를 지정하면 MainWindow 시작 시 함께 시작됩니다.
+    """
+    ENV_PORT = 'REMOTE_GUI_METRICS_PORT'
+    DEFAULT_HOST = '127.0.0.1'
+    DEFAULT_INTERVAL_MS = 1000
+
+    def __init__(self, serial_manager, parent=None, interval_ms: int = DEFAULT_INTERVAL_MS):
+        super().__init__(parent)
+        self.serial_manager = serial_manager
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.refresh)
+
+    def start(self, port: int, host: str = DEFAULT_HOST) -> int:
+        """
+        서버를 시작합니다. port 가 0 이면 빈 포트를 사용합니다.
+        Returns:
+            int: 실제로 열린 포트
+        Raises:
+            OSError: 포트를 열 수 없는 경우
+        """
+        self.stop()
+        server = ThreadingHTTPServer((host, port), _MetricsRequestHandler)
+        server.daemon_threads = True
+        server.body = b""
+        self._server = server
+        self.refresh()
+        self._thread = threading.Thread(target=server.serve_forever, name="MetricsServer", daemon=True)
+        self._thread.start()
+        self._timer.start()
+        logger.info("메트릭 서버 시작: http://%s:%d/metrics", host, self.port())
+        return self.port()
+
+    def stop(self) -> None:
+        """서버를 중지합니다."""
+        self._timer.stop()
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def is_running(self) -> bool:
+        return self._server is not None
+
+    def port(self) -> Optional[int]:
+        """열린 포트 (실행 중이 아니면 None)"""
+        return self._server.server_address[1] if self._server is not None else None
+
+    @Slot()
+    def refresh(self) -> None:
+        """캐시된 메트릭 텍스트를 갱신합니다. (GUI 쓰레드)"""
+        if self._server is None:
+            return
+        try:
+            self._server.body = render_metrics(self.serial_manager)
+        except Exception as e:
+            logger.warning("메트릭 수집 실패: %s", e)
+
+    @classmethod
+    def port_from_environment(cls) -> Optional[int]:
+        """REMOTE_GUI_METRICS_PORT 값 (없거나 잘못된 값이면 None)"""
+        value = os.environ.get(cls.ENV_PORT, '').strip()
+        if not value:
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            logger.warning("%s 값이 올바르지 않습니다: %s", cls.ENV_PORT, value)
+            return None
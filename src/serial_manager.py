@@ -1,20 +1,33 @@
-from PySide6.QtCore import QObject, Signal, Slot
-from serial.tools import list_ports
+from PySide6.QtCore import QObject, QTimer, Signal, Slot, Qt
 import serial
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 from src.widgets.serial_protocol import ComProtocol
 from src.widgets.serial_reader import SerialReaderThread
+from src.widgets.serial_writer import TxPriority, classify_priority
+from src.widgets.serial_threads import SerialIoThreads
+from src.widgets.port_watcher import PortWatcher, scan_ports
+from src.widgets.link_monitor import LinkMonitor, LinkQuality
+from src.widgets.packet_tracer import PacketTracer
+from src.metrics_server import MetricsServer
+from src.widgets.packet_capture import CaptureWriter
+from src.widgets.capture_replay import CaptureReplayThread, create_replay_protocol, SOURCE_AUTO
+from collections import deque
+from concurrent.futures import CancelledError, Future
 import threading
-import re  # 파일 상단에 추가
-from threading import Lock  # 파일 상단에 추가
-import time  # 파일 상단에 추가
 
 class SerialManager(QObject):
     """시리얼 통신 관리자 클래스"""
     # 시그널 정의
-    data_received = Signal(bytes)  # 데이터 수신 시
+    data_received = Signal(bytes)  # 원시 수신 바이트 (set_raw_tap_enabled(True) 인 경우에만)
     connection_changed = Signal(bool)  # 연결 상태 변경 시
     error_occurred = Signal(str)  # 에러 발생 시
+    ports_changed = Signal(list)  # 포트 목록 변경 시 [(장치, 설명), ...]
+    reconnecting = Signal(int, float)  # 자동 재연결 대기 시 (시도 번호, 대기 시간 초)
+    reconnected = Signal(str)  # 자동 재연결 성공 시 (포트 이름)
+    reconnect_failed = Signal(str)  # 재연결 시도 횟수를 모두 실패해 포기한 경우 (포트 이름)
+    link_quality_updated = Signal(object)  # 링크 품질 측정 결과 (LinkQuality)
+    capture_replay_finished = Signal(object)  # 캡처 재생 종료 시 (ReplayResult, 실패 시 예외)
+    _request_done = Signal(object, object)  # (callback, Future) 응답 콜백을 GUI 스레드에서 호출하기 위한 내부 시그널
     
     _instance = None
     _lock = threading.Lock()
@@ -22,6 +35,13 @@ class SerialManager(QObject):
     # 클래스 상수 정의
     DEFAULT_HOST_ID = 0x0000
     DEFAULT_DEVICE_ID = 0x0001
+
+    # 자동 재연결
+    RECONNECT_INITIAL_DELAY = 0.25  # 첫 재시도 대기 시간 (초), 실패할 때마다 2배
+    RECONNECT_MAX_DELAY = 8.0       # 최대 재시도 대기 시간 (초)
+    RECONNECT_WATCH_INTERVAL = 0.2  # 재연결 대기 중 포트 감시 주기 (초)
+    RECONNECT_MAX_ATTEMPTS = 10     # 이 횟수만큼 실패하면 재연결을 포기하고 연결 끊김을 알림 (약 50초)
+    REPLAY_QUEUE_LIMIT = 32         # 재연결 후 재전송할 제어 명령 최대 개수 (초과 시 오래된 것부터 취소)
     
     @classmethod
     def get_instance(cls) -> 'SerialManager':
@@ -38,49 +58,123 @@ class SerialManager(QObject):
         super().__init__()
         self.serial_port = None
         self.protocol = None
-        self.reader_thread = None
+        self.io_threads = SerialIoThreads()  # 포트당 수신/송신 스레드 한 쌍
         self.is_connected = False
         self._baud_rate = 115200
         self.main_window = None  # MainWindow 참조를 저장할 속성 추가
         self._error_dialog_shown = False  # 에러 다이얼로그 표시 상태 추적
-        self._send_lock = Lock()  # 전송 뮤텍스 추가
         self._write_timeout = 1.0  # 제어 명령용 타임아웃 1초
         self._max_retries = 3  # 제어 명령 최대 재시도 횟수
-        self._retry_delay = 0.15  # 재시도 간격 (150ms)
+        self._retry_delay = 0.15  # 재시도 간격 (150ms, 송신 스레드에서 대기)
+        self._raw_tap_enabled = False  # 원시 수신 바이트 전달 여부
+
+        # 주기적 상태 동기화 설정 (재연결 시 새 수신 스레드에 그대로 적용)
+        self._sync_enabled = False
+        self._sync_interval = 1000
+
+        # 자동 재연결 상태
+        self._auto_reconnect = False  # 꺼져 있으면 연결이 끊겼을 때 바로 에러를 알림
+        self._replay_on_reconnect = False  # 연결이 끊긴 동안 보낸 제어 명령을 재연결 후 전송할지 여부
+        self._last_port = None  # 마지막으로 연결에 성공한 포트
+        self._reconnect_port = None  # 재연결 대기 중인 포트 (None 이면 대기 중 아님)
+        self._reconnect_attempt = 0
+        self._reconnect_timer = QTimer(self)
+        self._reconnect_timer.setSingleShot(True)
+        self._reconnect_timer.timeout.connect(self._try_reconnect)
+        self._replay_queue = deque()  # (receiverId, senderId, cmd, data, priority, request, timeout, future)
+
+        # 포트 목록 감시 (start_port_watcher() 로 시작)
+        self.port_watcher = PortWatcher(self)
+        self.port_watcher.ports_changed.connect(self.ports_changed)
+        self.port_watcher.ports_added.connect(self._on_ports_added)
+
+        self._request_done.connect(self._on_request_done)
+
+        # PING 기반 링크 품질 측정 (set_link_monitor_enabled() 로 시작)
+        self.link_monitor = LinkMonitor(self, self)
+        self.link_monitor.quality_updated.connect(self.link_quality_updated)
+
+        # 수신 패킷 지연 추적 (GUI 스레드에서 생성해야 GUI 단계가 기록됨)
+        self.packet_tracer = PacketTracer.get_instance()
+
+        # Prometheus 형식 메트릭 HTTP 서버 (start_metrics_server() 로 시작)
+        self.metrics_server = MetricsServer(self, self)
+
+        # 패킷 캡처 (start_capture() 로 시작, 재연결 후에도 계속 기록)
+        self._capture: Optional[CaptureWriter] = None
+        self._capture_raw = False
+        self._capture_protocol = None  # data_sent 가 연결된 ComProtocol
+        self._capture_tx_connection = None
+        self._capture_raw_connection = None
+
+        # 캡처 재생 (start_capture_replay() 로 시작, 재생 중에는 포트 대신 재생 쓰레드가 protocol 에 수신 데이터를 넣음)
+        self._capture_replay: Optional[CaptureReplayThread] = None
         
+    @property
+    def reader_thread(self) -> Optional[SerialReaderThread]:
+        """현재 포트의 수신 스레드"""
+        return self.io_threads.reader
+
+    @property
+    def writer_thread(self):
+        """현재 포트의 송신 전담 스레드"""
+        return self.io_threads.writer
+
     def set_main_window(self, window):
         """MainWindow 인스턴스 참조를 설정합니다."""
         self.main_window = window
     
     def get_available_ports(self) -> List[Tuple[str, str]]:
-        """사용 가능한 시리얼 포트 목록을 반환합니다."""
-        def extract_port_number(port: str) -> int:
-            """포트 이름에서 숫자를 추출합니다."""
-            match = re.search(r'\d+', port)
-            return int(match.group()) if match else float('inf')
-        
-        def clean_description(description: str) -> str:
-            """포트 설명에서 (COMx) 패턴을 제거합니다."""
-            return re.sub(r'\s*\(COM\d+\)', '', description).strip()
-        
-        ports = list(list_ports.comports())
-        port_list = [(port.device, clean_description(port.description)) for port in ports]
-        # COM 번호를 기준으로 정렬
-        return sorted(port_list, key=lambda x: extract_port_number(x[0]))
+        """
+        사용 가능한 시리얼 포트 목록을 반환합니다.
+        포트 감시 쓰레드가 실행 중이면 캐시된 목록을 바로 반환하고, 아니면 직접 조회합니다.
+        """
+        if self.port_watcher.isRunning():
+            return self.port_watcher.get_ports()
+        return scan_ports()
+
+    def start_port_watcher(self) -> None:
+        """백그라운드 포트 감시를 시작합니다. 변경 시 ports_changed 시그널이 발생합니다."""
+        if not self.port_watcher.isRunning():
+            self.port_watcher.start()
+
+    def stop_port_watcher(self) -> None:
+        """백그라운드 포트 감시를 중지합니다."""
+        if self.port_watcher.isRunning():
+            self.port_watcher.stop()
+
+    def refresh_ports(self) -> None:
+        """포트 목록을 즉시 다시 조회하도록 요청합니다. 결과는 ports_changed 로 전달됩니다."""
+        if self.port_watcher.isRunning():
+            self.port_watcher.refresh()
+        else:
+            self.ports_changed.emit(scan_ports())
     
     @Slot()
     def connect_to_port(self, port_name: str) -> bool:
         """지정된 포트에 연결"""
         if self.is_connected:
             self.disconnect_port()
+        self._cancel_reconnect()
             
         try:
-            self.serial_port = serial.Serial(
-                port_name, 
-                self._baud_rate, 
-                timeout=1,
-                write_timeout=self._write_timeout  # 쓰기 타임아웃 설정
-            )
+            self._open_port(port_name)
+        except Exception as e:
+            self.error_occurred.emit(f"연결 실패: {str(e)}")
+            return False
+
+        self.connection_changed.emit(True)
+        return True
+
+    def _open_port(self, port_name: str) -> None:
+        """포트를 열고 송신/수신 스레드를 시작합니다. 실패 시 예외를 그대로 전달합니다."""
+        self.serial_port = serial.Serial(
+            port_name, 
+            self._baud_rate, 
+            timeout=1,
+            write_timeout=self._write_timeout  # 쓰기 타임아웃 설정
+        )
+        try:
             self.protocol = ComProtocol(self.serial_port, None)
             self.protocol.data_sent.connect(self._handle_data_sent)
             
@@ -89,164 +183,535 @@ class SerialManager(QObject):
             # 연결 끊김 시그널 연결
             if self.reader_thread:
                 self.reader_thread.connection_lost.connect(self._handle_connection_lost)
-            
-            self.is_connected = True
-            self._error_dialog_shown = False  # 에러 다이얼로그 상태 초기화
-            self.connection_changed.emit(True)
-            return True
-            
-        except Exception as e:
-            self.error_occurred.emit(f"연결 실패: {str(e)}")
-            return False
+        except Exception:
+            self._close_port(notify=False)
+            raise
+        
+        self.is_connected = True
+        self._last_port = port_name
+        self._error_dialog_shown = False  # 에러 다이얼로그 상태 초기화
     
     def disconnect_port(self) -> None:
-        """현재 연결된 포트를 해제합니다."""
+        """
+        현재 연결된 포트를 해제합니다. (사용자 요청)
+        자동 재연결 대기와 재전송 대기 명령을 취소하고, 주기적 동기화 설정을 끕니다.
+        """
+        self._cancel_reconnect()
+        self._sync_enabled = False
+        self._close_port()
+
+    def _close_port(self, notify: bool = True) -> None:
+        """스레드를 정지하고 포트를 닫습니다. 자동 재연결/동기화 설정은 유지합니다."""
+        was_connected = self.is_connected
         try:
+            self._stop_capture_replay_thread()
             self.stop_serial_thread()
+            if self.protocol:
+                self.protocol.requests.cancel_all()
             if self.serial_port and self.serial_port.is_open:
                 self.serial_port.close()
             self.serial_port = None
             self.protocol = None
             self.is_connected = False
-            self.connection_changed.emit(False)
+            if notify and was_connected:
+                self.connection_changed.emit(False)
         except Exception as e:
             self.error_occurred.emit(f"연결 해제 실패: {str(e)}")
+
+    # ------------------------------------------------------------------
+    # 주기적 상태 동기화 설정
+
+    def set_sync_enabled(self, enabled: bool) -> None:
+        """주기적 sync 패킷 전송을 켜거나 끕니다. 설정은 재연결 후에도 유지됩니다."""
+        self._sync_enabled = enabled
+        if self.reader_thread:
+            self.reader_thread.set_sync_enabled(enabled)
+
+    def set_sync_interval(self, interval_ms: int) -> None:
+        """주기적 sync 패킷 전송 주기(ms)를 설정합니다. 설정은 재연결 후에도 유지됩니다."""
+        self._sync_interval = interval_ms
+        if self.reader_thread:
+            self.reader_thread.set_sync_interval(interval_ms)
+
+    def is_sync_enabled(self) -> bool:
+        """주기적 sync 패킷 전송 설정 상태"""
+        return self._sync_enabled
+
+    def get_sync_interval(self) -> int:
+        """주기적 sync 패킷 전송 주기 (ms)"""
+        return self._sync_interval
+
+    # ------------------------------------------------------------------
+    # 자동 재연결
+
+    def set_auto_reconnect(self, enabled: bool, replay_commands: Optional[bool] = None) -> None:
+        """
+        연결이 끊겼을 때 마지막 포트로 자동 재연결할지 설정합니다.
+        Args:
+            replay_commands (bool, optional): 재연결 대기 중 보낸 제어 명령을 재연결 후 전송할지 여부
+        """
+        self._auto_reconnect = enabled
+        if replay_commands is not None:
+            self._replay_on_reconnect = replay_commands
+            if not replay_commands:
+                self._cancel_replay_queue()
+        if not enabled:
+            self._cancel_reconnect()
+
+    def is_auto_reconnect_enabled(self) -> bool:
+        """자동 재연결 설정 상태"""
+        return self._auto_reconnect
+
+    def is_replay_on_reconnect_enabled(self) -> bool:
+        """재연결 후 제어 명령 재전송 설정 상태"""
+        return self._replay_on_reconnect
+
+    def is_reconnecting(self) -> bool:
+        """자동 재연결 대기 중인지 여부"""
+        return self._reconnect_port is not None
+
+    def _start_reconnect(self, port_name: str) -> None:
+        """port_name 으로 자동 재연결을 시작합니다."""
+        self._reconnect_port = port_name
+        self._reconnect_attempt = 0
+        # 포트가 다시 나타나는 즉시 재연결되도록 감시 주기를 줄임
+        self.port_watcher.interval = self.RECONNECT_WATCH_INTERVAL
+        self.port_watcher.refresh()
+        self._schedule_reconnect()
+
+    def _schedule_reconnect(self) -> None:
+        """다음 재연결 시도를 지수 백오프로 예약합니다."""
+        delay = min(self.RECONNECT_MAX_DELAY,
+                    self.RECONNECT_INITIAL_DELAY * (2 ** self._reconnect_attempt))
+        self.reconnecting.emit(self._reconnect_attempt + 1, delay)
+        self._reconnect_timer.start(int(delay * 1000))
+
+    def _cancel_reconnect(self) -> None:
+        """자동 재연결 대기를 취소합니다."""
+        self._reconnect_timer.stop()
+        if self._reconnect_port is not None:
+            self._reconnect_port = None
+            self.port_watcher.interval = PortWatcher.DEFAULT_INTERVAL
+        self._cancel_replay_queue()
+
+    @Slot()
+    def _try_reconnect(self) -> None:
+        """재연결을 시도합니다. 실패하면 다음 시도를 예약합니다."""
+        port_name = self._reconnect_port
+        if port_name is None or self.is_connected:
+            return
+        self._reconnect_timer.stop()
+        self._reconnect_attempt += 1
+        try:
+            self._open_port(port_name)
+        except Exception:
+            if self._reconnect_attempt >= self.RECONNECT_MAX_ATTEMPTS:
+                self._give_up_reconnect(port_name)
+            else:
+                self._schedule_reconnect()
+            return
+        self._on_reconnected(port_name)
+
+    def _give_up_reconnect(self, port_name: str) -> None:
+        """재연결을 포기하고 자동 재연결이 꺼져 있을 때처럼 연결 끊김을 알립니다."""
+        attempts = self._reconnect_attempt
+        self._cancel_reconnect()
+        self.reconnect_failed.emit(port_name)
+        self.error_occurred.emit(f"시리얼 포트 연결이 끊어졌습니다. ({port_name} 자동 재연결 {attempts}회 실패)")
+
+    @Slot(list)
+    def _on_ports_added(self, devices: list) -> None:
+        """재연결 대기 중인 포트가 다시 나타나면 백오프를 기다리지 않고 바로 재연결합니다."""
+        if self._reconnect_port is not None and self._reconnect_port in devices:
+            self._try_reconnect()
+
+    def _on_reconnected(self, port_name: str) -> None:
+        """재연결 성공 후 세션을 복원합니다."""
+        self._reconnect_port = None
+        self.port_watcher.interval = PortWatcher.DEFAULT_INTERVAL
+        self.connection_changed.emit(True)
+
+        # 세션 동기화 재실행 (주기적 sync 설정은 start_serial_thread 에서 이미 복원됨)
+        if self.protocol:
+            self.protocol.start_sync_session()
+        self._replay_pending_commands()
+        self.reconnected.emit(port_name)
+
+    def _queue_for_replay(self, receiverId, senderId, cmd, data, priority,
+                          request: bool = False, timeout: Optional[float] = None) -> Optional[Future]:
+        """
+        재연결 대기 중이면 제어 명령을 보관했다가 재연결 후 전송합니다. (설정한 경우)
+        Args:
+            request (bool): 응답을 기다리는 요청인지 여부 (재연결 후 send_request 로 전송, timeout 은 응답 제한 시간)
+        Returns:
+            Optional[Future]: 재연결 후 전송 결과(요청이면 응답)로 완료되는 핸들, 보관하지 않으면 None
+        """
+        if self._reconnect_port is None or not self._replay_on_reconnect:
+            return None
+        if priority is None:
+            priority = classify_priority(cmd, data)
+        if priority > TxPriority.CONTROL:
+            return None
+        future = Future()
+        if len(self._replay_queue) >= self.REPLAY_QUEUE_LIMIT:
+            self._replay_queue.popleft()[-1].cancel()
+        self._replay_queue.append((receiverId, senderId, cmd, bytes(data), priority, request, timeout, future))
+        return future
+
+    def _replay_pending_commands(self) -> None:
+        """보관한 제어 명령을 순서대로 전송 예약합니다. 결과(요청이면 응답)는 원래 Future 로 전달됩니다."""
+        while self._replay_queue:
+            receiverId, senderId, cmd, data, priority, request, timeout, future = self._replay_queue.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            if request:
+                # 응답 대기는 새 연결의 프로토콜(요청 테이블)에 등록
+                sent = self.send_request(receiverId, senderId, cmd, data, timeout=timeout, priority=priority)
+            else:
+                sent = self.submit_packet(receiverId, senderId, cmd, data, priority=priority)
+            if sent is None:
+                future.set_exception(serial.SerialException("포트가 연결되지 않았습니다"))
+                continue
+            sent.add_done_callback(lambda src, dst=future: _copy_future_result(src, dst))
+
+    def _cancel_replay_queue(self) -> None:
+        """재전송 대기 중인 명령을 모두 취소합니다."""
+        while self._replay_queue:
+            self._replay_queue.popleft()[-1].cancel()
     
     def send_packet(self, receiverId: int, senderId: int, cmd: int, data: bytes) -> bool:
-        """시리얼 포트로 패킷을 전송합니다."""
-        if not self.is_port_connected() or not self.protocol:
-            return False
+        """
+        시리얼 포트로 패킷 전송을 예약합니다. 쓰기는 송신 쓰레드에서 이루어지므로 블로킹되지 않습니다.
+        전송 실패(재시도 초과 등)는 error_occurred 시그널로 통지됩니다.
         
-        # SYNC 패킷은 실패해도 재시도하지 않음
-        if cmd == ComProtocol.CMD_STATUS_SYNC:
-            try:
-                with self._send_lock:
-                    self.protocol.sendData(receiverId, senderId, cmd, data)
-                    return True
-            except:
-                return False
+        Returns:
+            bool: 전송 예약 성공 여부
+        """
+        return self.submit_packet(receiverId, senderId, cmd, data) is not None
+
+    def submit_packet(self, receiverId: int, senderId: int, cmd: int, data: bytes,
+                      priority: Optional[TxPriority] = None) -> Optional[Future]:
+        """
+        패킷 전송을 예약하고 완료 핸들을 반환합니다.
+        정지/전원 차단 명령은 자동으로 최우선 순위가 되어 대기 중인 다른 패킷보다 먼저 전송됩니다.
         
-        # 제어 명령은 재시도 로직 적용
-        retries = 0
-        while retries < self._max_retries:
-            try:
-                with self._send_lock:
-                    self.protocol.sendData(receiverId, senderId, cmd, data)
-                    return True
-                    
-            except serial.SerialTimeoutException:
-                print(f"제어 명령 전송 타임아웃 (재시도 {retries + 1}/{self._max_retries})")
-                retries += 1
-                if retries < self._max_retries:
-                    time.sleep(self._retry_delay)
-                continue
-                
-            except Exception as e:
-                print(f"제어 명령 전송 실패: {str(e)}")
-                return False
-                
-        return False  # 모든 재시도 실패
-    
-    def start_serial_thread(self) -> None:
-        """시리얼 데이터 수신 스레드를 시작합니다."""
-        if self.serial_port and self.serial_port.is_open:
-            self.reader_thread = SerialReaderThread(self.serial_port, self)  # self를 parent로 전달
-            self.reader_thread.data_received.connect(self._handle_received_data)
-            self.reader_thread.error_occurred.connect(self.error_occurred.emit)  # 에러 시그널 연결
-            self.reader_thread.start()
-    
-    def stop_serial_thread(self) -> None:
-        """시리얼 데이터 수신 스레드를 중지합니다."""
-        if self.reader_thread:
-            self.reader_thread.stop()
-            self.reader_thread = None
+        Args:
+            priority (TxPriority, optional): 송신 우선순위. 기본값은 명령어에 따라 자동 결정
+        Returns:
+            Optional[Future]: 전송 완료 핸들 (연결되지 않은 경우 None)
+        """
+        if not self.is_port_connected() or not self.protocol or not self.writer_thread:
+            # 재연결 대기 중이면 제어 명령을 보관했다가 재연결 후 전송 (설정한 경우)
+            return self._queue_for_replay(receiverId, senderId, cmd, data, priority)
+
+        # SYNC 패킷은 실패해도 재시도하지 않음, 제어 명령은 재시도 로직 적용
+        retries = 1 if cmd == ComProtocol.CMD_STATUS_SYNC else self._max_retries
+        return self.writer_thread.submit(receiverId, senderId, cmd, data, retries=retries, priority=priority)
     
-    @Slot(bytes)
-    def _handle_received_data(self, data: bytes) -> None:
-        """수신된 데이터를 처리합니다."""
+    def send_request(self, receiverId: int, senderId: int, cmd: int, data: bytes,
+                     callback=None, timeout: Optional[float] = None,
+                     priority: Optional[TxPriority] = None) -> Optional[Future]:
+        """
+        요청 패킷을 보내고 장치의 응답(cmd | CMD_ACK_BIT)을 기다리는 핸들을 반환합니다.
+        응답 제한 시간은 측정된 왕복 시간(RTT)으로 정해지며, 응답이 오면 바로 완료됩니다.
+        
+        Args:
+            callback (callable, optional): callback(future) - 완료/타임아웃/취소 시 GUI 스레드에서 호출
+            timeout (float, optional): 응답 제한 시간(초). 기본값은 RTT 기반 RTO
+            priority (TxPriority, optional): 송신 우선순위
+        Returns:
+            Optional[Future]: 응답 PacketEvent 로 완료되는 핸들, 타임아웃 시 RequestTimeoutError
+                              (연결되지 않은 경우 None, 재연결 대기 중 보관한 제어 명령은 재연결 후 응답으로 완료)
+        """
+        if not self.is_port_connected() or not self.protocol or not self.writer_thread:
+            future = self._queue_for_replay(receiverId, senderId, cmd, data, priority,
+                                            request=True, timeout=timeout)
+        else:
+            requests = self.protocol.requests
+            pending = requests.register(cmd, timeout)
+            future = requests.attach(pending, self.submit_packet(receiverId, senderId, cmd, data,
+                                                                 priority=priority))
+        if future is None:
+            return None
+        if callback is not None:
+            future.add_done_callback(lambda f: self._request_done.emit(callback, f))
+        return future
+
+    @Slot(object, object)
+    def _on_request_done(self, callback, future) -> None:
+        """요청 완료 콜백 (GUI 스레드)"""
+        callback(future)
+
+    def get_rtt_stats(self) -> Optional[dict]:
+        """현재 연결의 요청/응답 왕복 시간 추정값 (연결되지 않은 경우 None)"""
+        if not self.protocol:
+            return None
+        return self.protocol.requests.get_rtt_stats()
+
+    def get_protocol_metrics(self) -> Optional[dict]:
+        """현재 연결의 송수신 카운터 snapshot (ProtocolMetrics.snapshot 참고, 연결되지 않은 경우 None)"""
+        if not self.protocol:
+            return None
+        return self.protocol.get_metrics()
+
+    def reset_protocol_metrics(self) -> None:
+        """현재 연결의 송수신 카운터를 초기화합니다."""
         if self.protocol:
-            self.protocol.receiveData(data)
-            self.protocol.processReceivedData()
-        self.data_received.emit(data)
-        # RX LED 표시
-        if self.main_window:
-            self.main_window.indicate_rx()
-    
-    def get_protocol(self) -> Optional[ComProtocol]:
-        """현재 ComProtocol 인스턴스를 반환합니다."""
-        return self.protocol
-    
-    def is_port_connected(self) -> bool:
-        """현재 포트 연결 상태를 반환합니다."""
-        return self.is_connected
-    
-    def get_current_port(self) -> Optional[str]:
-        """현재 연결된 포트 이름을 반환합니다."""
-        if self.serial_port and self.serial_port.is_open:
-            return self.serial_port.port
-        return None
+            self.protocol.metrics.reset()
 
-    @Slot(bytes)
-    def _handle_data_sent(self, data: bytes) -> None:
-        """ComProtocol에서 데이터가 전송되었을 때 호출되는 핸들러"""
-        # TX LED 표시
-        if self.main_window:
-            self.main_window.indicate_tx() 
+    def set_link_monitor_enabled(self, enabled: bool, interval: Optional[float] = None) -> None:
+        """
+        PING 기반 링크 품질 측정을 켜거나 끕니다. 연결된 동안에만 ping 을 보냅니다.
+        Args:
+            interval (float, optional): ping 주기 (초)
+        """
+        if interval is not None:
+            self.link_monitor.set_interval(interval)
+        if enabled and not self.link_monitor.isRunning():
+            self.link_monitor.start()
+        elif not enabled and self.link_monitor.isRunning():
+            self.link_monitor.stop()
 
-    def send_sync_packet(self, receiverId: int = None, senderId: int = None) -> bool:
+    def is_link_monitor_enabled(self) -> bool:
+        """링크 품질 측정 실행 여부"""
+        return self.link_monitor.isRunning()
+
+    def get_link_quality(self) -> Optional[LinkQuality]:
+        """마지막 링크 품질 측정 결과 (점수, RTT 백분위, 지터, 손실률, 누락/CRC 오류). 측정 전이면 None"""
+        return self.link_monitor.get_quality()
+
+    def set_packet_trace_enabled(self, enabled: bool, capacity: Optional[int] = None) -> None:
         """
-        상태 동기화를 위한 sync 패킷을 전송합니다.
-        
+        수신 패킷 지연 추적(read -> 프레임 -> CRC -> 핸들러 -> GUI 갱신)을 켜거나 끕니다.
         Args:
-            receiverId (int, optional): 수신자 ID. 
-                                      기본값은 DEFAULT_DEVICE_ID (0x0001)
-            senderId (int, optional): 송신자 ID. 
-                                    기본값은 DEFAULT_HOST_ID (0x0000)
-            
+            capacity (int, optional): 보관할 최근 프레임 수
+        """
+        self.packet_tracer.set_enabled(enabled, capacity)
+
+    def get_packet_trace_summary(self) -> Dict[str, dict]:
+        """구간별 수신 지연 통계 (µs). PacketTracer.summary() 참고"""
+        return self.packet_tracer.summary()
+
+    def export_packet_trace(self, path: str) -> int:
+        """수신 패킷 추적 기록을 Chrome trace-event JSON 으로 저장합니다. 저장한 프레임 수를 반환합니다."""
+        return self.packet_tracer.export_chrome_trace(path)
+
+    def start_metrics_server(self, port: Optional[int] = None, host: str = MetricsServer.DEFAULT_HOST) -> Optional[int]:
+        """
+        로컬 메트릭 HTTP 서버(/metrics)를 시작합니다.
+        Args:
+            port (int, optional): 포트 번호 (0 이면 빈 포트). 없으면 REMOTE_GUI_METRICS_PORT 환경 변수 값을 사용
         Returns:
-            bool: 전송 성공 여부
+            Optional[int]: 열린 포트. 포트가 지정되지 않았거나 열 수 없으면 None
         """
-        if not self.is_port_connected() or not self.protocol:
-            self.error_occurred.emit("포트가 연결되지 않았습니다")
-            return False
-            
+        if port is None:
+            port = MetricsServer.port_from_environment()
+            if port is None:
+                return None
         try:
-            # 기본값 설정
-            if receiverId is None:
-                receiverId = self.DEFAULT_DEVICE_ID
-            if senderId is None:
-                senderId = self.DEFAULT_HOST_ID
-                
-            # ComProtocol의 sync 패킷 전송 메서드 호출
-            self.protocol.send_sync_packet(receiverId, senderId)
-            return True
-            
-        except Exception as e:
-            error_msg = f"Sync 패킷 전송 실패: {str(e)}"
-            self.error_occurred.emit(error_msg)
-            return False 
+            return self.metrics_server.start(port, host)
+        except OSError as e:
+            self.error_occurred.emit(f"메트릭 서버를 시작할 수 없습니다 ({host}:{port}): {e}")
+            return None
 
-    def get_reader_thread(self) -> Optional['SerialReaderThread']:
-        """현재 실행 중인 SerialReaderThread 인스턴스를 반환합니다."""
-        # 단순히 reader_thread 반환 (연결 상태와 관계없이)
-        return self.reader_thread
+    def stop_metrics_server(self) -> None:
+        """메트릭 HTTP 서버를 중지합니다."""
+        self.metrics_server.stop()
 
-    def _handle_connection_lost(self):
-        """연결 끊김 처리"""
-        if not self._error_dialog_shown:
-            self.error_occurred.emit("시리얼 포트 연결이 끊어졌습니다.")
-            self._error_dialog_shown = False
-            self.disconnect_port()
+    def start_capture(self, path: str, raw_chunks: bool = False) -> None:
+        """
+        송수신 프레임을 캡처 파일에 기록하기 시작합니다. 이미 기록 중이면 이전 파일을 닫습니다.
+        Args:
+            path (str): 캡처 파일 경로
+            raw_chunks (bool): 수신 원시 바이트(프레임 분리 전)도 함께 기록
+        Raises:
+            OSError: 파일을 만들 수 없는 경우
+        """
+        self.stop_capture()
+        self._capture = CaptureWriter(path, raw_chunks)
+        self._capture_raw = raw_chunks
+        self._attach_capture()
+
+    def stop_capture(self) -> Optional[dict]:
+        """캡처를 중지하고 파일을 닫습니다. 기록 통계를 반환합니다. (CaptureWriter.stats 참고)"""
+        capture = self._capture
+        if capture is None:
+            return None
+        self._detach_capture()
+        self._capture = None
+        capture.close()
+        return capture.stats()
+
+    def is_capturing(self) -> bool:
+        return self._capture is not None
+
+    def get_capture_stats(self) -> Optional[dict]:
+        """기록 중인 캡처의 레코드 수, 크기, 버린 레코드 수 (기록 중이 아니면 None)"""
+        return self._capture.stats() if self._capture is not None else None
+
+    def _attach_capture(self) -> None:
+        """현재 프로토콜/수신 스레드에 캡처 기록기를 연결합니다. (연결, 재연결 시)"""
+        capture = self._capture
+        if capture is None or not self.protocol:
+            return
+        if self._capture_protocol is not self.protocol:
+            self._detach_capture()
+            # 송신 스레드에서 바로 기록 (GUI 스레드를 거치지 않음)
+            self._capture_tx_connection = self.protocol.data_sent.connect(
+                capture.on_tx_frame, Qt.DirectConnection)
+            self.protocol.rxFrameTap = capture.on_rx_frame
+            self._capture_protocol = self.protocol
+        reader = self.reader_thread
+        if self._capture_raw and reader:
+            if self._capture_raw_connection is not None:
+                QObject.disconnect(self._capture_raw_connection)  # 이전 수신 스레드
+            self._capture_raw_connection = reader.data_received.connect(
+                capture.on_rx_chunk, Qt.DirectConnection)
+            reader.set_raw_tap_enabled(True)
+
+    def _detach_capture(self) -> None:
+        """캡처 기록기 연결을 해제합니다."""
+        protocol = self._capture_protocol
+        self._capture_protocol = None
+        if protocol is not None:
+            protocol.rxFrameTap = None
+        for connection in (self._capture_tx_connection, self._capture_raw_connection):
+            if connection is not None:
+                QObject.disconnect(connection)
+        self._capture_tx_connection = None
+        self._capture_raw_connection = None
+        if self._capture_raw and self.reader_thread:
+            self.reader_thread.set_raw_tap_enabled(self._raw_tap_enabled)
+
+    def start_capture_replay(self, path: Optional[str] = None, speed: Optional[float] = None,
+                             source: str = SOURCE_AUTO) -> bool:
+        """
+        캡처 파일의 수신 기록을 재생합니다. 포트에 연결된 것처럼 connection_changed(True) 를 보내므로
+        페이지들이 재생용 프로토콜에 연결되어 현장에서 기록한 화면 변화를 그대로 재현합니다.
+        재생 중 송신 패킷은 버려지며, 끝나면 capture_replay_finished 를 보내고 연결 상태로 남습니다.
+        (disconnect_port() 로 해제)
+        Args:
+            path (str, optional): 캡처 파일. 없으면 REMOTE_GUI_REPLAY(_SPEED) 환경 변수 값을 사용
+            speed (float, optional): 재생 배속 (1.0 = 실시간). None 또는 0 이하면 최대 속도
+            source (str): 'auto', 'frames', 'raw' (capture_replay.replay_capture 참고)
+        Returns:
+            bool: 재생 시작 여부
+        """
+        if path is None:
+            request = CaptureReplayThread.request_from_environment()
+            if request is None:
+                return False
+            path, speed = request
+        if self.serial_port is not None:
+            self.error_occurred.emit("포트가 연결된 동안에는 캡처를 재생할 수 없습니다")
+            return False
+        self._cancel_reconnect()
+        self._close_port()  # 이전 재생 정리
+
+        self.protocol = create_replay_protocol()
+        self.protocol.data_sent.connect(self._handle_data_sent)
+        replay = CaptureReplayThread(path, self.protocol, speed, source, self)
+        replay.replay_finished.connect(self._on_capture_replay_finished)
+        self._capture_replay = replay
+        self.is_connected = True
+        self.connection_changed.emit(True)
+        replay.start()
+        return True
+
+    def stop_capture_replay(self) -> None:
+        """캡처 재생을 중지하고 재생용 연결을 해제합니다."""
+        if self._capture_replay is not None:
+            self._close_port()
 
-    def _handle_received_data(self, data: bytes) -> None:
-        """수신된 데이터를 처리합니다."""
+    def is_capture_replaying(self) -> bool:
+        """캡처 재생 쓰레드 실행 여부"""
+        return self._capture_replay is not None and self._capture_replay.isRunning()
+
+    def _stop_capture_replay_thread(self) -> None:
+        replay = self._capture_replay
+        if replay is None:
+            return
+        self._capture_replay = None
+        replay.replay_finished.disconnect(self._on_capture_replay_finished)
+        replay.stop()
+        replay.deleteLater()
+
+    @Slot(object)
+    def _on_capture_replay_finished(self, result) -> None:
+        """재생 쓰레드 종료 (GUI 스레드)"""
+        if isinstance(result, Exception):
+            self.error_occurred.emit(f"캡처 재생 실패: {result}")
+        self.capture_replay_finished.emit(result)
+
+    def shutdown(self) -> None:
+        """프로그램 종료 시 모든 백그라운드 스레드를 정지합니다."""
+        self._cancel_reconnect()
+        self.stop_capture_replay()
+        self.stop_metrics_server()
+        self.stop_capture()
+        self.set_link_monitor_enabled(False)
+        self.stop_serial_thread()
+        self.stop_port_watcher()
+        self.packet_tracer.save_requested_trace()
+
+    def start_serial_thread(self) -> None:
+        """시리얼 송신/수신 스레드를 시작합니다. 이미 실행 중인 스레드는 먼저 정지합니다."""
+        if self.serial_port and self.serial_port.is_open:
+            reader, writer = self.io_threads.create(
+                self.serial_port, self.protocol, self,
+                max_retries=self._max_retries,
+                retry_delay=self._retry_delay
+            )
+            # 송신 스레드: 시퀀스 번호와 시리얼 쓰기를 전담
+            writer.write_failed.connect(self._handle_write_failed)
+            self.protocol.attachWriter(writer)
+
+            # 수신 스레드: 프레임 해석까지 수행, GUI 스레드로는 해석된 이벤트만 전달
+            reader.set_raw_tap_enabled(self._raw_tap_enabled)
+            reader.set_sync_interval(self._sync_interval)
+            reader.set_sync_enabled(self._sync_enabled)
+            reader.data_received.connect(self.data_received)
+            reader.rx_activity.connect(self._handle_rx_activity)
+            self._attach_capture()
+            reader.error_occurred.connect(self._handle_reader_error)  # 에러 시그널 연결
+
+            self.io_threads.start()
+    
+    def stop_serial_thread(self) -> None:
+        """시리얼 송신/수신 스레드를 중지하고 종료될 때까지 기다립니다."""
+        # 수신 스레드가 포트를 닫기 전에 송신 스레드를 먼저 정리 (SerialIoThreads.stop 순서)
+        self.io_threads.stop()
         if self.protocol:
-            self.protocol.receiveData(data)
-            self.protocol.processReceivedData()
-        self.data_received.emit(data)
+            self.protocol.attachWriter(None)
+
+    def get_thread_cpu_times(self) -> Dict[str, float]:
+        """
+        시리얼 스레드별 누적 CPU 시간(초)을 반환합니다.
+        Returns:
+            Dict[str, float]: {'reader': 초, 'writer': 초}
+        """
+        return self.io_threads.cpu_times()
+
+    @Slot(int, str)
+    def _handle_write_failed(self, cmd: int, message: str) -> None:
+        """송신 스레드에서 전송이 최종 실패했을 때 호출됩니다."""
+        # SYNC 패킷 실패는 다음 주기에 다시 전송되므로 무시
+        if cmd == ComProtocol.CMD_STATUS_SYNC:
+            return
+        self.error_occurred.emit(f"명령 전송 실패 (CMD 0x{cmd:04X}): {message}")
+    
+    @Slot()
+    def _handle_rx_activity(self) -> None:
+        """수신 스레드에서 데이터를 받았을 때 호출됩니다."""
         # RX LED 표시
         if self.main_window:
             self.main_window.indicate_rx()
+
+    def set_raw_tap_enabled(self, enabled: bool) -> None:
+        """원시 수신 바이트를 data_received 시그널로 전달할지 설정합니다. (기본값: 비활성)"""
+        self._raw_tap_enabled = enabled
+        if self.reader_thread:
+            self.reader_thread.set_raw_tap_enabled(enabled)
     
     def get_protocol(self) -> Optional[ComProtocol]:
         """현재 ComProtocol 인스턴스를 반환합니다."""
@@ -307,30 +772,33 @@ class SerialManager(QObject):
         # 단순히 reader_thread 반환 (연결 상태와 관계없이)
         return self.reader_thread
 
+    @Slot(str)
+    def _handle_reader_error(self, message: str) -> None:
+        """수신 스레드 에러 전달. 자동 재연결로 처리할 연결 끊김은 알리지 않습니다."""
+        if self._auto_reconnect and self._last_port:
+            return
+        self.error_occurred.emit(message)
+
     @Slot()
-    def connect_to_port(self, port_name: str) -> bool:
-        """지정된 포트에 연결을 시도합니다."""
-        if self.is_connected:
+    def _handle_connection_lost(self):
+        """연결 끊김 처리"""
+        if not self.is_connected:
+            return
+        if self._auto_reconnect and self._last_port:
+            self._close_port()
+            self._start_reconnect(self._last_port)
+            return
+        if not self._error_dialog_shown:
+            self.error_occurred.emit("시리얼 포트 연결이 끊어졌습니다.")
+            self._error_dialog_shown = False
             self.disconnect_port()
-            
-        try:
-            self.serial_port = serial.Serial(
-                port_name, 
-                self._baud_rate, 
-                timeout=1,
-                write_timeout=self._write_timeout  # 쓰기 타임아웃 설정
-            )
-            self.protocol = ComProtocol(self.serial_port, None)
-            # 프로토콜의 data_sent 시그널 연결
-            self.protocol.data_sent.connect(self._handle_data_sent)
-            
-            # 시리얼 스레드 시작 (protocol 설정 후)
-            self.start_serial_thread()
-            
-            self.is_connected = True
-            self.connection_changed.emit(True)
-            return True
-            
-        except Exception as e:
-            self.error_occurred.emit(f"연결 실패: {str(e)}")
-            return False 
\ No newline at end of file
+
+
+def _copy_future_result(src: Future, dst: Future) -> None:
+    """src Future 의 결과(또는 예외, 취소)를 dst 로 옮깁니다."""
+    if src.cancelled():
+        dst.set_exception(CancelledError())
+    elif src.exception() is not None:
+        dst.set_exception(src.exception())
+    else:
+        dst.set_result(src.result())
@@ -1,43 +1,191 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QRadioButton, QMessageBox
-from PySide6.QtCore import Slot
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QRadioButton, QMessageBox, QCheckBox,
+                               QGroupBox, QLabel, QGridLayout, QPushButton)
+from PySide6.QtCore import Qt, QTimer, Slot
+import logging
 
 from src.ui.setting_page_ui import Ui_SettingPage
 from src.serial_manager import SerialManager
+from src.widgets.protocol_metrics import ProtocolMetrics
+
+logger = logging.getLogger(__name__)
 
 # 기본 보우레이트 설정
 SERIAL_BAUD_RATE = 115200
 
+# 통신 진단 표시 항목 (ProtocolMetrics 카운터, 이름)
+DIAGNOSTIC_RX_ITEMS = (
+    ('rx_bytes', "수신 바이트"),
+    ('rx_frames', "수신 프레임"),
+    ('rx_crc_errors', "CRC 오류"),
+    ('rx_discarded_bytes', "버린 바이트"),
+    ('rx_missing', "누락"),
+    ('rx_out_of_order', "순서 어긋남"),
+    ('rx_duplicates', "중복"),
+)
+DIAGNOSTIC_TX_ITEMS = (
+    ('tx_bytes', "송신 바이트"),
+    ('tx_frames', "송신 프레임"),
+    ('tx_write_timeouts', "쓰기 타임아웃"),
+    ('tx_retries', "재시도"),
+    ('tx_failures', "전송 실패"),
+)
+DIAGNOSTICS_REFRESH_MS = 1000
+DIAGNOSTICS_TOP_COMMANDS = 4  # 명령별 빈도 표시 개수
+
 
 class SettingPage(QWidget, Ui_SettingPage):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setupUi(self)
-        print("SettingPage 초기화")
+        logger.debug("SettingPage 초기화")
         
         # 시리얼 포트 관련 변수 초기화
         self.port_buttons = []           # 동적으로 생성되는 라디오 버튼 목록
         
         # SerialManager 인스턴스 가져오기
         self.serial_manager = SerialManager.get_instance()
+
+        # 자동 재연결 옵션 (연결 버튼 아래)
+        self.auto_reconnect_check = QCheckBox("자동 재연결", self.widget)
+        self.auto_reconnect_check.setChecked(self.serial_manager.is_auto_reconnect_enabled())
+        self.verticalLayout_2.addWidget(self.auto_reconnect_check)
+        self.replay_commands_check = QCheckBox("재연결 후 명령 재전송", self.widget)
+        self.replay_commands_check.setChecked(self.serial_manager.is_replay_on_reconnect_enabled())
+        self.verticalLayout_2.addWidget(self.replay_commands_check)
+
+        # 링크 품질 표시 (PING 기반 측정)
+        self._setup_link_quality_ui()
+
+        # 통신 진단 (송수신 카운터와 초당 변화량, 페이지가 보이는 동안만 갱신)
+        self._setup_diagnostics_ui()
+
+        # 주기적 동기화 설정은 SerialManager 에 보관 (재연결 후에도 유지)
+        self.serial_manager.set_sync_interval(self.sync_ms_spinBox.value())
        
                
         # 시그널 연결
-        self.SerialRefreshButton.clicked.connect(self.refresh_ports)
+        self.SerialRefreshButton.clicked.connect(self.serial_manager.refresh_ports)
+        self.serial_manager.ports_changed.connect(self._populate_ports)
         self.SerialConnectButton.clicked.connect(self.on_port_selected)
         self.serial_manager.connection_changed.connect(self._update_connection_status)
         self.serial_manager.error_occurred.connect(self._show_error)
         self.sync_enable.toggled.connect(self._on_sync_enable_changed)
         self.sync_ms_spinBox.valueChanged.connect(self._on_sync_interval_changed)
+        self.auto_reconnect_check.toggled.connect(self._on_auto_reconnect_changed)
+        self.replay_commands_check.toggled.connect(self._on_auto_reconnect_changed)
+        self.serial_manager.reconnecting.connect(self._on_reconnecting)
+        self.serial_manager.reconnect_failed.connect(self._on_reconnect_failed)
+        self.link_monitor_check.toggled.connect(self.serial_manager.set_link_monitor_enabled)
+        self.serial_manager.link_quality_updated.connect(self._show_link_quality)
 
         
         
         self.refresh_ports()
 
+    def _setup_link_quality_ui(self):
+        """링크 품질 그룹 (측정 on/off, 점수와 RTT/지터/손실 표시)을 시리얼 설정 아래에 추가합니다."""
+        self.linkQualityGroupBox = QGroupBox("링크 품질", self)
+        layout = QHBoxLayout(self.linkQualityGroupBox)
+        self.link_monitor_check = QCheckBox("측정", self.linkQualityGroupBox)
+        self.link_monitor_check.setChecked(self.serial_manager.is_link_monitor_enabled())
+        layout.addWidget(self.link_monitor_check)
+        self.link_quality_label = QLabel("-", self.linkQualityGroupBox)
+        layout.addWidget(self.link_quality_label, 1)
+        self.verticalLayout.insertWidget(self.verticalLayout.indexOf(self.groupBox) + 1, self.linkQualityGroupBox)
+        self._show_link_quality(self.serial_manager.get_link_quality())
+
+    def _setup_diagnostics_ui(self):
+        """통신 진단 그룹 (카운터 누적값 / 초당 값, 명령별 빈도)을 링크 품질 아래에 추가합니다."""
+        self.diagnosticsGroupBox = QGroupBox("통신 진단", self)
+        layout = QGridLayout(self.diagnosticsGroupBox)
+        self.diagnostic_labels = {}  # 카운터 이름 -> (누적값 라벨, 초당 값 라벨)
+        for column, items in ((0, DIAGNOSTIC_RX_ITEMS), (3, DIAGNOSTIC_TX_ITEMS)):
+            for row, (name, title) in enumerate(items):
+                layout.addWidget(QLabel(title, self.diagnosticsGroupBox), row, column)
+                total_label = QLabel("-", self.diagnosticsGroupBox)
+                rate_label = QLabel("-", self.diagnosticsGroupBox)
+                total_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                rate_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                layout.addWidget(total_label, row, column + 1)
+                layout.addWidget(rate_label, row, column + 2)
+                self.diagnostic_labels[name] = (total_label, rate_label)
+
+        rows = max(len(DIAGNOSTIC_RX_ITEMS), len(DIAGNOSTIC_TX_ITEMS))
+        self.diagnostic_commands_label = QLabel("-", self.diagnosticsGroupBox)
+        self.diagnostic_commands_label.setWordWrap(True)
+        layout.addWidget(self.diagnostic_commands_label, rows, 0, 1, 5)
+        self.diagnostics_reset_button = QPushButton("초기화", self.diagnosticsGroupBox)
+        self.diagnostics_reset_button.clicked.connect(self._on_diagnostics_reset)
+        layout.addWidget(self.diagnostics_reset_button, rows, 5)
+        self.verticalLayout.insertWidget(
+            self.verticalLayout.indexOf(self.linkQualityGroupBox) + 1, self.diagnosticsGroupBox)
+
+        self._last_metrics = None
+        self.diagnostics_timer = QTimer(self)
+        self.diagnostics_timer.setInterval(DIAGNOSTICS_REFRESH_MS)
+        self.diagnostics_timer.timeout.connect(self._refresh_diagnostics)
+
+    @Slot()
+    def _refresh_diagnostics(self):
+        """송수신 카운터 표시 갱신 (초당 값은 직전 갱신 이후 변화량)"""
+        metrics = self.serial_manager.get_protocol_metrics()
+        if metrics is None:
+            self._last_metrics = None
+            for total_label, rate_label in self.diagnostic_labels.values():
+                total_label.setText("-")
+                rate_label.setText("-")
+            self.diagnostic_commands_label.setText("-")
+            return
+
+        rates = ProtocolMetrics.rates(self._last_metrics, metrics)
+        self._last_metrics = metrics
+        for name, (total_label, rate_label) in self.diagnostic_labels.items():
+            total_label.setText(f"{metrics[name]:,}")
+            rate_label.setText(f"{rates[name]:,.1f}/s")
+
+        def top_commands(counts):
+            top = sorted(counts.items(), key=lambda item: item[1], reverse=True)[:DIAGNOSTICS_TOP_COMMANDS]
+            return ", ".join(f"0x{cmd:04X} {count:,}" for cmd, count in top) or "-"
+
+        self.diagnostic_commands_label.setText(
+            f"수신 명령: {top_commands(metrics['rx_commands'])}\n"
+            f"송신 명령: {top_commands(metrics['tx_commands'])}"
+        )
+
+    @Slot()
+    def _on_diagnostics_reset(self):
+        """통신 진단 카운터 초기화"""
+        self.serial_manager.reset_protocol_metrics()
+        self._last_metrics = None
+        self._refresh_diagnostics()
+
+    @Slot(object)
+    def _show_link_quality(self, quality):
+        """링크 품질 측정 결과 표시"""
+        if quality is None:
+            self.link_quality_label.setText("-")
+            return
+        fmt = lambda v: "-" if v is None else f"{v:.1f}"
+        self.link_quality_label.setText(
+            f"점수 {quality.score}  |  RTT p50 {fmt(quality.rtt_p50_ms)} / p90 {fmt(quality.rtt_p90_ms)}"
+            f" / p99 {fmt(quality.rtt_p99_ms)} ms  |  지터 {fmt(quality.jitter_ms)} ms"
+            f"  |  손실 {quality.loss_pct:.1f}%  |  누락 {quality.missing_packets}  CRC {quality.crc_errors}"
+        )
+
     @Slot()
     def refresh_ports(self):
-        """시리얼 포트 목록을 새로고침합니다."""
-        print("포트 목록 새로고침 시작")
-        
+        """캐시된 시리얼 포트 목록으로 화면을 갱신합니다. (목록 변경은 ports_changed 로 자동 반영)"""
+        self._populate_ports(self.serial_manager.get_available_ports())
+
+    @Slot(list)
+    def _populate_ports(self, available_ports):
+        """포트 목록으로 라디오 버튼을 다시 만듭니다. 선택된 포트는 목록에 남아 있으면 유지합니다."""
+        selected_port = None
+        for rb in self.port_buttons:
+            if rb.isChecked():
+                selected_port = rb.property("port_device")
+                break
+
         # 기존 버튼 삭제
         for btn in self.port_buttons:
             btn.deleteLater()
@@ -55,9 +203,6 @@ class SettingPage(QWidget, Ui_SettingPage):
                 if item.widget():
                     item.widget().deleteLater()
         
-        # 포트 목록 가져오기
-        available_ports = self.serial_manager.get_available_ports()
-        
         # 포트별 라디오 버튼 생성
         for port, description in available_ports:
             port_info = f"{port}"
@@ -66,17 +211,20 @@ class SettingPage(QWidget, Ui_SettingPage):
             
             rb = QRadioButton(port_info)
             rb.setProperty("port_device", port)
+            rb.setChecked(port == selected_port)
             self.port_buttons.append(rb)
             layout.addWidget(rb)
         
         if not self.port_buttons:
-            print("사용 가능한 시리얼 포트가 없습니다.")
+            logger.info("사용 가능한 시리얼 포트가 없습니다.")
 
     @Slot()
     def on_port_selected(self):
         """포트 연결/해제 버튼 클릭 처리"""
-        if self.serial_manager.is_port_connected():
+        if self.serial_manager.is_port_connected() or self.serial_manager.is_reconnecting():
+            # 연결 해제 또는 자동 재연결 취소
             self.serial_manager.disconnect_port()
+            self._update_connection_status(False)
             return
         
         # 선택된 포트 확인
@@ -100,16 +248,11 @@ class SettingPage(QWidget, Ui_SettingPage):
         
         # sync_enable 버튼 활성화/비활성화 상태 업데이트
         self.sync_enable.setEnabled(is_connected)
-        print(f"sync_enable 버튼 활성화 상태: {is_connected}")
-        
-        # 연결 상태에 따라 sync 설정 업데이트
-        if is_connected:
-            reader_thread = self.serial_manager.get_reader_thread()
-            if reader_thread:
-                reader_thread.set_sync_enabled(self.sync_enable.isChecked())
-                reader_thread.set_sync_interval(self.sync_ms_spinBox.value())
-        else:
-            self.sync_enable.setChecked(False)
+        logger.debug("sync_enable 버튼 활성화 상태: %s", is_connected)
+        
+        # 동기화 설정은 SerialManager 에 보관되어 재연결 시 자동으로 복원됨
+        self._show_sync_settings()
+        if not is_connected:
             # 연결 해제 시 동기화 정리
             if hasattr(self, 'protocol') and self.protocol:
                 self.protocol.cleanup_sync()
@@ -128,25 +271,41 @@ class SettingPage(QWidget, Ui_SettingPage):
 
     def _on_sync_enable_changed(self, enabled: bool):
         """Sync 활성화 상태가 변경되었을 때 호출"""
-        print(f"Sync 상태 변경: {enabled}")  # 디버깅용 출력 추가
+        logger.debug("Sync 상태 변경: %s", enabled)
         
         if enabled and not self.serial_manager.is_port_connected():
-            print("포트가 연결되지 않아 sync를 활성화할 수 없습니다.")
-            self.sync_enable.setChecked(False)
+            logger.warning("포트가 연결되지 않아 sync를 활성화할 수 없습니다.")
+            self._show_sync_settings()
             return
             
-        reader_thread = self.serial_manager.get_reader_thread()
-        if reader_thread:
-            print(f"Reader thread sync 설정: {enabled}")
-            reader_thread.set_sync_enabled(enabled)
-        else:
-            print("Reader thread not available")
+        self.serial_manager.set_sync_enabled(enabled)
     
     def _on_sync_interval_changed(self, value: int):
         """Sync 주기가 변경되었을 때 호출"""
-        reader_thread = self.serial_manager.get_reader_thread()
-        if reader_thread:
-            reader_thread.set_sync_interval(value)
+        self.serial_manager.set_sync_interval(value)
+
+    def _show_sync_settings(self):
+        """SerialManager 에 보관된 sync 설정을 화면에 표시합니다. (변경 시그널 없이)"""
+        self.sync_enable.blockSignals(True)
+        self.sync_enable.setChecked(self.serial_manager.is_sync_enabled())
+        self.sync_enable.blockSignals(False)
+
+    def _on_auto_reconnect_changed(self, _checked: bool):
+        """자동 재연결 옵션이 변경되었을 때 호출"""
+        self.serial_manager.set_auto_reconnect(
+            self.auto_reconnect_check.isChecked(),
+            replay_commands=self.replay_commands_check.isChecked()
+        )
+
+    @Slot(int, float)
+    def _on_reconnecting(self, attempt: int, delay: float):
+        """자동 재연결 대기 중 표시 (버튼을 누르면 재연결 취소)"""
+        self.SerialConnectButton.setText(f"재연결 중 ({attempt})")
+
+    @Slot(str)
+    def _on_reconnect_failed(self, _port_name: str):
+        """재연결을 포기하면 연결 해제 상태로 표시"""
+        self._update_connection_status(False)
     
     def _on_connection_changed(self, is_connected: bool):
         """시리얼 연결 상태가 변경되었을 때 호출"""
@@ -160,21 +319,23 @@ class SettingPage(QWidget, Ui_SettingPage):
         is_connected = self.serial_manager.is_port_connected()
         self.sync_enable.setEnabled(is_connected)
         
-        # 연결된 상태에서만 이전 sync 상태를 복원
-        if is_connected:
-            reader_thread = self.serial_manager.get_reader_thread()
-            if reader_thread:
-                # 임시로 _sync_enabled 속성을 직접 사용
-                self.sync_enable.setChecked(reader_thread._sync_enabled)
+        # 보관된 sync 상태 표시
+        self._show_sync_settings()
+
+        # 통신 진단은 보이는 동안만 갱신
+        self._last_metrics = None
+        self._refresh_diagnostics()
+        self.diagnostics_timer.start()
         
     def hideEvent(self, event):
         """페이지가 숨겨질 때 호출"""
         super().hideEvent(event)
+        self.diagnostics_timer.stop()
         # 페이지가 숨겨질 때는 sync 상태를 유지합니다
 
     def on_port_connected(self):
         """포트 연결 성공 후 호출되는 함수"""
-        print("포트 연결 성공: 동기화 시작")
+        logger.info("포트 연결 성공: 동기화 시작")
         
         # 이전 연결이 있다면 정리 - disconnect 전에 연결 여부 확인
         if hasattr(self, 'protocol') and self.protocol:
@@ -0,0 +1,142 @@
+import logging
+import os
+import time
+from typing import List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QEvent, QStandardPaths, QTimer, qVersion
+
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer(QObject):
+    """
+    시작 단계별 소요 시간을 기록하고, 메인 윈도우의 첫 프레임이 그려진 시점에 요약을 로그로 남깁니다.
+
+    사용 예:
+        timer = StartupTimer.get_instance()
+        timer.mark("QApplication")
+        ...
+        timer.watch_first_frame(window)
+    """
+    _instance = None
+
+    @classmethod
+    def get_instance(cls) -> 'StartupTimer':
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        if StartupTimer._instance is not None:
+            raise Exception("StartupTimer는 싱글톤 클래스입니다. get_instance()를 사용하세요.")
+        super().__init__()
+        self._t0 = time.perf_counter()
+        self._last = self._t0
+        self._phases: List[Tuple[str, float]] = []  # (단계 이름, 단계 소요 시간 ms)
+        self._first_frame_ms: Optional[float] = None
+        self._window = None
+
+    def mark(self, phase: str) -> float:
+        """
+        직전 mark 이후 경과 시간을 phase 이름으로 기록합니다.
+        Returns:
+            float: 단계 소요 시간 (ms)
+        """
+        now = time.perf_counter()
+        elapsed_ms = (now - self._last) * 1000.0
+        self._last = now
+        self._phases.append((phase, elapsed_ms))
+        logger.debug("startup %-20s %7.1f ms", phase, elapsed_ms)
+        return elapsed_ms
+
+    def elapsed_ms(self) -> float:
+        """프로세스 시작(이 객체 생성) 이후 경과 시간 (ms)"""
+        return (time.perf_counter() - self._t0) * 1000.0
+
+    def get_phases(self) -> List[Tuple[str, float]]:
+        """기록된 (단계 이름, 소요 시간 ms) 목록"""
+        return list(self._phases)
+
+    def get_first_frame_ms(self) -> Optional[float]:
+        """첫 프레임까지 걸린 시간 (ms), 아직 그려지지 않았으면 None"""
+        return self._first_frame_ms
+
+    def watch_first_frame(self, window) -> None:
+        """window 의 첫 Paint 이벤트가 처리된 직후 시작 시간 요약을 로그로 남깁니다."""
+        self._window = window
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if obj is self._window and event.type() == QEvent.Paint:
+            obj.removeEventFilter(self)
+            self._window = None
+            # 이벤트 필터는 그리기 전에 호출되므로 그리기가 끝난 다음 이벤트 루프 차례에 측정
+            QTimer.singleShot(0, self._on_first_frame)
+        return False
+
+    def _on_first_frame(self):
+        self.mark("first frame")
+        self._first_frame_ms = self.elapsed_ms()
+        summary = ", ".join(f"{name} {ms:.0f}" for name, ms in self._phases)
+        logger.info("첫 프레임까지 %.0f ms (%s)", self._first_frame_ms, summary)
+
+
+def _stylesheet_cache_dir() -> str:
+    """스타일시트 캐시 디렉터리 (사용자 캐시 경로, 실패 시 임시 경로)"""
+    path = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+    if not path:
+        path = os.path.join(QStandardPaths.writableLocation(QStandardPaths.TempLocation), "remote_gui")
+    return path
+
+
+def _apply_palette_patch(app, palette) -> None:
+    """qdarkstyle 이 로드 시 적용하는 애플리케이션 팔레트 보정(링크 색상)을 동일하게 적용합니다."""
+    from PySide6.QtGui import QColor, QPalette
+    color = getattr(palette, 'COLOR_ACCENT_3', None)
+    if color is None:
+        return
+    app_palette = app.palette()
+    app_palette.setColor(QPalette.Normal, QPalette.Link, QColor(color))
+    app.setPalette(app_palette)
+
+
+def load_cached_stylesheet(app, palette) -> str:
+    """
+    qdarkstyle 스타일시트를 캐시 파일에서 읽어 반환합니다.
+    캐시는 qdarkstyle 버전, 팔레트, Qt 버전별로 저장되며, 없거나 읽을 수 없으면 새로 생성해 저장합니다.
+    캐시를 사용할 때도 스타일시트가 참조하는 아이콘 리소스 모듈은 import 합니다.
+
+    Args:
+        app: QApplication 인스턴스
+        palette: qdarkstyle 팔레트 클래스 (예: qdarkstyle.LightPalette)
+    """
+    import qdarkstyle
+
+    version = getattr(qdarkstyle, '__version__', 'unknown')
+    cache_path = os.path.join(
+        _stylesheet_cache_dir(),
+        f"qdarkstyle-{version}-{palette.ID}-qt{qVersion()}.qss"
+    )
+
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            stylesheet = f.read()
+        # 스타일시트 안의 url(:/qss_icons/...) 리소스 등록
+        __import__(f"qdarkstyle.{palette.ID}.{palette.ID}style_rc")
+        _apply_palette_patch(app, palette)
+        if stylesheet:
+            return stylesheet
+    except (OSError, ImportError) as e:
+        logger.debug("스타일시트 캐시 사용 불가 (%s): %s", cache_path, e)
+
+    stylesheet = qdarkstyle.load_stylesheet(palette=palette)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(stylesheet)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning("스타일시트 캐시 저장 실패 (%s): %s", cache_path, e)
+    return stylesheet
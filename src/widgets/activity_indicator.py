@@ -0,0 +1,98 @@
+import time
+
+from PySide6.QtCore import QRectF, QSize, Qt, QTimer
+from PySide6.QtGui import QColor, QFont, QPainter, QPen, QPixmap
+from PySide6.QtWidgets import QSizePolicy, QWidget
+
+
+class ActivityIndicator(QWidget):
+    """
+    TX/RX 활동 표시 LED.
+    pulse() 는 플래그만 세우고, 내부 타이머가 최대 REFRESH_HZ 로 상태를 반영합니다.
+    켜짐/꺼짐 이미지는 미리 그려두고 상태가 바뀔 때만 다시 그리므로 패킷 수와 무관하게 비용이 일정합니다.
+    """
+    REFRESH_HZ = 20
+    HOLD_MS = 100  # 마지막 활동 후 켜진 상태 유지 시간
+    OFF_COLOR = QColor('#808080')
+
+    def __init__(self, text: str, on_color: str, parent=None):
+        super().__init__(parent)
+        self._text = text
+        self._on_color = QColor(on_color)
+        self._on = False
+        self._latched = False
+        self._off_deadline = 0.0
+        self._pixmaps = {}
+
+        self.setMinimumSize(QSize(16, 16))
+        self.setMaximumSize(QSize(22, 22))
+        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self.setAttribute(Qt.WA_OpaquePaintEvent, False)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(1000 // self.REFRESH_HZ)
+        self._timer.timeout.connect(self._refresh)
+
+    def sizeHint(self) -> QSize:
+        return QSize(22, 22)
+
+    def pulse(self) -> None:
+        """활동 발생을 기록합니다. 다음 갱신 주기에 LED 가 켜집니다."""
+        self._latched = True
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def is_on(self) -> bool:
+        return self._on
+
+    def _refresh(self) -> None:
+        """갱신 주기마다 누적된 활동을 반영합니다. 할 일이 없으면 타이머를 멈춥니다."""
+        now = time.monotonic()
+        if self._latched:
+            self._latched = False
+            self._off_deadline = now + self.HOLD_MS / 1000
+            self._set_on(True)
+        elif self._on and now >= self._off_deadline:
+            self._set_on(False)
+            self._timer.stop()
+        elif not self._on:
+            self._timer.stop()
+
+    def _set_on(self, on: bool) -> None:
+        if self._on != on:
+            self._on = on
+            self.update()
+
+    def resizeEvent(self, event):
+        self._pixmaps.clear()
+        super().resizeEvent(event)
+
+    def _pixmap(self, on: bool) -> QPixmap:
+        """상태별 이미지를 현재 크기로 한 번만 그려 재사용합니다."""
+        pixmap = self._pixmaps.get(on)
+        if pixmap is None:
+            ratio = self.devicePixelRatioF()
+            pixmap = QPixmap(self.size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(QPen(Qt.black, 2))
+            painter.setBrush(self._on_color if on else self.OFF_COLOR)
+            rect = QRectF(1, 1, self.width() - 2, self.height() - 2)
+            painter.drawRoundedRect(rect, 5, 5)
+            painter.setPen(Qt.white)
+            font = QFont(self.font())
+            font.setBold(True)
+            painter.setFont(font)
+            painter.drawText(rect, Qt.AlignCenter, self._text)
+            painter.end()
+
+            self._pixmaps[on] = pixmap
+        return pixmap
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pixmap(self._on))
+        painter.end()
@@ -0,0 +1,208 @@
+import argparse
+import logging
+import os
+import threading
+import time
+from typing import Callable, NamedTuple, Optional, Tuple, Union
+
+from PySide6.QtCore import QThread, Signal
+
+from src.widgets.packet_capture import CaptureReader, Direction
+from src.widgets.serial_protocol import ComProtocol
+
+
+logger = logging.getLogger(__name__)
+
+SOURCE_AUTO = 'auto'    # 원시 바이트가 기록된 캡처면 raw, 아니면 frames
+SOURCE_FRAMES = 'frames'  # CRC 검증을 통과한 수신 프레임 (RX)
+SOURCE_RAW = 'raw'      # 시리얼에서 읽은 그대로의 수신 바이트 (RX_RAW, 깨진 바이트/CRC 오류 포함)
+SOURCES = (SOURCE_AUTO, SOURCE_FRAMES, SOURCE_RAW)
+
+PROGRESS_INTERVAL = 0.25  # progress 콜백 최소 간격 (초)
+
+
+class ReplayResult(NamedTuple):
+    """캡처 재생 결과"""
+    records: int              # 프로토콜에 넣은 레코드 수
+    bytes: int                # 프로토콜에 넣은 바이트 수
+    frames: int               # 재생 중 디코딩된 프레임 수 (rx_frames 증가분)
+    crc_errors: int           # 재생 중 CRC 오류 수
+    elapsed: float            # 재생에 걸린 시간 (초)
+    frames_per_second: float  # 디코딩 + 핸들러 처리량
+    stopped: bool             # 끝까지 재생하기 전에 중지되었는지 여부
+
+
+class ReplaySink:
+    """
+    재생용 ComProtocol 의 송신 대상. 쓴 패킷을 버리고 길이만 돌려줍니다.
+    (재생 중 GUI 가 직접 보내는 패킷이 실제 포트로 나가지 않도록)
+    """
+    is_open = True
+
+    def write(self, data) -> int:
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+def create_replay_protocol() -> ComProtocol:
+    """재생 전용 ComProtocol (송신은 ReplaySink 로 버림)"""
+    return ComProtocol(ReplaySink(), None)
+
+
+def replay_capture(capture: Union[str, CaptureReader], protocol: ComProtocol,
+                   speed: Optional[float] = None, source: str = SOURCE_AUTO,
+                   stop_event: Optional[threading.Event] = None,
+                   progress: Optional[Callable[[int, float], None]] = None) -> ReplayResult:
+    """
+    캡처 파일의 수신 기록을 ComProtocol 에 다시 넣습니다. 호출한 쓰레드가 수신 쓰레드 역할을 합니다.
+    레코드마다 receiveData() + processReceivedData() 를 호출하므로 디코더, 시퀀스 검사, 명령 핸들러,
+    시그널이 실제 수신과 같은 경로로 실행됩니다.
+
+    Args:
+        capture: 캡처 파일 경로 또는 열린 CaptureReader
+        protocol: 재생 대상 프로토콜
+        speed: 재생 배속 (1.0 = 기록된 시간 간격 그대로). None 또는 0 이하면 대기 없이 최대 속도
+        source: SOURCE_AUTO / SOURCE_FRAMES / SOURCE_RAW
+        stop_event: 설정되면 재생을 중단
+        progress: progress(재생한 레코드 수, 캡처 기준 경과 시간 초), PROGRESS_INTERVAL 마다 호출
+    Returns:
+        ReplayResult
+    Raises:
+        ValueError: source 가 잘못되었거나 raw 재생을 요청했는데 원시 바이트가 없는 캡처인 경우
+    """
+    if source not in SOURCES:
+        raise ValueError(f"알 수 없는 재생 소스입니다: {source}")
+    reader = CaptureReader(capture) if isinstance(capture, str) else capture
+    try:
+        if source == SOURCE_AUTO:
+            source = SOURCE_RAW if reader.has_raw_chunks else SOURCE_FRAMES
+        elif source == SOURCE_RAW and not reader.has_raw_chunks:
+            raise ValueError(f"수신 원시 바이트가 기록되지 않은 캡처입니다: {reader.path}")
+        direction = Direction.RX_RAW if source == SOURCE_RAW else Direction.RX
+        return _replay(reader, protocol, direction, speed, stop_event or threading.Event(), progress)
+    finally:
+        if reader is not capture:
+            reader.close()
+
+
+def _replay(reader: CaptureReader, protocol: ComProtocol, direction: Direction, speed: Optional[float],
+            stop_event: threading.Event, progress) -> ReplayResult:
+    realtime = speed is not None and speed > 0
+    metrics = protocol.metrics
+    frames_before = metrics.rx_frames
+    crc_before = metrics.rx_crc_errors
+    receive = protocol.receiveData
+    process = protocol.processReceivedData
+
+    records = total_bytes = 0
+    first_ns = None
+    stopped = False
+    start = time.perf_counter()
+    next_progress = start + PROGRESS_INTERVAL
+    for record in reader.records(directions=(direction,)):
+        if first_ns is None:
+            first_ns = record.timestamp_ns
+        offset = (record.timestamp_ns - first_ns) / 1e9  # 캡처 기준 경과 시간
+        if realtime:
+            delay = start + offset / speed - time.perf_counter()
+            if delay > 0 and stop_event.wait(delay):
+                stopped = True
+                break
+        elif stop_event.is_set():
+            stopped = True
+            break
+
+        receive(record.data)
+        process()
+        records += 1
+        total_bytes += len(record.data)
+
+        if progress is not None:
+            now = time.perf_counter()
+            if now >= next_progress:
+                next_progress = now + PROGRESS_INTERVAL
+                progress(records, offset)
+
+    elapsed = time.perf_counter() - start
+    frames = metrics.rx_frames - frames_before
+    result = ReplayResult(records, total_bytes, frames, metrics.rx_crc_errors - crc_before, elapsed,
+                          frames / elapsed if elapsed > 0 else 0.0, stopped)
+    logger.info("캡처 재생 %s: %s (%d 레코드, %d 프레임, %.3f 초, %.0f frames/s)",
+                "중지" if stopped else "완료", reader.path, records, frames, elapsed, result.frames_per_second)
+    return result
+
+
+class CaptureReplayThread(QThread):
+    """
+    캡처 재생 쓰레드. 실제 수신 쓰레드 대신 이 쓰레드에서 protocol 에 수신 데이터를 넣으므로
+    프로토콜 시그널은 평소처럼 GUI 쓰레드로 큐잉되어 페이지가 그대로 갱신됩니다.
+
+    환경 변수 REMOTE_GUI_REPLAY 에 캡처 파일을 지정하면 MainWindow 시작 시 재생합니다.
+    (배속은 REMOTE_GUI_REPLAY_SPEED, 기본값 1 = 실시간, 0 = 최대 속도)
+    """
+    progress = Signal(int, float)        # (재생한 레코드 수, 캡처 기준 경과 시간 초)
+    replay_finished = Signal(object)     # ReplayResult, 실패 시 예외 객체
+
+    ENV_PATH = 'REMOTE_GUI_REPLAY'
+    ENV_SPEED = 'REMOTE_GUI_REPLAY_SPEED'
+
+    def __init__(self, path: str, protocol: ComProtocol, speed: Optional[float] = None,
+                 source: str = SOURCE_AUTO, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.protocol = protocol
+        self.speed = speed
+        self.source = source
+        self._stop_event = threading.Event()
+
+    def run(self):
+        try:
+            result = replay_capture(self.path, self.protocol, self.speed, self.source,
+                                    self._stop_event, self.progress.emit)
+        except Exception as e:
+            logger.exception("캡처 재생 실패: %s", self.path)
+            result = e
+        self.replay_finished.emit(result)
+
+    def stop(self):
+        """재생을 중단하고 쓰레드가 끝날 때까지 기다립니다."""
+        self._stop_event.set()
+        self.wait()
+
+    @classmethod
+    def request_from_environment(cls) -> Optional[Tuple[str, float]]:
+        """(REMOTE_GUI_REPLAY 경로, 배속). 경로가 없으면 None, 배속이 잘못되었으면 1.0"""
+        path = os.environ.get(cls.ENV_PATH, '').strip()
+        if not path:
+            return None
+        value = os.environ.get(cls.ENV_SPEED, '').strip()
+        try:
+            speed = float(value) if value else 1.0
+        except ValueError:
+            logger.warning("%s 값이 올바르지 않습니다: %s", cls.ENV_SPEED, value)
+            speed = 1.0
+        return path, speed
+
+
+if __name__ == "__main__":
+    # 화면 없이 재생해 디코더/핸들러 처리량 측정: python -m src.widgets.capture_replay capture.bin
+    parser = argparse.ArgumentParser(description="패킷 캡처 파일을 ComProtocol 로 재생합니다.")
+    parser.add_argument('path', help="캡처 파일")
+    parser.add_argument('--speed', type=float, default=0.0,
+                        help="재생 배속 (1 = 실시간, 0 = 최대 속도, 기본값 0)")
+    parser.add_argument('--source', choices=SOURCES, default=SOURCE_AUTO, help="재생할 수신 기록")
+    parser.add_argument('--repeat', type=int, default=1, help="반복 횟수 (처리량 측정용)")
+    args = parser.parse_args()
+
+    with CaptureReader(args.path) as capture_reader:
+        for run in range(1, args.repeat + 1):
+            replay_protocol = create_replay_protocol()  # 반복마다 새 수신 상태 (시퀀스 번호, 버퍼)
+            try:
+                outcome = replay_capture(capture_reader, replay_protocol, args.speed, args.source)
+            except ValueError as error:
+                parser.error(str(error))
+            print(f"[{run}] {outcome.records} 레코드, {outcome.bytes} 바이트, {outcome.frames} 프레임, "
+                  f"CRC 오류 {outcome.crc_errors}, 누락 {replay_protocol.missingPacketCount}, "
+                  f"{outcome.elapsed:.3f} 초, {outcome.frames_per_second:,.0f} frames/s")
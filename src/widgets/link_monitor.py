@@ -0,0 +1,179 @@
+import collections
+import math
+import struct
+import threading
+from concurrent.futures import CancelledError
+from typing import List, NamedTuple, Optional
+
+from PySide6.QtCore import QThread, Signal
+
+from src.widgets.serial_protocol import ComProtocol
+from src.widgets.serial_requests import RttEstimator
+
+
+_PING_SEQ = struct.Struct('>I')
+
+
+class LinkQuality(NamedTuple):
+    """링크 품질 측정 결과 (최근 WINDOW 개 ping 기준)"""
+    score: int                      # 0 ~ 100, LinkMonitor.compute_score 참고
+    rtt_p50_ms: Optional[float]
+    rtt_p90_ms: Optional[float]
+    rtt_p99_ms: Optional[float]
+    jitter_ms: Optional[float]      # 연속한 RTT 차이의 평균
+    loss_pct: float                 # 응답 없는 ping 비율 (%)
+    samples: int                    # 창 안의 ping 수
+    missing_packets: int            # 창 기간 동안 누락된 수신 패킷 수 (시퀀스 번호 기준)
+    crc_errors: int                 # 창 기간 동안의 CRC 오류 수
+
+
+def _percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """정렬된 목록의 백분위 값 (nearest-rank)"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class LinkMonitor(QThread):
+    """
+    PING/PONG 으로 링크 품질을 측정하는 백그라운드 쓰레드.
+    interval 마다 ping 을 보내고 송신 완료/응답 수신 시각을 time.monotonic_ns 로 기록해
+    최근 WINDOW 개 ping 의 RTT 백분위, 지터, 손실률을 계산합니다.
+    여기에 수신 패킷 누락(missingPacketCount)과 CRC 오류를 더해 0 ~ 100 의 품질 점수를 만듭니다.
+
+    응답 대기와 타임아웃은 ComProtocol.requests (요청/응답 연결 테이블)를 그대로 사용하므로
+    다른 명령과 같은 RTT 기반 제한 시간(RTO)을 넘긴 ping 은 손실로 집계됩니다.
+    ping 페이로드에 일련번호를 넣고 요청 테이블이 되돌아온 번호로 응답을 짝지으므로,
+    늦게 도착한 이전 응답은 다음 ping 을 완료하지 않고 RTT 추정값에도 반영되지 않습니다.
+    """
+    quality_updated = Signal(object)  # LinkQuality, ping 마다
+
+    DEFAULT_INTERVAL = 1.0  # 초
+    WINDOW = 100            # 통계에 사용하는 최근 ping 수
+    MAX_WAIT = RttEstimator.MAX_RTO + 1.0  # ping 응답 최대 대기 시간 (초), 실제 제한 시간은 RTT 기반 RTO
+
+    def __init__(self, serial_manager, parent=None, interval: float = DEFAULT_INTERVAL,
+                 receiverId: int = 0x0001, senderId: int = 0x0000):
+        super().__init__(parent)
+        self.serial_manager = serial_manager
+        self.interval = interval
+        self.receiverId = receiverId
+        self.senderId = senderId
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._rtts = collections.deque(maxlen=self.WINDOW)  # ping 별 (응답 여부, RTT ns 또는 None)
+        self._errors = collections.deque(maxlen=self.WINDOW)  # ping 시점의 (rxFrameCount, missing, crc)
+        self._protocol = None
+        self._response = None  # 응답을 기다리는 ping 핸들 (중지 시 취소)
+        self._quality: Optional[LinkQuality] = None
+
+    def set_interval(self, interval: float) -> None:
+        """ping 주기(초)를 설정합니다. 다음 ping 부터 적용됩니다."""
+        self.interval = max(0.05, interval)
+
+    def get_quality(self) -> Optional[LinkQuality]:
+        """마지막으로 계산한 링크 품질 (측정 전이면 None)"""
+        return self._quality
+
+    def reset(self) -> None:
+        """누적된 측정값을 지웁니다."""
+        with self._lock:
+            self._rtts.clear()
+            self._errors.clear()
+            self._quality = None
+
+    def run(self):
+        self._stop_event.clear()
+        while not self._stop_event.is_set():
+            protocol = self.serial_manager.get_protocol()
+            if protocol is not None and self.serial_manager.is_port_connected():
+                if protocol is not self._protocol:
+                    # 재연결 등으로 프로토콜 객체가 바뀌면 누적 카운터 기준도 새로 시작
+                    self._protocol = protocol
+                    self.reset()
+                self._ping(protocol)
+            self._stop_event.wait(self.interval)
+
+    def _ping(self, protocol) -> None:
+        """ping 하나를 보내고 응답 또는 타임아웃까지 기다린 뒤 통계를 갱신합니다."""
+        self._sequence = (self._sequence + 1) & 0xFFFFFFFF
+        payload = _PING_SEQ.pack(self._sequence)
+
+        # 송신 완료/응답 수신 시각은 요청 테이블이 monotonic_ns 로 기록
+        pending = protocol.requests.register(
+            ComProtocol.CMD_PING, match=lambda event: bytes(event.payload[:_PING_SEQ.size]) == payload)
+        try:
+            sent = protocol.sendData(self.receiverId, self.senderId, ComProtocol.CMD_PING, payload)
+        except Exception:
+            sent = None
+        self._response = protocol.requests.attach(pending, sent)
+
+        received = False
+        rtt_ns = None
+        try:
+            self._response.result(timeout=self.MAX_WAIT)
+            received = True
+            if pending.sent_ns is not None:
+                rtt_ns = pending.received_ns - pending.sent_ns
+        except CancelledError:
+            return  # 연결 해제 등으로 취소된 ping 은 통계에서 제외
+        except Exception:
+            pass  # 타임아웃, 전송 실패는 손실로 기록
+        finally:
+            self._response = None
+
+        with self._lock:
+            self._rtts.append((received, rtt_ns))
+            self._errors.append((protocol.rxFrameCount, protocol.missingPacketCount, protocol.crcErrorCount))
+            self._quality = self._compute()
+        self.quality_updated.emit(self._quality)
+
+    def _compute(self) -> LinkQuality:
+        rtts_ms = [rtt / 1e6 for _, rtt in self._rtts if rtt is not None]
+        samples = len(self._rtts)
+        lost = sum(1 for received, _ in self._rtts if not received)
+        loss_pct = 100.0 * lost / samples if samples else 0.0
+
+        jitter = None
+        if len(rtts_ms) >= 2:
+            jitter = sum(abs(b - a) for a, b in zip(rtts_ms, rtts_ms[1:])) / (len(rtts_ms) - 1)
+
+        ordered = sorted(rtts_ms)
+        p50, p90, p99 = (_percentile(ordered, p) for p in (50, 90, 99))
+
+        frames = missing = crc = 0
+        if len(self._errors) >= 2:
+            first, last = self._errors[0], self._errors[-1]
+            frames, missing, crc = (last[i] - first[i] for i in range(3))
+
+        score = self.compute_score(p90, jitter, loss_pct, frames, missing, crc)
+        return LinkQuality(score, p50, p90, p99, jitter, loss_pct, samples, missing, crc)
+
+    @staticmethod
+    def compute_score(rtt_p90_ms, jitter_ms, loss_pct, frames, missing, crc_errors) -> int:
+        """
+        링크 품질 점수 (100 = 최상). 100 에서 아래 감점을 뺍니다.
+            손실률    : 손실 1% 당 2점 (최대 40)
+            지연(p90) : 10ms 당 1점 (최대 20)
+            지터      : 5ms 당 1점 (최대 10)
+            수신 오류 : (누락 + CRC 오류) / 수신 프레임 비율 1% 당 3점 (최대 30)
+        """
+        penalty = min(40.0, loss_pct * 2.0)
+        if rtt_p90_ms is not None:
+            penalty += min(20.0, rtt_p90_ms / 10.0)
+        if jitter_ms is not None:
+            penalty += min(10.0, jitter_ms / 5.0)
+        errors = missing + crc_errors
+        if errors:
+            penalty += min(30.0, 300.0 * errors / max(1, frames + errors))
+        return int(round(max(0.0, 100.0 - penalty)))
+
+    def stop(self):
+        """쓰레드를 중지합니다. 응답을 기다리는 ping 은 취소합니다."""
+        self._stop_event.set()
+        response = self._response
+        if response is not None:
+            response.cancel()
+        self.wait()
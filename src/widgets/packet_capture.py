@@ -0,0 +1,312 @@
+import bisect
+import enum
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from src.widgets.serial_codec import FRAME_PREFIX
+
+
+logger = logging.getLogger(__name__)
+
+# 캡처 파일 구성 (little endian)
+#   [헤더][레코드 ...][인덱스 엔트리 ...][트레일러]
+#   헤더    : 매직(8) 버전(2) 플래그(2) 레코드 헤더 크기(4) 시작 시각 wall ns(8) 시작 시각 monotonic ns(8)
+#   레코드  : timestamp ns(8, monotonic) direction(1) flags(1) cmd(2) sequence(2) 길이(4) + 데이터
+#   인덱스  : INDEX_INTERVAL 레코드마다 (timestamp ns, 파일 오프셋)
+#   트레일러: 인덱스 오프셋(8) 엔트리 수(8) 매직(8)
+# 정상 종료되지 않은 파일은 트레일러가 없으며, 리더는 레코드를 처음부터 읽어 마지막 완전한 레코드까지 사용한다.
+CAPTURE_MAGIC = b'RGUICAP\x00'
+CAPTURE_VERSION = 1
+TRAILER_MAGIC = b'RGCAPIDX'
+FLAG_RAW_CHUNKS = 0x0001  # 수신 원시 바이트(RX_RAW) 레코드 포함
+
+_HEADER = struct.Struct('<8sHHIqq')
+_RECORD = struct.Struct('<qBBHHI')
+_INDEX_ENTRY = struct.Struct('<qQ')
+_TRAILER = struct.Struct('<QQ8s')
+
+_FRAME_CMD_SEQ = struct.Struct('>HH')
+_FRAME_CMD_OFFSET = FRAME_PREFIX.size - _FRAME_CMD_SEQ.size  # 프레임 안의 cmd, sequence 위치
+
+
+class Direction(enum.IntEnum):
+    """캡처 레코드 방향"""
+    RX = 0      # 수신 프레임 (CRC 검증 통과)
+    TX = 1      # 송신 프레임
+    RX_RAW = 2  # 수신 원시 바이트 (프레임 단위 아님, cmd/sequence 는 0)
+
+
+class CaptureRecord(NamedTuple):
+    """캡처 레코드 하나. data 는 파일 mmap 을 가리키는 memoryview (리더를 닫은 뒤에도 쓰려면 bytes() 로 복사)"""
+    timestamp_ns: int  # time.monotonic_ns
+    direction: Direction
+    cmd: int
+    sequence: int
+    data: memoryview
+    offset: int  # 파일 내 레코드 위치
+
+
+class CaptureWriter:
+    """
+    송수신 프레임을 캡처 파일에 추가 기록하는 기록기.
+    write_*() 는 송신/수신 쓰레드에서 직접 호출되며 메모리 버퍼에 레코드를 덧붙이기만 하고,
+    디스크 쓰기는 별도 쓰레드가 FLUSH_INTERVAL 마다 수행하므로 시리얼 경로가 디스크를 기다리지 않습니다.
+    디스크가 따라가지 못해 버퍼가 MAX_BUFFER 를 넘으면 레코드를 버리고 dropped 로 집계합니다.
+    """
+    FLUSH_INTERVAL = 0.1        # 초
+    MAX_BUFFER = 16 * 1024 * 1024
+    INDEX_INTERVAL = 1024       # 인덱스 엔트리 간격 (레코드 수)
+
+    def __init__(self, path: str, raw_chunks: bool = False):
+        """
+        Args:
+            raw_chunks (bool): 수신 원시 바이트도 기록하는 캡처인지 여부 (헤더 플래그로 저장)
+        """
+        self.path = path
+        self.raw_chunks = raw_chunks
+        self._file = open(path, 'wb')
+        self.start_wall_ns = time.time_ns()
+        self.start_mono_ns = time.monotonic_ns()
+        flags = FLAG_RAW_CHUNKS if raw_chunks else 0
+        header = _HEADER.pack(CAPTURE_MAGIC, CAPTURE_VERSION, flags, _RECORD.size,
+                              self.start_wall_ns, self.start_mono_ns)
+        self._file.write(header)
+
+        self._lock = threading.Lock()
+        self._buffer = bytearray()
+        self._next_offset = len(header)  # 다음 레코드의 파일 오프셋
+        self._index: List[Tuple[int, int]] = []
+        self.records = 0
+        self.bytes_written = len(header)
+        self.dropped = 0
+        self._closed = False
+
+        self._wake = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name="CaptureWriter", daemon=True)
+        self._flusher.start()
+
+    def write(self, direction: Direction, cmd: int, sequence: int, data) -> bool:
+        """
+        레코드 하나를 추가합니다. (어느 쓰레드에서나 호출 가능)
+        Returns:
+            bool: 기록 여부 (닫혔거나 버퍼가 가득 차면 False)
+        """
+        size = _RECORD.size + len(data)
+        with self._lock:
+            if self._closed:
+                return False
+            if len(self._buffer) + size > self.MAX_BUFFER:
+                self.dropped += 1
+                return False
+            # 잠금 안에서 시각을 읽어 파일 내 레코드 순서와 시각 순서를 일치시킴
+            timestamp = time.monotonic_ns()
+            if self.records % self.INDEX_INTERVAL == 0:
+                self._index.append((timestamp, self._next_offset))
+            self._buffer += _RECORD.pack(timestamp, direction, 0, cmd, sequence, len(data))
+            self._buffer += data
+            self._next_offset += size
+            self.records += 1
+        return True
+
+    def write_frame(self, direction: Direction, frame) -> bool:
+        """완성된 프레임을 기록합니다. cmd, sequence 는 프레임 헤더에서 읽습니다."""
+        if len(frame) < FRAME_PREFIX.size:
+            return False
+        cmd, sequence = _FRAME_CMD_SEQ.unpack_from(frame, _FRAME_CMD_OFFSET)
+        return self.write(direction, cmd, sequence, frame)
+
+    # 시그널/탭 연결용
+    def on_tx_frame(self, packet: bytes) -> None:
+        """ComProtocol.data_sent (송신 쓰레드, DirectConnection)"""
+        self.write_frame(Direction.TX, packet)
+
+    def on_rx_frame(self, cmd: int, sequence: int, frame) -> None:
+        """ComProtocol.rxFrameTap (수신 쓰레드)"""
+        self.write(Direction.RX, cmd, sequence, frame)
+
+    def on_rx_chunk(self, data: bytes) -> None:
+        """SerialReaderThread.data_received (수신 쓰레드, DirectConnection)"""
+        self.write(Direction.RX_RAW, 0, 0, data)
+
+    def _flush_loop(self):
+        while not self._closed:
+            self._wake.wait(self.FLUSH_INTERVAL)
+            self._wake.clear()
+            self._flush()
+
+    def _flush(self):
+        with self._lock:
+            if not self._buffer:
+                return
+            buffer, self._buffer = self._buffer, bytearray()
+        try:
+            self._file.write(buffer)
+            self.bytes_written += len(buffer)
+        except (OSError, ValueError) as e:
+            logger.error("캡처 파일 쓰기 실패 (%s): %s", self.path, e)
+
+    def stats(self) -> dict:
+        """{'path', 'records', 'bytes', 'dropped', 'duration'}"""
+        return {
+            'path': self.path,
+            'records': self.records,
+            'bytes': self._next_offset,
+            'dropped': self.dropped,
+            'duration': (time.monotonic_ns() - self.start_mono_ns) / 1e9,
+        }
+
+    def close(self) -> None:
+        """남은 레코드를 쓰고 인덱스와 트레일러를 붙인 뒤 파일을 닫습니다."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._wake.set()
+        self._flusher.join()
+        self._flush()
+        index_offset = self._next_offset
+        for timestamp, offset in self._index:
+            self._file.write(_INDEX_ENTRY.pack(timestamp, offset))
+        self._file.write(_TRAILER.pack(index_offset, len(self._index), TRAILER_MAGIC))
+        self._file.close()
+        logger.info("캡처 종료: %s (%d 레코드, 버림 %d)", self.path, self.records, self.dropped)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CaptureReader:
+    """
+    캡처 파일 리더. 파일을 mmap 으로 열고 레코드 데이터를 복사 없이 memoryview 로 돌려줍니다.
+    트레일러의 인덱스로 시간 범위의 시작 위치를 바로 찾으며, 인덱스가 없는 파일(비정상 종료)도 읽을 수 있습니다.
+
+    사용 예:
+        with CaptureReader(path) as reader:
+            for record in reader.records(cmds={0x8010}, time_range=(t0, t1)):
+                ...
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        if size < _HEADER.size:
+            self._file.close()
+            raise ValueError(f"캡처 파일이 아닙니다: {path}")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        magic, version, flags, record_size, self.start_wall_ns, self.start_mono_ns = _HEADER.unpack_from(self._mmap, 0)
+        if magic != CAPTURE_MAGIC or version != CAPTURE_VERSION or record_size != _RECORD.size:
+            self.close()
+            raise ValueError(f"지원하지 않는 캡처 파일입니다: {path}")
+        self.has_raw_chunks = bool(flags & FLAG_RAW_CHUNKS)
+
+        self._records_start = _HEADER.size
+        self._records_end = size
+        self._index_times: List[int] = []
+        self._index_offsets: List[int] = []
+        self.indexed = False
+        if size >= _HEADER.size + _TRAILER.size:
+            index_offset, count, trailer_magic = _TRAILER.unpack_from(self._mmap, size - _TRAILER.size)
+            if (trailer_magic == TRAILER_MAGIC
+                    and index_offset + count * _INDEX_ENTRY.size + _TRAILER.size == size):
+                self._records_end = index_offset
+                for timestamp, offset in _INDEX_ENTRY.iter_unpack(self._view[index_offset:size - _TRAILER.size]):
+                    self._index_times.append(timestamp)
+                    self._index_offsets.append(offset)
+                self.indexed = True
+
+    def _start_offset(self, start_ns: Optional[int]) -> int:
+        """start_ns 이전의 가장 가까운 인덱스 위치 (없으면 첫 레코드)"""
+        if start_ns is None or not self._index_times:
+            return self._records_start
+        position = bisect.bisect_right(self._index_times, start_ns) - 1
+        return self._index_offsets[position] if position >= 0 else self._records_start
+
+    def records(self, directions: Optional[Iterable[Direction]] = None,
+                cmds: Optional[Iterable[int]] = None,
+                seq_range: Optional[Tuple[int, int]] = None,
+                time_range: Optional[Tuple[Optional[int], Optional[int]]] = None) -> Iterator[CaptureRecord]:
+        """
+        조건에 맞는 레코드를 기록 순서대로 반환합니다.
+        Args:
+            directions: 포함할 방향
+            cmds: 포함할 명령 ID
+            seq_range: (최소, 최대) 시퀀스 번호 (양 끝 포함)
+            time_range: (시작, 끝) timestamp_ns (양 끝 포함, None 이면 제한 없음)
+        """
+        directions = None if directions is None else frozenset(directions)
+        cmds = None if cmds is None else frozenset(cmds)
+        seq_lo, seq_hi = seq_range if seq_range is not None else (None, None)
+        start_ns, end_ns = time_range if time_range is not None else (None, None)
+
+        view = self._view
+        unpack = _RECORD.unpack_from
+        header_size = _RECORD.size
+        end = self._records_end
+        offset = self._start_offset(start_ns)
+        while offset + header_size <= end:
+            timestamp, direction, _, cmd, sequence, length = unpack(view, offset)
+            data_start = offset + header_size
+            data_end = data_start + length
+            if data_end > end:
+                break  # 기록 중 중단된 마지막 레코드
+            record_offset, offset = offset, data_end
+
+            if start_ns is not None and timestamp < start_ns:
+                continue
+            if end_ns is not None and timestamp > end_ns:
+                break  # 레코드는 시각 순으로 기록됨
+            if directions is not None and direction not in directions:
+                continue
+            if cmds is not None and cmd not in cmds:
+                continue
+            if seq_lo is not None and not (seq_lo <= sequence <= seq_hi):
+                continue
+            yield CaptureRecord(timestamp, Direction(direction), cmd, sequence,
+                                view[data_start:data_end], record_offset)
+
+    def __iter__(self) -> Iterator[CaptureRecord]:
+        return self.records()
+
+    def time_bounds(self) -> Optional[Tuple[int, int]]:
+        """(첫 레코드, 마지막 레코드) timestamp_ns, 레코드가 없으면 None"""
+        first = last = None
+        for record in self.records():
+            if first is None:
+                first = record.timestamp_ns
+            last = record.timestamp_ns
+        return None if first is None else (first, last)
+
+    def to_wall_time_ns(self, timestamp_ns: int) -> int:
+        """레코드 timestamp (monotonic) 를 Unix 시각 (ns) 으로 변환합니다."""
+        return self.start_wall_ns + (timestamp_ns - self.start_mono_ns)
+
+    def close(self) -> None:
+        """
+        파일을 닫습니다. 반환된 레코드의 data 를 아직 참조하고 있으면 mmap 은
+        그 참조가 사라질 때 해제됩니다.
+        """
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
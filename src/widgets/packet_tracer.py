@@ -0,0 +1,267 @@
+import collections
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+
+logger = logging.getLogger(__name__)
+
+# 수신 쓰레드 측 기록 단계 (FrameTrace 필드 순서와 동일)
+STAGE_READ = 'read'          # SerialReaderThread 가 바이트를 읽은 시각 (프레임의 마지막 바이트가 포함된 read)
+STAGE_FRAME = 'frame'        # 버퍼에서 완성된 프레임을 찾은 시각
+STAGE_CRC = 'crc'            # CRC 검증 완료
+STAGE_DISPATCH = 'dispatch'  # processCommand 진입 (packet_received 발생 직전)
+STAGE_HANDLED = 'handled'    # 명령 핸들러 완료
+# GUI 쓰레드 측 기록 단계
+STAGE_DELIVERED = 'delivered'  # 이 프레임의 시그널들이 GUI 쓰레드에서 처리되기 시작
+STAGE_UPDATED = 'updated'      # 이 프레임의 시그널에 연결된 슬롯이 모두 끝남 (화면 갱신 예약까지)
+STAGE_RENDERED = 'rendered'    # 슬롯이 예약한 RefreshScheduler 갱신(setText 등)이 실행됨
+
+_GUI_DELIVERED = 0
+_GUI_UPDATED = 1
+_GUI_RENDERED = 2
+
+# summary() 구간 (이름, 시작 단계, 끝 단계)
+SEGMENTS = (
+    ('read→frame', STAGE_READ, STAGE_FRAME),
+    ('frame→crc', STAGE_FRAME, STAGE_CRC),
+    ('crc→dispatch', STAGE_CRC, STAGE_DISPATCH),
+    ('handler', STAGE_DISPATCH, STAGE_HANDLED),
+    ('queue', STAGE_DISPATCH, STAGE_DELIVERED),
+    ('gui', STAGE_DELIVERED, STAGE_UPDATED),
+    ('refresh', STAGE_UPDATED, STAGE_RENDERED),
+    ('total', STAGE_READ, STAGE_RENDERED),  # 위젯 갱신을 예약한 프레임만
+)
+
+
+class FrameTrace(collections.namedtuple(
+        'FrameTrace', 'frame_id cmd sequence tid read frame crc dispatch handled')):
+    """수신 쓰레드에서 기록한 프레임 하나의 단계별 시각 (time.perf_counter_ns)"""
+    __slots__ = ()
+
+
+class PacketTracer(QObject):
+    """
+    수신 패킷 지연 추적기.
+    시리얼 read 부터 위젯 갱신까지 프레임마다 단계별 시각을 기록해 크기가 제한된 버퍼에 보관하고,
+    Chrome trace-event JSON (chrome://tracing, Perfetto) 으로 내보냅니다.
+
+    비활성 상태에서는 수신 경로에서 enabled 속성 확인만 추가되므로 항상 포함된 채로 배포합니다.
+    GUI 쓰레드 단계는 프레임 처리 전후에 큐잉 시그널(marker)을 보내 측정합니다.
+    같은 쓰레드에서 보낸 큐잉 시그널은 보낸 순서대로 처리되므로, 두 marker 사이에
+    해당 프레임의 시그널에 연결된 GUI 슬롯이 모두 실행됩니다.
+    슬롯은 위젯을 RefreshScheduler.post() 로 다음 화면 갱신 프레임에 갱신하므로, 두 marker 사이에
+    예약된 갱신이 실행된 시각을 rendered 단계로 따로 기록합니다. (이후의 화면 그리기는 포함하지 않음)
+
+    환경 변수 REMOTE_GUI_TRACE 가 '1' 이면 시작 시 활성화하고,
+    파일 경로이면 활성화와 함께 종료 시 그 경로로 내보냅니다. (save_requested_trace)
+    """
+    marker = Signal(int, int)  # (frame_id, _GUI_DELIVERED / _GUI_UPDATED), 수신 쓰레드 -> GUI 쓰레드
+
+    DEFAULT_CAPACITY = 10000  # 보관할 최근 프레임 수
+    ENV_VAR = 'REMOTE_GUI_TRACE'
+
+    _instance = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> 'PacketTracer':
+        """GUI 쓰레드에서 처음 호출해야 합니다. (marker 수신 객체가 생성한 쓰레드에 속함)"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        if PacketTracer._instance is not None:
+            raise Exception("PacketTracer는 싱글톤 클래스입니다. get_instance()를 사용하세요.")
+        super().__init__()
+        self.enabled = False  # 수신 경로에서 직접 확인하는 플래그
+        self._capacity = self.DEFAULT_CAPACITY
+        self._frames = collections.deque(maxlen=self._capacity)
+        self._gui = collections.deque(maxlen=self._capacity * 3)  # (frame_id, stage, ns)
+        self._ids = itertools.count(1)
+        self._gui_tid = None
+        self._delivering = None  # GUI 쓰레드에서 시그널을 처리 중인 프레임 (두 marker 사이)
+        self.marker.connect(self._on_marker)
+
+        value = os.environ.get(self.ENV_VAR, '')
+        self._export_path = value if value not in ('', '0', '1') else None
+        if value and value != '0':
+            self.set_enabled(True)
+
+    def set_enabled(self, enabled: bool, capacity: Optional[int] = None) -> None:
+        """
+        추적 활성화/비활성화. 활성화할 때 capacity 를 주면 버퍼 크기를 바꾸고 기존 기록을 지웁니다.
+        """
+        if enabled and capacity and capacity != self._capacity:
+            self._capacity = capacity
+            self._frames = collections.deque(maxlen=capacity)
+            self._gui = collections.deque(maxlen=capacity * 3)
+        self.enabled = enabled
+        logger.info("패킷 추적 %s", "활성화" if enabled else "비활성화")
+
+    def is_enabled(self) -> bool:
+        return self.enabled
+
+    def clear(self) -> None:
+        """기록을 모두 지웁니다."""
+        self._frames.clear()
+        self._gui.clear()
+
+    # --- 수신 쓰레드 ---
+
+    def next_frame_id(self) -> int:
+        return next(self._ids)
+
+    def record_frame(self, frame_id: int, cmd: int, sequence: int,
+                     read_ns: int, frame_ns: int, crc_ns: int, dispatch_ns: int, handled_ns: int) -> None:
+        """수신 쓰레드 단계 시각을 기록합니다. (deque.append 는 쓰레드 안전)"""
+        self._frames.append(FrameTrace(frame_id, cmd, sequence, threading.get_native_id(),
+                                       read_ns, frame_ns, crc_ns, dispatch_ns, handled_ns))
+
+    # --- GUI 쓰레드 ---
+
+    @Slot(int, int)
+    def _on_marker(self, frame_id: int, stage: int):
+        if self._gui_tid is None:
+            self._gui_tid = threading.get_native_id()
+        self._delivering = frame_id if stage == _GUI_DELIVERED else None
+        self._gui.append((frame_id, stage, time.perf_counter_ns()))
+
+    def delivering_frame_id(self) -> Optional[int]:
+        """GUI 쓰레드에서 지금 시그널을 처리 중인 프레임 id (추적 중이 아니거나 프레임 밖이면 None)"""
+        return self._delivering if self.enabled else None
+
+    def record_rendered(self, frame_ids) -> None:
+        """프레임들이 예약한 화면 갱신이 실행된 시각을 기록합니다. (RefreshScheduler 에서 호출)"""
+        ns = time.perf_counter_ns()
+        for frame_id in frame_ids:
+            self._gui.append((frame_id, _GUI_RENDERED, ns))
+
+    # --- 결과 ---
+
+    def get_frames(self) -> List[dict]:
+        """
+        기록된 프레임별 단계 시각 목록 (오래된 순).
+        Returns:
+            list: [{'frame_id', 'cmd', 'sequence', 'tid', 'read', ..., 'delivered', 'updated', 'rendered'}, ...]
+                  시각은 perf_counter_ns, GUI 단계가 아직 없으면 None
+                  (rendered 는 화면 갱신을 예약하지 않은 프레임이면 None)
+        """
+        gui: Dict[int, List[Optional[int]]] = {}
+        for frame_id, stage, ns in list(self._gui):
+            gui.setdefault(frame_id, [None, None, None])[stage] = ns
+        frames = []
+        for trace in list(self._frames):
+            record = trace._asdict()
+            delivered, updated, rendered = gui.get(trace.frame_id, (None, None, None))
+            record[STAGE_DELIVERED] = delivered
+            record[STAGE_UPDATED] = updated
+            record[STAGE_RENDERED] = rendered
+            frames.append(record)
+        return frames
+
+    def summary(self) -> Dict[str, dict]:
+        """
+        구간별 지연 통계 (µs).
+        Returns:
+            dict: {구간 이름: {'count', 'p50_us', 'p99_us', 'max_us'}} (SEGMENTS 참고)
+        """
+        frames = self.get_frames()
+        result = {}
+        for name, start, end in SEGMENTS:
+            values = sorted((f[end] - f[start]) / 1000.0 for f in frames
+                            if f[start] is not None and f[end] is not None)
+            if not values:
+                result[name] = {'count': 0, 'p50_us': None, 'p99_us': None, 'max_us': None}
+                continue
+            result[name] = {
+                'count': len(values),
+                'p50_us': values[(len(values) - 1) // 2],
+                'p99_us': values[min(len(values) - 1, int(len(values) * 0.99))],
+                'max_us': values[-1],
+            }
+        return result
+
+    def to_chrome_trace(self) -> dict:
+        """
+        Chrome trace-event 형식으로 변환합니다.
+        수신 쓰레드에는 프레임별 'rx' 구간(하위 crc/decode/handler), GUI 쓰레드에는 'gui' 구간을 두고
+        둘을 flow 화살표로 연결합니다. read→frame 대기 시간은 'rx' 구간의 args 에 기록합니다.
+        예약된 화면 갱신이 실행된 시각은 GUI 쓰레드의 'rendered' instant 이벤트로 표시합니다.
+        """
+        pid = os.getpid()
+        events = []
+        tids = set()
+        us = lambda ns: ns / 1000.0
+
+        def span(name, tid, start, end, args=None):
+            event = {'name': name, 'cat': 'serial', 'ph': 'X', 'pid': pid, 'tid': tid,
+                     'ts': us(start), 'dur': us(end - start)}
+            if args:
+                event['args'] = args
+            events.append(event)
+
+        for f in self.get_frames():
+            tid = f['tid']
+            tids.add(tid)
+            label = f"0x{f['cmd']:04X}"
+            span(f"rx {label}", tid, f[STAGE_FRAME], f[STAGE_HANDLED], {
+                'frame_id': f['frame_id'], 'sequence': f['sequence'],
+                'read_to_frame_us': us(f[STAGE_FRAME] - f[STAGE_READ]),
+            })
+            span('crc', tid, f[STAGE_FRAME], f[STAGE_CRC])
+            span('decode', tid, f[STAGE_CRC], f[STAGE_DISPATCH])
+            span('handler', tid, f[STAGE_DISPATCH], f[STAGE_HANDLED])
+
+            delivered, updated = f[STAGE_DELIVERED], f[STAGE_UPDATED]
+            if delivered is None or updated is None or self._gui_tid is None:
+                continue
+            rendered = f[STAGE_RENDERED]
+            span(f"gui {label}", self._gui_tid, delivered, updated, {
+                'frame_id': f['frame_id'],
+                'queue_us': us(delivered - f[STAGE_DISPATCH]),
+                'total_us': us((rendered or updated) - f[STAGE_READ]),
+            })
+            if rendered is not None:
+                events.append({'name': f"rendered {label}", 'cat': 'serial', 'ph': 'i', 's': 't', 'pid': pid,
+                               'tid': self._gui_tid, 'ts': us(rendered), 'args': {'frame_id': f['frame_id']}})
+            flow = {'name': 'signal', 'cat': 'serial', 'id': f['frame_id'], 'pid': pid}
+            events.append(dict(flow, ph='s', tid=tid, ts=us(f[STAGE_DISPATCH])))
+            events.append(dict(flow, ph='f', bp='e', tid=self._gui_tid, ts=us(delivered)))
+
+        names = {tid: 'SerialReaderThread' for tid in tids}
+        if self._gui_tid is not None:
+            names[self._gui_tid] = 'GUI'
+        for tid, name in names.items():
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, path: str) -> int:
+        """
+        기록을 Chrome trace-event JSON 파일로 저장합니다.
+        Returns:
+            int: 저장한 프레임 수
+        """
+        trace = self.to_chrome_trace()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(trace, f)
+        count = len(self._frames)
+        logger.info("패킷 추적 저장: %s (%d 프레임)", path, count)
+        return count
+
+    def save_requested_trace(self) -> None:
+        """REMOTE_GUI_TRACE 에 경로가 지정된 경우 그 경로로 내보냅니다. (종료 시 호출)"""
+        if self._export_path and self._frames:
+            try:
+                self.export_chrome_trace(self._export_path)
+            except OSError as e:
+                logger.warning("패킷 추적 저장 실패 (%s): %s", self._export_path, e)
@@ -0,0 +1,122 @@
+import os
+import re
+import sys
+import threading
+from typing import List, Optional, Tuple
+
+from PySide6.QtCore import QThread, Signal
+from serial.tools import list_ports
+
+
+PortInfo = Tuple[str, str]  # (장치 이름, 설명)
+
+# pyserial list_ports_linux 가 검사하는 장치 이름 접두어
+_LINUX_TTY_PREFIXES = ('ttyS', 'ttyUSB', 'ttyXRUSB', 'ttyACM', 'ttyAMA', 'rfcomm', 'ttyAP', 'ttyGS')
+
+_PORT_NUMBER_RE = re.compile(r'\d+')
+_COM_SUFFIX_RE = re.compile(r'\s*\(COM\d+\)')
+
+
+def _port_sort_key(port: PortInfo):
+    """포트 이름의 숫자(COM 번호 등) 기준 정렬 키"""
+    match = _PORT_NUMBER_RE.search(port[0])
+    return (int(match.group()) if match else float('inf'), port[0])
+
+
+def scan_ports() -> List[PortInfo]:
+    """시리얼 포트를 조회해 (장치, 설명) 목록을 번호 순으로 반환합니다. 설명의 (COMx) 는 제거합니다."""
+    ports = [(port.device, _COM_SUFFIX_RE.sub('', port.description).strip())
+             for port in list_ports.comports()]
+    return sorted(ports, key=_port_sort_key)
+
+
+def _linux_device_signature() -> Optional[frozenset]:
+    """
+    /dev 의 시리얼 장치 이름 집합. 값이 같으면 포트 구성이 바뀌지 않은 것으로 보고
+    (sysfs 를 읽는) comports() 호출을 생략합니다. Linux 가 아니면 None.
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        return frozenset(entry.name for entry in os.scandir('/dev')
+                         if entry.name.startswith(_LINUX_TTY_PREFIXES))
+    except OSError:
+        return None
+
+
+class PortWatcher(QThread):
+    """
+    백그라운드에서 시리얼 포트 목록을 주기적으로 확인하는 쓰레드.
+    정렬된 포트 목록을 캐시해 두고 GUI 쓰레드는 get_ports() 로 즉시 읽으며,
+    장치가 추가/제거되면 변경 시그널을 보냅니다.
+
+    Linux 에서는 /dev 의 장치 이름만 먼저 비교하고, 바뀐 경우에만 comports() 로 전체 정보를 다시 읽습니다.
+    """
+    ports_changed = Signal(list)  # 전체 포트 목록 [(장치, 설명), ...]
+    ports_added = Signal(list)    # 새로 나타난 장치 이름 목록
+    ports_removed = Signal(list)  # 사라진 장치 이름 목록
+
+    DEFAULT_INTERVAL = 1.0  # 초
+
+    def __init__(self, parent=None, interval: float = DEFAULT_INTERVAL):
+        super().__init__(parent)
+        self.interval = interval
+        self._ports: List[PortInfo] = []
+        self._ports_lock = threading.Lock()
+        self._scanned = threading.Event()  # 첫 조회 완료 여부
+        self._wake_event = threading.Event()
+        self._running = False
+        self._signature = None
+
+    def get_ports(self) -> List[PortInfo]:
+        """캐시된 포트 목록. 첫 조회가 끝나지 않았으면 잠시(최대 1초) 기다립니다."""
+        self._scanned.wait(1.0)
+        with self._ports_lock:
+            return list(self._ports)
+
+    def refresh(self) -> None:
+        """다음 주기를 기다리지 않고 포트 목록을 다시 조회합니다."""
+        self._signature = None  # 장치 이름이 같아도 설명까지 다시 읽음
+        self._wake_event.set()
+
+    def run(self):
+        self._running = True
+        while self._running:
+            self._wake_event.clear()
+            try:
+                self._poll()
+            except Exception:
+                # 조회 실패는 다음 주기에 재시도
+                pass
+            finally:
+                self._scanned.set()
+            self._wake_event.wait(self.interval)
+
+    def _poll(self):
+        signature = _linux_device_signature()
+        if signature is not None and signature == self._signature:
+            return
+        ports = scan_ports()
+        self._signature = signature
+
+        with self._ports_lock:
+            old_ports = self._ports
+            self._ports = ports
+        if ports == old_ports:
+            return
+
+        old_devices = {device for device, _ in old_ports}
+        new_devices = {device for device, _ in ports}
+        added = sorted(new_devices - old_devices)
+        removed = sorted(old_devices - new_devices)
+        self.ports_changed.emit(list(ports))
+        if added:
+            self.ports_added.emit(added)
+        if removed:
+            self.ports_removed.emit(removed)
+
+    def stop(self):
+        """쓰레드를 중지합니다."""
+        self._running = False
+        self._wake_event.set()
+        self.wait()
@@ -0,0 +1,81 @@
+import time
+from typing import Dict, Optional
+
+
+class ProtocolMetrics:
+    """
+    프로토콜 송수신 카운터.
+    수신 카운터는 수신 쓰레드, 송신 카운터는 송신 쓰레드만 증가시키므로 (카운터별 단일 쓰기)
+    잠금 없이 정수 속성을 직접 증가시키고, 다른 쓰레드는 snapshot() 으로 읽습니다.
+
+    수신:
+        rx_bytes            시리얼에서 읽은 바이트 수
+        rx_frames           CRC 검증을 통과한 프레임 수
+        rx_crc_errors       CRC 검증 실패 (길이 필드가 유효했던 후보 프레임)
+        rx_discarded_bytes  프레임 시작을 다시 찾는 동안 버린 바이트 수
+        rx_missing          시퀀스 번호가 건너뛴 개수 (누락 추정)
+        rx_out_of_order     기대보다 이전 시퀀스 번호로 늦게 도착한 프레임
+        rx_duplicates       직전 프레임과 같은 시퀀스 번호 (재전송 중복)
+    송신:
+        tx_bytes, tx_frames 시리얼에 쓴 바이트/프레임 수
+        tx_write_timeouts   쓰기 타임아웃 횟수 (재시도 포함)
+        tx_retries          타임아웃 후 같은 패킷을 다시 쓴 횟수
+        tx_failures         재시도 후에도 전송하지 못한 패킷 수
+    명령별:
+        rx_commands, tx_commands  {cmd: 프레임 수}
+    """
+    __slots__ = (
+        'rx_bytes', 'rx_frames', 'rx_crc_errors', 'rx_discarded_bytes',
+        'rx_missing', 'rx_out_of_order', 'rx_duplicates',
+        'tx_bytes', 'tx_frames', 'tx_write_timeouts', 'tx_retries', 'tx_failures',
+        'rx_commands', 'tx_commands', 'started_at',
+    )
+
+    COUNTERS = (
+        'rx_bytes', 'rx_frames', 'rx_crc_errors', 'rx_discarded_bytes',
+        'rx_missing', 'rx_out_of_order', 'rx_duplicates',
+        'tx_bytes', 'tx_frames', 'tx_write_timeouts', 'tx_retries', 'tx_failures',
+    )
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """모든 카운터를 0 으로 초기화합니다."""
+        for name in self.COUNTERS:
+            setattr(self, name, 0)
+        self.rx_commands: Dict[int, int] = {}
+        self.tx_commands: Dict[int, int] = {}
+        self.started_at = time.monotonic()
+
+    def snapshot(self) -> dict:
+        """
+        현재 카운터 값을 복사해 반환합니다.
+        Returns:
+            dict: {카운터 이름: 값, 'rx_commands': {...}, 'tx_commands': {...},
+                   'timestamp': time.monotonic(), 'uptime': 초기화 이후 경과 시간(초)}
+        """
+        now = time.monotonic()
+        snapshot = {name: getattr(self, name) for name in self.COUNTERS}
+        snapshot['rx_commands'] = dict(self.rx_commands)
+        snapshot['tx_commands'] = dict(self.tx_commands)
+        snapshot['timestamp'] = now
+        snapshot['uptime'] = now - self.started_at
+        return snapshot
+
+    @classmethod
+    def rates(cls, previous: Optional[dict], current: dict) -> Dict[str, float]:
+        """
+        두 snapshot 사이의 초당 증가량. previous 가 없거나 카운터가 줄었으면 (재연결, 초기화)
+        current 의 누적값을 uptime 으로 나눈 평균을 사용합니다.
+        Returns:
+            dict: {카운터 이름: 초당 값}
+        """
+        if previous is not None:
+            elapsed = current['timestamp'] - previous['timestamp']
+            if elapsed > 0 and all(current[name] >= previous[name] for name in cls.COUNTERS):
+                return {name: (current[name] - previous[name]) / elapsed for name in cls.COUNTERS}
+        elapsed = current['uptime']
+        if elapsed <= 0:
+            return {name: 0.0 for name in cls.COUNTERS}
+        return {name: current[name] / elapsed for name in cls.COUNTERS}
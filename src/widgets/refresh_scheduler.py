@@ -0,0 +1,105 @@
+import collections
+import time
+
+from PySide6.QtCore import QObject, QTimer, Qt
+
+from src.widgets.packet_tracer import PacketTracer
+
+
+class RefreshScheduler(QObject):
+    """
+    페이지 공용 화면 갱신 스케줄러.
+    같은 키로 여러 번 요청되면 마지막 값만 남기고(latest-wins), 설정된 최대 갱신률을 넘지 않도록
+    한 프레임에 모아서 반영합니다. 처리할 일이 없거나 일시정지(최소화 등) 상태이면 타이머가 멈춥니다.
+    """
+    DEFAULT_MAX_RATE_HZ = 30
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls) -> 'RefreshScheduler':
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, max_rate_hz: int = DEFAULT_MAX_RATE_HZ, parent=None):
+        super().__init__(parent)
+        self._pending = {}     # key -> (callback, args), 다음 프레임에 한 번 실행
+        self._animations = {}  # key -> callback, 매 프레임 실행
+        # 예약된 갱신을 요청한 수신 프레임 id (PacketTracer 활성 시, 일시정지 중에도 크기 제한)
+        self._traced_frames = collections.deque(maxlen=PacketTracer.DEFAULT_CAPACITY)
+        self._tracer = PacketTracer.get_instance()
+        self._paused = False
+        self._last_frame_time = 0.0
+        self._interval = 1.0 / max_rate_hz
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._run_frame)
+
+    def set_max_rate(self, max_rate_hz: int) -> None:
+        """최대 갱신률(Hz) 설정"""
+        self._interval = 1.0 / max(1, max_rate_hz)
+
+    def get_max_rate(self) -> float:
+        """현재 최대 갱신률(Hz)"""
+        return 1.0 / self._interval
+
+    def post(self, key: str, callback, *args) -> None:
+        """
+        다음 프레임에 callback(*args) 실행을 예약합니다.
+        같은 key 로 이미 예약된 요청이 있으면 새 값으로 교체됩니다.
+        """
+        self._pending[key] = (callback, args)
+        frame_id = self._tracer.delivering_frame_id()
+        if frame_id is not None and (not self._traced_frames or self._traced_frames[-1] != frame_id):
+            self._traced_frames.append(frame_id)
+        self._schedule()
+
+    def set_animation(self, key: str, callback) -> None:
+        """프레임마다 callback() 을 실행합니다. callback 이 None 이면 해제합니다."""
+        if callback is None:
+            self._animations.pop(key, None)
+        else:
+            self._animations[key] = callback
+            self._schedule()
+
+    def has_animation(self, key: str) -> bool:
+        return key in self._animations
+
+    def set_paused(self, paused: bool) -> None:
+        """일시정지 중에는 예약된 갱신을 보관만 하고 실행하지 않습니다."""
+        if self._paused == paused:
+            return
+        self._paused = paused
+        if paused:
+            self._timer.stop()
+        else:
+            self._schedule()
+
+    def is_paused(self) -> bool:
+        return self._paused
+
+    def _schedule(self) -> None:
+        """다음 프레임 타이머를 시작합니다. 최대 갱신률을 넘지 않도록 지연시킵니다."""
+        if self._paused or self._timer.isActive():
+            return
+        if not self._pending and not self._animations:
+            return
+        elapsed = time.monotonic() - self._last_frame_time
+        delay_ms = max(0, int((self._interval - elapsed) * 1000))
+        self._timer.start(delay_ms)
+
+    def _run_frame(self) -> None:
+        """예약된 갱신과 애니메이션을 실행합니다."""
+        self._last_frame_time = time.monotonic()
+        pending, self._pending = self._pending, {}
+        for callback, args in pending.values():
+            callback(*args)
+        if self._traced_frames:
+            self._tracer.record_rendered(self._traced_frames)
+            self._traced_frames.clear()
+        for callback in list(self._animations.values()):
+            callback()
+        self._schedule()
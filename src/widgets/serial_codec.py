@@ -0,0 +1,98 @@
+import struct
+import threading
+
+
+# 프레임 구성: [시작 마커 x4][길이 2][receiverId 2][senderId 2][cmd 2][sequence 2][payload N][CRC 2]
+# 길이 필드 = header(8) + payload + CRC(2), CRC 는 길이 필드 다음부터 payload 끝까지 계산
+START_MARKER = 0x16
+START_SEQUENCE_LENGTH = 4
+START_SEQUENCE = bytes([START_MARKER]) * START_SEQUENCE_LENGTH
+
+UINT16 = struct.Struct('>H')
+FRAME_HEADER = struct.Struct('>HHHH')      # receiverId, senderId, cmd, sequence
+FRAME_PREFIX = struct.Struct('>4sHHHHH')   # 시작 마커, 길이, receiverId, senderId, cmd, sequence
+
+LENGTH_FIELD_SIZE = UINT16.size
+HEADER_LENGTH = FRAME_HEADER.size
+CRC_LENGTH = UINT16.size
+CRC_OFFSET = START_SEQUENCE_LENGTH + LENGTH_FIELD_SIZE   # CRC 계산 시작 위치
+FRAME_OVERHEAD = FRAME_PREFIX.size + CRC_LENGTH          # payload 를 제외한 프레임 크기
+# 길이 필드 최대값. 수신 측은 시작 마커(0x16)가 길이 상위 바이트로 읽히는 값(0x16xx)을 재동기화에
+# 쓰므로 그보다 작아야 하며, 송신도 같은 한도를 지켜 자신이 해석하지 못하는 프레임을 만들지 않는다.
+MAX_PACKET_LENGTH = 0x15FF
+MAX_PAYLOAD_LENGTH = MAX_PACKET_LENGTH - HEADER_LENGTH - CRC_LENGTH
+
+
+class FrameEncoder:
+    """
+    미리 컴파일된 struct 와 재사용 버퍼를 이용한 프레임 인코더.
+    여러 쓰레드(GUI, 수신 쓰레드)에서 호출될 수 있으므로 내부 버퍼는 잠금으로 보호한다.
+    """
+
+    def __init__(self, crc16, initial_size: int = 256):
+        """
+        :param crc16: bytes-like object 를 받아 16비트 CRC 를 반환하는 함수
+        :param initial_size: 내부 버퍼 초기 크기 (필요 시 자동 확장)
+        """
+        self._crc16 = crc16
+        self._buffer = bytearray(initial_size)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def frame_size(payload_length: int) -> int:
+        """payload 길이에 대한 전체 프레임 크기"""
+        return FRAME_OVERHEAD + payload_length
+
+    def encode_into(self, buffer, offset: int, receiverId: int, senderId: int,
+                    cmd: int, sequence: int, data) -> int:
+        """
+        buffer[offset:] 에 프레임 하나를 기록한다.
+        :param buffer: 쓰기 가능한 버퍼 (frame_size(len(data)) 이상 남아 있어야 함)
+        :return: 기록한 프레임 바로 다음 위치
+        :raises ValueError: payload 가 MAX_PAYLOAD_LENGTH 를 넘는 경우
+        """
+        payload_length = len(data)
+        if payload_length > MAX_PAYLOAD_LENGTH:
+            raise ValueError(f"payload 가 너무 깁니다: {payload_length} bytes (최대 {MAX_PAYLOAD_LENGTH})")
+        payload_start = offset + FRAME_PREFIX.size
+        crc_end = payload_start + payload_length
+
+        FRAME_PREFIX.pack_into(buffer, offset, START_SEQUENCE,
+                               HEADER_LENGTH + payload_length + CRC_LENGTH,
+                               receiverId, senderId, cmd, sequence)
+        buffer[payload_start:crc_end] = data
+        with memoryview(buffer) as view:
+            crc = self._crc16(view[offset + CRC_OFFSET:crc_end])
+        UINT16.pack_into(buffer, crc_end, crc)
+        return crc_end + CRC_LENGTH
+
+    def encode(self, receiverId: int, senderId: int, cmd: int, sequence: int, data) -> bytes:
+        """프레임 하나를 인코딩하여 반환한다."""
+        size = FRAME_OVERHEAD + len(data)
+        with self._lock:
+            self._reserve(size)
+            self.encode_into(self._buffer, 0, receiverId, senderId, cmd, sequence, data)
+            with memoryview(self._buffer) as view:
+                return bytes(view[:size])
+
+    def encode_many(self, frames) -> bytes:
+        """
+        여러 프레임을 하나의 연속된 버퍼에 인코딩한다.
+        :param frames: (receiverId, senderId, cmd, sequence, data) 튜플 목록
+        :return: 모든 프레임이 이어 붙은 bytes
+        """
+        frames = list(frames)
+        size = sum(FRAME_OVERHEAD + len(frame[4]) for frame in frames)
+        with self._lock:
+            self._reserve(size)
+            offset = 0
+            for receiverId, senderId, cmd, sequence, data in frames:
+                offset = self.encode_into(self._buffer, offset, receiverId, senderId,
+                                          cmd, sequence, data)
+            with memoryview(self._buffer) as view:
+                return bytes(view[:offset])
+
+    def _reserve(self, size: int) -> None:
+        """내부 버퍼가 size 바이트 이상이 되도록 확장한다."""
+        if len(self._buffer) < size:
+            self._buffer = bytearray(max(size, len(self._buffer) * 2))
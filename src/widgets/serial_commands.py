@@ -1,3 +1,5 @@
+from concurrent.futures import Future
+from typing import Optional
 from PySide6.QtCore import QObject
 from src.serial_manager import SerialManager
 from src.widgets.serial_protocol import ComProtocol
@@ -67,4 +69,38 @@ class SerialCommands(QObject):
             return success
                 
         except Exception:
-            return False 
\ No newline at end of file
+            return False
+
+    def request_main_power_control(self, power_state: bool, callback=None) -> Optional[Future]:
+        """
+        메인 전원 제어 명령을 보내고 장치 응답을 기다리는 핸들을 반환
+        Args:
+            power_state (bool): True=켜기, False=끄기
+            callback (callable, optional): callback(future) - 응답/타임아웃 시 GUI 스레드에서 호출
+        Returns:
+            Optional[Future]: 응답 핸들 (연결되지 않은 경우 None)
+        """
+        return self.serial_manager.send_request(
+            receiverId=0x0001,  # 대상 장치 ID
+            senderId=0x0000,    # 호스트 ID
+            cmd=ComProtocol.CMD_MAIN_POWER_CONTROL,
+            data=bytes([1 if power_state else 0]),
+            callback=callback
+        )
+
+    def request_play_control(self, play_state: int, callback=None) -> Optional[Future]:
+        """
+        재생 제어 명령을 보내고 장치 응답을 기다리는 핸들을 반환
+        Args:
+            play_state (int): 재생 상태 (PLAY_ONE=1, PLAY_REPEAT=2, PAUSE=3, STOP=4)
+            callback (callable, optional): callback(future) - 응답/타임아웃 시 GUI 스레드에서 호출
+        Returns:
+            Optional[Future]: 응답 핸들 (연결되지 않은 경우 None)
+        """
+        return self.serial_manager.send_request(
+            receiverId=0x0001,  # 대상 장치 ID
+            senderId=0x0000,    # 호스트 ID
+            cmd=ComProtocol.CMD_PLAY_CONTROL,
+            data=bytes([play_state]),
+            callback=callback
+        )
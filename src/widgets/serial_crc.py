@@ -0,0 +1,156 @@
+import binascii
+import logging
+import os
+import time
+
+
+logger = logging.getLogger(__name__)
+
+# CRC16 XMODEM 테이블 (다항식 0x1021, 초기값 0x0000)
+CRC16_TABLE = [
+    0x0000, 0x1021, 0x2042, 0x3063, 0x4084, 0x50a5, 0x60c6, 0x70e7,
+    0x8108, 0x9129, 0xa14a, 0xb16b, 0xc18c, 0xd1ad, 0xe1ce, 0xf1ef,
+    0x1231, 0x0210, 0x3273, 0x2252, 0x52b5, 0x4294, 0x72f7, 0x62d6,
+    0x9339, 0x8318, 0xb37b, 0xa35a, 0xd3bd, 0xc39c, 0xf3ff, 0xe3de,
+    0x2462, 0x3443, 0x0420, 0x1401, 0x64e6, 0x74c7, 0x44a4, 0x5485,
+    0xa56a, 0xb54b, 0x8528, 0x9509, 0xe5ee, 0xf5cf, 0xc5ac, 0xd58d,
+    0x3653, 0x2672, 0x1611, 0x0630, 0x76d7, 0x66f6, 0x5695, 0x46b4,
+    0xb75b, 0xa77a, 0x9719, 0x8738, 0xf7df, 0xe7fe, 0xd79d, 0xc7bc,
+    0x48c4, 0x58e5, 0x6886, 0x78a7, 0x0840, 0x1861, 0x2802, 0x3823,
+    0xc9cc, 0xd9ed, 0xe98e, 0xf9af, 0x8948, 0x9969, 0xa90a, 0xb92b,
+    0x5af5, 0x4ad4, 0x7ab7, 0x6a96, 0x1a71, 0x0a50, 0x3a33, 0x2a12,
+    0xdbfd, 0xcbdc, 0xfbbf, 0xeb9e, 0x9b79, 0x8b58, 0xbb3b, 0xab1a,
+    0x6ca6, 0x7c87, 0x4ce4, 0x5cc5, 0x2c22, 0x3c03, 0x0c60, 0x1c41,
+    0xedae, 0xfd8f, 0xcdec, 0xddcd, 0xad2a, 0xbd0b, 0x8d68, 0x9d49,
+    0x7e97, 0x6eb6, 0x5ed5, 0x4ef4, 0x3e13, 0x2e32, 0x1e51, 0x0e70,
+    0xff9f, 0xefbe, 0xdfdd, 0xcffc, 0xbf1b, 0xaf3a, 0x9f59, 0x8f78,
+    0x9188, 0x81a9, 0xb1ca, 0xa1eb, 0xd10c, 0xc12d, 0xf14e, 0xe16f,
+    0x1080, 0x00a1, 0x30c2, 0x20e3, 0x5004, 0x4025, 0x7046, 0x6067,
+    0x83b9, 0x9398, 0xa3fb, 0xb3da, 0xc33d, 0xd31c, 0xe37f, 0xf35e,
+    0x02b1, 0x1290, 0x22f3, 0x32d2, 0x4235, 0x5214, 0x6277, 0x7256,
+    0xb5ea, 0xa5cb, 0x95a8, 0x8589, 0xf56e, 0xe54f, 0xd52c, 0xc50d,
+    0x34e2, 0x24c3, 0x14a0, 0x0481, 0x7466, 0x6447, 0x5424, 0x4405,
+    0xa7db, 0xb7fa, 0x8799, 0x97b8, 0xe75f, 0xf77e, 0xc71d, 0xd73c,
+    0x26d3, 0x36f2, 0x0691, 0x16b0, 0x6657, 0x7676, 0x4615, 0x5634,
+    0xd94c, 0xc96d, 0xf90e, 0xe92f, 0x99c8, 0x89e9, 0xb98a, 0xa9ab,
+    0x5844, 0x4865, 0x7806, 0x6827, 0x18c0, 0x08e1, 0x3882, 0x28a3,
+    0xcb7d, 0xdb5c, 0xeb3f, 0xfb1e, 0x8bf9, 0x9bd8, 0xabbb, 0xbb9a,
+    0x4a75, 0x5a54, 0x6a37, 0x7a16, 0x0af1, 0x1ad0, 0x2ab3, 0x3a92,
+    0xfd2e, 0xed0f, 0xdd6c, 0xcd4d, 0xbdaa, 0xad8b, 0x9de8, 0x8dc9,
+    0x7c26, 0x6c07, 0x5c64, 0x4c45, 0x3ca2, 0x2c83, 0x1ce0, 0x0cc1,
+    0xef1f, 0xff3e, 0xcf5d, 0xdf7c, 0xaf9b, 0xbfba, 0x8fd9, 0x9ff8,
+    0x6e17, 0x7e36, 0x4e55, 0x5e74, 0x2e93, 0x3eb2, 0x0ed1, 0x1ef0
+]
+
+# 표준 검증값: CRC16-XMODEM("123456789") == 0x31C3
+CRC16_CHECK_INPUT = b"123456789"
+CRC16_CHECK_VALUE = 0x31C3
+
+
+def crc16_table(data) -> int:
+    """
+    테이블을 사용한 순수 파이썬 CRC16-XMODEM 계산 (참조 구현)
+    :param data: bytes-like object
+    :return: 16비트 CRC 값 (정수)
+    """
+    crc = 0x0000  # XMODEM 초기값
+    table = CRC16_TABLE
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFF) ^ table[((crc >> 8) ^ byte) & 0xFF]
+    return crc
+
+
+def crc16_binascii(data) -> int:
+    """
+    표준 라이브러리 binascii.crc_hqx 를 사용한 CRC16-XMODEM 계산 (C 구현)
+    crc_hqx 는 동일한 다항식(0x1021)을 사용하며 초기값 0 을 주면 XMODEM 과 같다.
+    """
+    return binascii.crc_hqx(data, 0)
+
+
+# 이름 -> 계산 함수. 앞에 있을수록 동점일 때 우선한다.
+CRC16_BACKENDS = {
+    'binascii': crc16_binascii,
+    'table': crc16_table,
+}
+
+_selected_backend = None
+
+
+def register_crc16_backend(name: str, func) -> None:
+    """
+    CRC16 백엔드를 추가한다. 다음 select_crc16_backend() 호출부터 후보가 된다.
+    :param name: 백엔드 이름
+    :param func: bytes-like object 를 받아 16비트 CRC 를 반환하는 함수
+    """
+    global _selected_backend
+    CRC16_BACKENDS[name] = func
+    _selected_backend = None
+
+
+def verify_crc16_backend(func, samples: int = 8, max_length: int = 64) -> bool:
+    """
+    백엔드가 참조 구현과 같은 값을 내는지 검사한다. (시작 시 자체 검사용으로 가볍게 유지)
+    표준 검증값과 무작위 길이/내용의 페이로드를 함께 비교한다.
+    무작위 페이로드 전체 동등성은 tests/test_serial_crc.py 에서 확인한다.
+    """
+    try:
+        if func(CRC16_CHECK_INPUT) != CRC16_CHECK_VALUE:
+            return False
+        if func(b"") != 0:
+            return False
+        for _ in range(samples):
+            payload = os.urandom(int.from_bytes(os.urandom(2), 'big') % (max_length + 1))
+            if func(payload) != crc16_table(payload):
+                return False
+            # 수신 경로는 memoryview 슬라이스를 넘기므로 함께 확인
+            if func(memoryview(payload)[1:]) != crc16_table(payload[1:]):
+                return False
+    except Exception:
+        return False
+    return True
+
+
+def _measure(func, payload: bytes, rounds: int = 3) -> float:
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func(payload)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def select_crc16_backend():
+    """
+    검증을 통과한 백엔드 중 가장 빠른 것을 골라 반환한다.
+    :return: (백엔드 이름, 계산 함수)
+    """
+    global _selected_backend
+    payload = os.urandom(4096)
+    best = None
+    for name, func in CRC16_BACKENDS.items():
+        if not verify_crc16_backend(func):
+            logger.warning("CRC16 백엔드 '%s' 검증 실패, 제외합니다", name)
+            continue
+        elapsed = _measure(func, payload)
+        if best is None or elapsed < best[2]:
+            best = (name, func, elapsed)
+
+    if best is None:
+        # 참조 구현은 항상 사용 가능해야 한다
+        best = ('table', crc16_table, 0.0)
+
+    _selected_backend = (best[0], best[1])
+    logger.info("CRC16 백엔드 선택: %s", best[0])
+    return _selected_backend
+
+
+def get_crc16_backend():
+    """
+    현재 선택된 CRC16 백엔드를 반환한다. 처음 호출 시 자체 검사로 선택한다.
+    :return: (백엔드 이름, 계산 함수)
+    """
+    if _selected_backend is None:
+        return select_crc16_backend()
+    return _selected_backend
+
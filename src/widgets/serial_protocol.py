@@ -1,7 +1,19 @@
 import enum
+import logging
 import struct
 import time
-from PySide6.QtCore import QObject, Signal
+from concurrent.futures import Future
+from typing import NamedTuple, Optional
+from PySide6.QtCore import QObject, Signal, Slot
+from src.widgets.serial_crc import CRC16_TABLE, get_crc16_backend
+from src.widgets import serial_codec
+from src.widgets.serial_codec import FrameEncoder, FRAME_HEADER, UINT16
+from src.widgets.serial_requests import RequestTracker, SendFuture
+from src.widgets.protocol_metrics import ProtocolMetrics
+from src.widgets.packet_tracer import PacketTracer, _GUI_DELIVERED, _GUI_UPDATED
+
+
+logger = logging.getLogger(__name__)
 
 
 class FileTransferStage(enum.Enum):
@@ -18,14 +30,69 @@ class PlayControlState(enum.Enum):
     STOP = 0x04        # 정지
 
 
+class StatusSnapshot(NamedTuple):
+    """
+    상태 동기화 응답(STATUS_SYNC_ACK) 해석 결과.
+    페이로드 구성 (17바이트, big endian):
+        [0] 메인 전원  [1] 재생 상태  [2..4] 연속구동 시:분:초
+        [5..8] 현재/전체 회차  [9..12] 전압/전류 (x100)  [13..16] 모션 현재/종료 시간 (ms)
+    """
+    main_power: bool
+    play_state: Optional[PlayControlState]  # 알 수 없는 값이면 None
+    hours: int
+    minutes: int
+    seconds: int
+    current_count: int
+    total_count: int
+    voltage: int  # 0.01V 단위
+    current: int  # 0.01A 단위
+    motion_current: int  # ms
+    motion_end: int  # ms
+
+    @classmethod
+    def from_payload(cls, payload) -> Optional['StatusSnapshot']:
+        """페이로드를 해석한다. 길이가 부족하면 None 을 반환한다."""
+        if len(payload) < _STATUS_STRUCT.size:
+            return None
+        values = _STATUS_STRUCT.unpack_from(payload)
+        return cls._make((values[0], _PLAY_STATES.get(values[1])) + values[2:])
+
+
+_STATUS_STRUCT = struct.Struct('>?BBBBHHHHHH')
+_PLAY_STATES = {state.value: state for state in PlayControlState}
+
+
+class PacketEvent(NamedTuple):
+    """수신 쓰레드에서 해석이 끝난 패킷 (GUI 쓰레드로 전달되는 불변 객체)"""
+    senderId: int
+    receiverId: int
+    cmd: int
+    sequence: int
+    payload: bytes
+
+
 class ComProtocol(QObject):
+    """
+    패킷 송수신 프로토콜.
+    수신 처리(processReceivedData)와 핸들러는 SerialReaderThread 에서 호출되며,
+    아래 시그널들은 GUI 쓰레드의 수신 측으로 큐잉되어 전달된다.
+    """
     # 시그널 정의
     data_sent = Signal(bytes)  # 데이터 전송 시그널 추가
+    packet_received = Signal(object)  # CRC 검증을 통과한 패킷 (PacketEvent)
     main_power_status_changed = Signal(bool)  # 전원 상태 변경 시그널 추가
-    status_sync_changed = Signal(dict)  # 시간, 카운트, 전압/전류 정보를 딕셔너리로 전달
+    status_sync_changed = Signal(object)  # 상태 동기화 정보 (StatusSnapshot, 매 응답마다)
+    # 필드별 변경 시그널 (값이 실제로 바뀐 경우에만 발생)
+    status_power_changed = Signal(bool)  # 메인 전원
+    status_play_state_changed = Signal(object)  # 재생 상태 (PlayControlState 또는 None)
+    status_runtime_changed = Signal(int, int, int)  # 연속구동 시, 분, 초
+    status_count_changed = Signal(int, int)  # 현재 회차, 전체 회차
+    status_energy_changed = Signal(int, int)  # 전압, 전류 (x100)
+    status_motion_time_changed = Signal(int, int)  # 모션 현재 시간, 종료 시간 (ms)
     sync_success = Signal()  # 동기화 성공 시그널
     sync_failed = Signal()   # 동기화 실패 시그널
     play_control_status_changed = Signal(int)  # 재생 상태 변경 시그널
+    _session_sync_acked = Signal()  # 수신 쓰레드 -> GUI 쓰레드 (sync_timer 정리용)
 
     # 명령어 및 상수 정의
     # 네트워크 0x0000 ~ 0x00FF
@@ -57,47 +124,22 @@ class ComProtocol(QObject):
 
     START_MARKER = 0x16
     START_SEQUENCE_LENGTH = 4
+    START_SEQUENCE = bytes([START_MARKER]) * START_SEQUENCE_LENGTH
+    FRAME_PREFIX_LENGTH = START_SEQUENCE_LENGTH + 2  # 시작 마커 + 길이 필드
+    HEADER_LENGTH = 8  # receiverId, senderId, cmd, sequence
     CRC_LENGTH = 0x02
+    MIN_PACKET_LENGTH = HEADER_LENGTH + CRC_LENGTH
+    # 길이 필드 최대값 (0x15FF). 시작 마커(0x16)가 길이 상위 바이트로 읽히는 값(0x16xx)보다 작아야 함
+    MAX_PACKET_LENGTH = serial_codec.MAX_PACKET_LENGTH  # 송신(FrameEncoder)과 같은 한도
+    MAX_PAYLOAD_LENGTH = serial_codec.MAX_PAYLOAD_LENGTH
+    RX_COMPACT_THRESHOLD = 4096  # 소비된 영역이 이 크기를 넘으면 버퍼 앞부분을 잘라냄
     PACKET_TIMEOUT_MS = 100
 
     CRC16_INIT = 0xFFFF
     CRC16_POLY = 0x1021  # CCITT 다항식
 
-    # CRC16 XMODEM 테이블
-    CRC16_TABLE = [
-        0x0000, 0x1021, 0x2042, 0x3063, 0x4084, 0x50a5, 0x60c6, 0x70e7,
-        0x8108, 0x9129, 0xa14a, 0xb16b, 0xc18c, 0xd1ad, 0xe1ce, 0xf1ef,
-        0x1231, 0x0210, 0x3273, 0x2252, 0x52b5, 0x4294, 0x72f7, 0x62d6,
-        0x9339, 0x8318, 0xb37b, 0xa35a, 0xd3bd, 0xc39c, 0xf3ff, 0xe3de,
-        0x2462, 0x3443, 0x0420, 0x1401, 0x64e6, 0x74c7, 0x44a4, 0x5485,
-        0xa56a, 0xb54b, 0x8528, 0x9509, 0xe5ee, 0xf5cf, 0xc5ac, 0xd58d,
-        0x3653, 0x2672, 0x1611, 0x0630, 0x76d7, 0x66f6, 0x5695, 0x46b4,
-        0xb75b, 0xa77a, 0x9719, 0x8738, 0xf7df, 0xe7fe, 0xd79d, 0xc7bc,
-        0x48c4, 0x58e5, 0x6886, 0x78a7, 0x0840, 0x1861, 0x2802, 0x3823,
-        0xc9cc, 0xd9ed, 0xe98e, 0xf9af, 0x8948, 0x9969, 0xa90a, 0xb92b,
-        0x5af5, 0x4ad4, 0x7ab7, 0x6a96, 0x1a71, 0x0a50, 0x3a33, 0x2a12,
-        0xdbfd, 0xcbdc, 0xfbbf, 0xeb9e, 0x9b79, 0x8b58, 0xbb3b, 0xab1a,
-        0x6ca6, 0x7c87, 0x4ce4, 0x5cc5, 0x2c22, 0x3c03, 0x0c60, 0x1c41,
-        0xedae, 0xfd8f, 0xcdec, 0xddcd, 0xad2a, 0xbd0b, 0x8d68, 0x9d49,
-        0x7e97, 0x6eb6, 0x5ed5, 0x4ef4, 0x3e13, 0x2e32, 0x1e51, 0x0e70,
-        0xff9f, 0xefbe, 0xdfdd, 0xcffc, 0xbf1b, 0xaf3a, 0x9f59, 0x8f78,
-        0x9188, 0x81a9, 0xb1ca, 0xa1eb, 0xd10c, 0xc12d, 0xf14e, 0xe16f,
-        0x1080, 0x00a1, 0x30c2, 0x20e3, 0x5004, 0x4025, 0x7046, 0x6067,
-        0x83b9, 0x9398, 0xa3fb, 0xb3da, 0xc33d, 0xd31c, 0xe37f, 0xf35e,
-        0x02b1, 0x1290, 0x22f3, 0x32d2, 0x4235, 0x5214, 0x6277, 0x7256,
-        0xb5ea, 0xa5cb, 0x95a8, 0x8589, 0xf56e, 0xe54f, 0xd52c, 0xc50d,
-        0x34e2, 0x24c3, 0x14a0, 0x0481, 0x7466, 0x6447, 0x5424, 0x4405,
-        0xa7db, 0xb7fa, 0x8799, 0x97b8, 0xe75f, 0xf77e, 0xc71d, 0xd73c,
-        0x26d3, 0x36f2, 0x0691, 0x16b0, 0x6657, 0x7676, 0x4615, 0x5634,
-        0xd94c, 0xc96d, 0xf90e, 0xe92f, 0x99c8, 0x89e9, 0xb98a, 0xa9ab,
-        0x5844, 0x4865, 0x7806, 0x6827, 0x18c0, 0x08e1, 0x3882, 0x28a3,
-        0xcb7d, 0xdb5c, 0xeb3f, 0xfb1e, 0x8bf9, 0x9bd8, 0xabbb, 0xbb9a,
-        0x4a75, 0x5a54, 0x6a37, 0x7a16, 0x0af1, 0x1ad0, 0x2ab3, 0x3a92,
-        0xfd2e, 0xed0f, 0xdd6c, 0xcd4d, 0xbdaa, 0xad8b, 0x9de8, 0x8dc9,
-        0x7c26, 0x6c07, 0x5c64, 0x4c45, 0x3ca2, 0x2c83, 0x1ce0, 0x0cc1,
-        0xef1f, 0xff3e, 0xcf5d, 0xdf7c, 0xaf9b, 0xbfba, 0x8fd9, 0x9ff8,
-        0x6e17, 0x7e36, 0x4e55, 0x5e74, 0x2e93, 0x3eb2, 0x0ed1, 0x1ef0
-    ]
+    # CRC16 XMODEM 테이블 (참조 구현용, serial_crc 모듈과 동일)
+    CRC16_TABLE = CRC16_TABLE
 
     class ReceiveState(enum.Enum):
         WAIT_START = 0
@@ -128,6 +170,7 @@ class ComProtocol(QObject):
         super().__init__()  # QObject 초기화
         self.serial = serial
         self.tick = tick
+        self.txWriter = None  # 송신 전담 쓰레드 (attachWriter 로 설정)
 
         self.currentState = ComProtocol.ReceiveState.WAIT_START
         self.lastReceiveTime = 0
@@ -138,19 +181,28 @@ class ComProtocol(QObject):
         self.startSequenceCount = 0
 
         self.receiveBuffer = bytearray()  # 수신된 데이터 저장용 버퍼
+        self.receiveOffset = 0  # receiveBuffer 내 다음에 읽을 위치
 
         self.receivedCRC = 0
         self.calculatedCRC = 0
+        # 자체 검사를 통과한 가장 빠른 CRC16 백엔드 사용
+        self.crcBackendName, self._crc16 = get_crc16_backend()
+        self.frameEncoder = FrameEncoder(self._crc16)
         self.cmd = 0
 
         self.fileContext = ComProtocol.FileTransferContext()
 
+        # 마지막으로 수신한 상태 (필드별 변경 시그널 비교용)
+        self.lastStatus = None
+
         # 시퀀스 번호 관련 변수 추가
-        self.currentSequenceNumber = 0
+        self.currentSequenceNumber = 0  # 송신 쓰레드가 연결되면 해당 쓰레드만 변경
         self.expectedSequenceNumber = 0
-        self.missingPacketCount = 0
         self.SEQUENCE_JUMP_THRESHOLD = 3
 
+        # 송수신 카운터 (바이트/프레임, CRC 오류, 누락/순서 어긋남/중복, 쓰기 타임아웃 등)
+        self.metrics = ProtocolMetrics()
+
         # sync 관련 변수 추가
         self.sync_retry_count = 0
         self.sync_timer = None
@@ -158,162 +210,320 @@ class ComProtocol(QObject):
         self.SYNC_INTERVAL = 500  # ms
         self.waiting_for_sync = False
 
-    def buildPacket(self, receiverId, senderId, cmd, data):
-        packet = bytearray()
-
-        # 시작 마커 추가
-        for _ in range(ComProtocol.START_SEQUENCE_LENGTH):
-            packet.append(ComProtocol.START_MARKER)
+        # sync_timer 는 GUI 쓰레드 소유이므로 응답 처리는 큐잉된 슬롯에서 수행
+        self._session_sync_acked.connect(self._on_session_sync_acked)
+
+        # 요청/응답 연결 테이블 (cmd -> 응답 대기 중인 요청, RTT 기반 제한 시간)
+        self.requests = RequestTracker()
+
+        # 수신 지연 추적 (비활성 시 프레임마다 enabled 확인만 수행)
+        self.tracer = PacketTracer.get_instance()
+        self.traceReadNs = 0  # 마지막 read 시각 (perf_counter_ns, 추적 중일 때만 갱신)
+
+        # 수신 프레임 탭 (패킷 캡처용): rxFrameTap(cmd, sequence, frame) 을 수신 쓰레드에서 호출
+        # frame 은 수신 버퍼를 가리키는 memoryview 이므로 호출 안에서 복사해야 함
+        self.rxFrameTap = None
+
+        # 명령 핸들러 테이블 (cmd -> handler(senderId, payload))
+        self.commandHandlers = {}
+        # 명령별 통계 (cmd -> [처리 횟수, 누적 처리 시간(ns)])
+        self.commandStats = {}
+        self._registerDefaultHandlers()
+
+    @property
+    def missingPacketCount(self) -> int:
+        """시퀀스 번호로 추정한 누락 패킷 수 (metrics.rx_missing)"""
+        return self.metrics.rx_missing
+
+    @property
+    def crcErrorCount(self) -> int:
+        """CRC 검증 실패 횟수 (metrics.rx_crc_errors)"""
+        return self.metrics.rx_crc_errors
+
+    @property
+    def rxFrameCount(self) -> int:
+        """CRC 검증을 통과해 처리한 프레임 수 (metrics.rx_frames)"""
+        return self.metrics.rx_frames
+
+    def get_metrics(self) -> dict:
+        """송수신 카운터 snapshot (ProtocolMetrics.snapshot 참고)"""
+        return self.metrics.snapshot()
+
+    def _registerDefaultHandlers(self):
+        """기본 명령 핸들러 등록"""
+        self.register_handler(ComProtocol.CMD_PING, self.handlePing)
+        self.register_handler(ComProtocol.CMD_FILE_RECEIVE, self.handleFileReceive)
+        self.register_handler(ComProtocol.CMD_CONFIG, self.handleConfig)
+        self.register_handler(ComProtocol.CMD_STATUS_SYNC, self.handleStatusSyncAck, ack=True)
+        self.register_handler(ComProtocol.CMD_MAIN_POWER_CONTROL, self.handleMainPowerControlAck, ack=True)
+        self.register_handler(ComProtocol.CMD_PLAY_CONTROL, self.handlePlayControlAck, ack=True)
+        self.register_handler(ComProtocol.CMD_SESSION_SYNC, self.handleSessionSync)
+        self.register_handler(ComProtocol.CMD_SESSION_SYNC, self.handleSessionSyncAck, ack=True)
+
+    def register_handler(self, cmd: int, handler, ack: bool = False) -> None:
+        """
+        명령 핸들러를 등록한다. 같은 cmd 에 이미 등록된 핸들러는 교체된다.
+        :param cmd: 명령어 ID
+        :param handler: handler(senderId, payload) 형태의 호출 가능 객체
+        :param ack: True 이면 cmd | CMD_ACK_BIT (응답 패킷)에 등록
+        """
+        if ack:
+            cmd |= ComProtocol.CMD_ACK_BIT
+        self.commandHandlers[cmd] = handler
+
+    def unregister_handler(self, cmd: int, ack: bool = False) -> None:
+        """등록된 명령 핸들러를 제거한다. 이후 해당 cmd 는 handleUnknownCommand 로 전달된다."""
+        if ack:
+            cmd |= ComProtocol.CMD_ACK_BIT
+        self.commandHandlers.pop(cmd, None)
+
+    def get_command_stats(self) -> dict:
+        """
+        명령별 처리 통계를 반환한다.
+        :return: {cmd: {'count': 처리 횟수, 'total_ms': 누적 처리 시간, 'avg_us': 평균 처리 시간}}
+        """
+        stats = {}
+        for cmd, (count, total_ns) in list(self.commandStats.items()):
+            stats[cmd] = {
+                'count': count,
+                'total_ms': total_ns / 1e6,
+                'avg_us': (total_ns / count / 1e3) if count else 0.0,
+            }
+        return stats
 
-        # 총 길이 = header(8) + payload + CRC(2)
-        length = 8 + len(data) + 2
-        packet.extend(struct.pack('>H', length))
-        
-        # 헤더에 시퀀스 번호 추가
-        packet.extend(struct.pack('>H', receiverId))
-        packet.extend(struct.pack('>H', senderId))
-        packet.extend(struct.pack('>H', cmd))
-        packet.extend(struct.pack('>H', self.currentSequenceNumber))
-        packet.extend(data)
-
-        # CRC 계산 및 추가
-        crc_start = ComProtocol.START_SEQUENCE_LENGTH + 2
-        crc_data = packet[crc_start:crc_start + 8 + len(data)]
-        crc = self.calculateCRC16(crc_data, len(crc_data))
-        packet.extend(struct.pack('>H', crc))
+    def buildPacket(self, receiverId, senderId, cmd, data):
+        """
+        패킷 하나를 구성하고 시퀀스 번호를 증가시킨다.
+        :return: 전송할 프레임 (bytes)
+        """
+        packet = self.frameEncoder.encode(receiverId, senderId, cmd, self.currentSequenceNumber, data)
 
         # 시퀀스 번호 증가
         self.currentSequenceNumber = (self.currentSequenceNumber + 1) & 0xFFFF
 
         return packet
 
+    def buildPackets(self, packets):
+        """
+        여러 패킷을 하나의 연속된 버퍼로 구성한다. 시퀀스 번호는 순서대로 부여된다.
+        :param packets: (receiverId, senderId, cmd, data) 튜플 목록
+        :return: 모든 프레임이 이어 붙은 bytes
+        """
+        frames = []
+        for receiverId, senderId, cmd, data in packets:
+            frames.append((receiverId, senderId, cmd, self.currentSequenceNumber, data))
+            self.currentSequenceNumber = (self.currentSequenceNumber + 1) & 0xFFFF
+        return self.frameEncoder.encode_many(frames)
+
+    def attachWriter(self, writer):
+        """
+        송신 전담 쓰레드를 연결한다. 연결 후 sendData 는 큐에 넣고 즉시 반환하며,
+        시퀀스 번호 부여와 시리얼 쓰기는 해당 쓰레드에서만 이루어진다.
+        :param writer: submit(receiverId, senderId, cmd, data) 를 제공하는 객체 (None 이면 해제)
+        """
+        self.txWriter = writer
+
     def sendData(self, receiverId, senderId, cmd, data):
         """
         데이터를 패킷으로 구성하여 시리얼 인터페이스로 전송한다.
+        송신 쓰레드가 연결되어 있으면 전송을 예약하고 완료 핸들(Future)을 반환한다.
+        """
+        if self.txWriter is not None:
+            return self.txWriter.submit(receiverId, senderId, cmd, data)
+        return self.writeFrame(receiverId, senderId, cmd, data)
+
+    def request(self, receiverId, senderId, cmd, data, timeout=None):
+        """
+        요청 패킷을 보내고 응답(cmd | CMD_ACK_BIT)을 기다리는 핸들을 반환한다.
+        같은 명령의 요청은 보낸 순서대로 응답과 짝지어지며, 제한 시간은 측정된 RTT 로 정해진다.
+        :param timeout: 응답 제한 시간(초), 기본값은 RTT 기반 RTO
+        :return: Future - 응답 PacketEvent, 타임아웃 시 RequestTimeoutError
+        """
+        pending = self.requests.register(cmd, timeout)
+        write_start_ns = time.monotonic_ns()
+        try:
+            result = self.sendData(receiverId, senderId, cmd, data)
+        except Exception as e:
+            result = Future()
+            result.set_exception(e)
+        if result is not None and not isinstance(result, Future):
+            # 송신 쓰레드 없이 직접 쓴 경우: 쓰기 시각을 기록한 완료 핸들로 감싼다
+            written, result = result, SendFuture()
+            result.write_start_ns = write_start_ns
+            result.sent_ns = time.monotonic_ns()
+            result.set_result(written)
+        return self.requests.attach(pending, result)
+
+    def writeFrame(self, receiverId, senderId, cmd, data):
+        """
+        패킷을 구성하여 시리얼 인터페이스에 직접 쓴다.
+        :return: 쓴 바이트 수
+        """
+        return self.writePacket(self.buildPacket(receiverId, senderId, cmd, data))
+
+    def writePacket(self, packet):
+        """
+        구성된 패킷을 시리얼 인터페이스에 쓴다. (송신 쓰레드에서 재시도 시 같은 패킷을 다시 사용)
+        :return: 쓴 바이트 수
         """
-        packet = self.buildPacket(receiverId, senderId, cmd, data)
         result = self.serial.write(packet)
 
-        #print(f"[TX] Sequence: {self.currentSequenceNumber-1}, CMD: 0x{cmd:04X}")  # 현재 전송된 패킷의 시퀀스 번호
-        
         if result > 0:
+            metrics = self.metrics
+            metrics.tx_bytes += result
+            metrics.tx_frames += 1
+            cmd = UINT16.unpack_from(packet, ComProtocol.FRAME_PREFIX_LENGTH + 4)[0]
+            metrics.tx_commands[cmd] = metrics.tx_commands.get(cmd, 0) + 1
             self.data_sent.emit(packet)
         return result
 
-    def receiveData(self, data):
+    def receiveData(self, data, read_ns=0):
         """
         시리얼 인터페이스에서 읽어온 데이터를 내부 버퍼에 추가한다.
         :param data: bytes-like object
-        """
+        :param read_ns: 데이터를 읽은 시각 (perf_counter_ns, 패킷 추적용, 0 이면 지금)
+        """
+        if self.tracer.enabled:
+            self.traceReadNs = read_ns or time.perf_counter_ns()
+        self.metrics.rx_bytes += len(data)
+        if self.receiveOffset and self.receiveOffset >= len(self.receiveBuffer):
+            # 이전 데이터를 모두 소비했다면 복사 없이 버퍼를 비운다
+            self.receiveBuffer.clear()
+            self.receiveOffset = 0
         self.receiveBuffer.extend(data)
 
     def isDataAvailable(self):
         """
-        수신 버퍼에 데이터가 있는지 여부 반환.
+        수신 버퍼에 아직 처리되지 않은 데이터가 있는지 여부 반환.
         """
-        return len(self.receiveBuffer) > 0
+        return len(self.receiveBuffer) > self.receiveOffset
 
     def processReceivedData(self):
         """
-        내부 버퍼에 쌓인 데이터를 상태 머신에 따라 하나 이상의 패킷 단위로 처리한다.
-        실제 구현에서는 부분적으로 수신된 패킷 처리 등 보다 정교한 로직이 필요함.
-        """
-        # 충분한 데이터가 있을 때까지 반복 처리
-        while len(self.receiveBuffer) >= (ComProtocol.START_SEQUENCE_LENGTH + 2):
-            # 시작 마커 확인
-            expected_start = bytes([ComProtocol.START_MARKER]) * ComProtocol.START_SEQUENCE_LENGTH
-            if self.receiveBuffer[:ComProtocol.START_SEQUENCE_LENGTH] != expected_start:
-                # 시작 마커가 아닌 경우 한 바이트씩 제거하며 동기화
-                self.receiveBuffer.pop(0)
-                continue
-
-            # 시작 마커 다음 2바이트에서 길이 필드를 확인
-            if len(self.receiveBuffer) < ComProtocol.START_SEQUENCE_LENGTH + 2:
-                break  # 아직 길이 정보가 완전히 수신되지 않음
-
-            length_bytes = self.receiveBuffer[ComProtocol.START_SEQUENCE_LENGTH:
-                                              ComProtocol.START_SEQUENCE_LENGTH + 2]
-            packet_length = struct.unpack('>H', length_bytes)[0]
-            total_packet_length = ComProtocol.START_SEQUENCE_LENGTH + packet_length
-
-            print(f"packet_length: {packet_length}, total_packet_length: {total_packet_length}")
-
-            if len(self.receiveBuffer) < total_packet_length + ComProtocol.CRC_LENGTH:
-                break  # 전체 패킷 수신 전
-
-            # 패킷 추출
-            packet = self.receiveBuffer[:total_packet_length + ComProtocol.CRC_LENGTH]
-            #del self.receiveBuffer[:total_packet_length + ComProtocol.CRC_LENGTH]  # CRC 길이를 포함하여 삭제
-            # 250212 버그 수정 : 버퍼 완전 비우기
-            del self.receiveBuffer[:]
-
-            # 패킷 파싱
-            offset = ComProtocol.START_SEQUENCE_LENGTH + 2
-            receiverId = struct.unpack('>H', packet[offset:offset + 2])[0]
-            offset += 2
-            senderId = struct.unpack('>H', packet[offset:offset + 2])[0]
-            offset += 2
-            cmd = struct.unpack('>H', packet[offset:offset + 2])[0]
-            offset += 2
-            seq = struct.unpack('>H', packet[offset:offset + 2])[0]
-            offset += 2
-            
-            #print(f"[RX] Received Sequence: {seq}, CMD: 0x{cmd:04X}")  # 수신된 패킷의 시퀀스 번호
-
-            # payload 길이 계산
-            payload_length = packet_length - 10
-            payload = packet[offset:offset + payload_length]
-            offset += payload_length
-
-            if cmd == ComProtocol.CMD_SESSION_SYNC:
-                if len(payload) >= 6:
-                    authToken = struct.unpack('>H', payload[4:6])[0]
-                    if authToken == 0xABCD:
-                        # print(f"[SYNC] Resetting sequence number (current: {self.expectedSequenceNumber} -> 0)")
-                        self.expectedSequenceNumber = 0
-            else:
-                diff = (seq - self.expectedSequenceNumber) & 0xFFFF
-                if diff == 0:
-                    # print(f"[SEQ] Sequence match: {seq}")
-                    self.expectedSequenceNumber = (self.expectedSequenceNumber + 1) & 0xFFFF
-                elif diff > 0 and diff <= self.SEQUENCE_JUMP_THRESHOLD:
-                    # print(f"[SEQ] Missing {diff} packets")
-                    self.missingPacketCount += diff
-                    self.expectedSequenceNumber = (seq + 1) & 0xFFFF
-                elif diff > 0:
-                    # print(f"[SEQ] Large sequence jump: {diff} packets")
-                    self.missingPacketCount += diff
-                    self.expectedSequenceNumber = (seq + 1) & 0xFFFF
-                else:
-                    # print(f"[SEQ] Old sequence number received: {seq}")
+        내부 버퍼에 쌓인 완성된 패킷을 모두 처리한다.
+        버퍼 앞부분을 매번 지우지 않고 읽기 오프셋만 전진시키며,
+        소비된 영역은 RX_COMPACT_THRESHOLD 를 넘을 때만 잘라낸다.
+        :return: 처리한 패킷 수
+        """
+        buffer = self.receiveBuffer
+        end = len(buffer)
+        offset = self.receiveOffset
+        processed = 0
+        metrics = self.metrics
+        tracer = self.tracer
+        tracing = tracer.enabled
+
+        with memoryview(buffer) as view:
+            while end - offset >= ComProtocol.FRAME_PREFIX_LENGTH:
+                # 시작 마커 탐색 (바이트 단위 pop 대신 한 번에 검색)
+                start = buffer.find(ComProtocol.START_SEQUENCE, offset)
+                if start < 0:
+                    # 마커 일부가 버퍼 끝에 걸쳐 있을 수 있으므로 마지막 몇 바이트는 남긴다
+                    keep_from = max(offset, end - (ComProtocol.START_SEQUENCE_LENGTH - 1))
+                    metrics.rx_discarded_bytes += keep_from - offset
+                    offset = keep_from
+                    break
+                # 0x16 이 4개보다 길게 이어지면 마지막 4바이트를 시작 마커로 본다
+                # (잡음 뒤에 바로 프레임이 오는 경우, 길이 상위 바이트가 0x16 인 프레임은 없음)
+                marker_end = start + ComProtocol.START_SEQUENCE_LENGTH
+                while marker_end < end and buffer[marker_end] == ComProtocol.START_MARKER:
+                    marker_end += 1
+                start = marker_end - ComProtocol.START_SEQUENCE_LENGTH
+                if start != offset:
+                    metrics.rx_discarded_bytes += start - offset
+                offset = start
+                if end - offset < ComProtocol.FRAME_PREFIX_LENGTH:
+                    break  # 아직 길이 정보가 완전히 수신되지 않음
+
+                # 길이 필드 = header(8) + payload + CRC(2)
+                packet_length = UINT16.unpack_from(buffer, offset + ComProtocol.START_SEQUENCE_LENGTH)[0]
+                if not ComProtocol.MIN_PACKET_LENGTH <= packet_length <= ComProtocol.MAX_PACKET_LENGTH:
+                    # 잘못된 마커였을 수 있으므로 한 바이트만 건너뛰고 재탐색
+                    # (큰 길이 값을 믿고 기다리면 뒤따르는 정상 프레임까지 막힘)
+                    offset += 1
+                    metrics.rx_discarded_bytes += 1
                     continue
 
-            # CRC 검증을 위한 데이터 준비
-            crc_start = ComProtocol.START_SEQUENCE_LENGTH +2
-            crc_end = offset  # CRC 필드 직전까지
-            
-            # 패킷 내용을 hex 형식으로 출력
-            #print("수신된 패킷 (hex):", " ".join([f"{b:02x}" for b in packet]))
-            if crc_end <= crc_start:
-                # 유효하지 않은 패킷 길이
-                continue
-                
-            crc_data = packet[crc_start:crc_end]
-
-            #print("crc_data 패킷 (hex):", " ".join([f"{b:02x}" for b in crc_data]))
-            
-            try:
-                received_crc = struct.unpack('>H', packet[offset:offset + 2])[0]
-            except struct.error:
-                continue
-
-            # CRC 계산 및 검증
-            calculated_crc = self.calculateCRC16(crc_data, len(crc_data))
-            if calculated_crc != received_crc:
-                continue
-
-            # 명령 처리
-            self.processCommand(senderId, receiverId, cmd, payload, payload_length)
+                frame_end = offset + ComProtocol.FRAME_PREFIX_LENGTH + packet_length
+                if frame_end > end:
+                    break  # 전체 패킷 수신 전
+                if tracing:
+                    frame_ns = time.perf_counter_ns()
+
+                # CRC 검증 (길이 필드 다음부터 CRC 필드 직전까지)
+                crc_start = offset + ComProtocol.FRAME_PREFIX_LENGTH
+                crc_end = frame_end - ComProtocol.CRC_LENGTH
+                received_crc = UINT16.unpack_from(buffer, crc_end)[0]
+                calculated_crc = self.calculateCRC16(view[crc_start:crc_end], crc_end - crc_start)
+                if calculated_crc != received_crc:
+                    metrics.rx_crc_errors += 1
+                    metrics.rx_discarded_bytes += 1
+                    offset += 1
+                    continue
+                if tracing:
+                    crc_ns = time.perf_counter_ns()
+
+                # 패킷 파싱
+                receiverId, senderId, cmd, seq = FRAME_HEADER.unpack_from(buffer, crc_start)
+                payload_length = packet_length - ComProtocol.MIN_PACKET_LENGTH
+                payload = bytes(view[crc_start + ComProtocol.HEADER_LENGTH:crc_end])
+
+                rx_tap = self.rxFrameTap
+                if rx_tap is not None:
+                    rx_tap(cmd, seq, view[offset:frame_end])
+
+                # 핸들러에서 예외가 나더라도 같은 패킷을 다시 처리하지 않도록 먼저 전진
+                offset = frame_end
+                self.receiveOffset = offset
+
+                if cmd == ComProtocol.CMD_SESSION_SYNC:
+                    if len(payload) >= 6:
+                        authToken = struct.unpack('>H', payload[4:6])[0]
+                        if authToken == 0xABCD:
+                            self.expectedSequenceNumber = 0
+                else:
+                    diff = (seq - self.expectedSequenceNumber) & 0xFFFF
+                    if diff == 0:
+                        self.expectedSequenceNumber = (self.expectedSequenceNumber + 1) & 0xFFFF
+                    elif diff < 0x8000:
+                        # 앞으로 건너뜀: 사이의 패킷이 누락됨
+                        metrics.rx_missing += diff
+                        self.expectedSequenceNumber = (seq + 1) & 0xFFFF
+                    elif diff == 0xFFFF:
+                        # 직전 프레임과 같은 번호: 재전송 중복 (기대 번호 유지)
+                        metrics.rx_duplicates += 1
+                    else:
+                        # 이미 지나간 번호: 늦게 도착한 프레임 (기대 번호 유지)
+                        metrics.rx_out_of_order += 1
+
+                # 명령 처리 (응답 패킷은 기다리던 요청을 먼저 완료)
+                event = PacketEvent(senderId, receiverId, cmd, seq, payload)
+                if tracing:
+                    # GUI 쪽 marker 는 이 프레임의 시그널 앞뒤로 큐잉되어 같은 순서로 처리됨
+                    frame_id = tracer.next_frame_id()
+                    dispatch_ns = time.perf_counter_ns()
+                    tracer.marker.emit(frame_id, _GUI_DELIVERED)
+                if cmd & ComProtocol.CMD_ACK_BIT:
+                    self.requests.resolve(cmd & ~ComProtocol.CMD_ACK_BIT, event)
+                self.packet_received.emit(event)
+                self.processCommand(senderId, receiverId, cmd, payload, payload_length)
+                metrics.rx_frames += 1
+                metrics.rx_commands[cmd] = metrics.rx_commands.get(cmd, 0) + 1
+                if tracing:
+                    tracer.record_frame(frame_id, cmd, seq, self.traceReadNs or frame_ns,
+                                        frame_ns, crc_ns, dispatch_ns, time.perf_counter_ns())
+                    tracer.marker.emit(frame_id, _GUI_UPDATED)
+                processed += 1
+
+        self.receiveOffset = offset
+        if offset >= len(buffer):
+            buffer.clear()
+            self.receiveOffset = 0
+        elif offset >= ComProtocol.RX_COMPACT_THRESHOLD:
+            del buffer[:offset]
+            self.receiveOffset = 0
+
+        return processed
 
     def sendPing(self, targetId):
         """
@@ -326,7 +536,7 @@ class ComProtocol(QObject):
         """
         ping 요청에 대한 기본 처리 (기본값: PONG 응답 전송).
         """
-        print("ping 요청 수신")
+        logger.debug("ping 요청 수신 (senderId=0x%04X)", senderId)
         self.sendData(senderId, 0, ComProtocol.CMD_PONG, payload)
 
 
@@ -344,79 +554,47 @@ class ComProtocol(QObject):
     
     def handleStatusSyncAck(self, senderId, payload):
         """상태 동기화 응답 처리"""
-        if len(payload) < 15:  # 페이로드 길이 체크 (기존 11바이트 + 모션시간 4바이트)
+        snapshot = StatusSnapshot.from_payload(payload)
+        if snapshot is None:
+            logger.warning("Status sync payload too short: %d bytes", len(payload))
             return
 
-        try:
-            # 상태 플레그 파싱
-            main_power_status = bool(payload[0])   
-            # PlayControlState 열거형으로 해석
-            try:
-                play_state = PlayControlState(payload[1])
-                motion_play_status = play_state.name  # 열거형 이름을 문자열로 변환 (예: "PLAY_ONE", "PLAY_REPEAT" 등)
-            except ValueError:
-                motion_play_status = "UNKNOWN"  # 알 수 없는 상태값인 경우            
-
-            # 시간 정보 파싱
-            hours = payload[2]
-            minutes = payload[3]
-            seconds = payload[4]
-
-            # 동작 회차 정보 파싱
-            current_count = struct.unpack('>H', payload[5:7])[0]
-            total_count = struct.unpack('>H', payload[7:9])[0]
-
-            # 에너지 정보 파싱
-            voltage = struct.unpack('>H', payload[9:11])[0]
-            current = struct.unpack('>H', payload[11:13])[0]
-
-            # 모션 시간 정보 파싱 추가
-            motion_current = struct.unpack('>H', payload[13:15])[0]
-            motion_end = struct.unpack('>H', payload[15:17])[0]
-
-            # 데이터를 딕셔너리로 구성
-            status_data = {
-                'main_power': {
-                    'status': main_power_status
-                },
-                'motion': {
-                    'status': motion_play_status,
-                    'current': motion_current,
-                    'end': motion_end
-                },
-                'time': {
-                    'hours': hours,
-                    'minutes': minutes,
-                    'seconds': seconds
-                },
-                'count': {
-                    'current': current_count,
-                    'total': total_count
-                },
-                'power': {
-                    'voltage': voltage,
-                    'current': current
-                }
-            }
-
-            # 시그널 발생
-            self.status_sync_changed.emit(status_data)
-
-        except Exception as e:
-            print(f"Status sync data parsing error: {e}")
+        # 시그널 발생
+        self.status_sync_changed.emit(snapshot)
+        self._emitStatusChanges(self.lastStatus, snapshot)
+        self.lastStatus = snapshot
+
+    def _emitStatusChanges(self, previous, current):
+        """이전 상태와 비교하여 바뀐 필드의 시그널만 발생시킨다. (previous 가 None 이면 전부)"""
+        if previous is None or previous.main_power != current.main_power:
+            self.status_power_changed.emit(current.main_power)
+        if previous is None or previous.play_state is not current.play_state:
+            self.status_play_state_changed.emit(current.play_state)
+        if (previous is None or previous.hours != current.hours
+                or previous.minutes != current.minutes or previous.seconds != current.seconds):
+            self.status_runtime_changed.emit(current.hours, current.minutes, current.seconds)
+        if (previous is None or previous.current_count != current.current_count
+                or previous.total_count != current.total_count):
+            self.status_count_changed.emit(current.current_count, current.total_count)
+        if previous is None or previous.voltage != current.voltage or previous.current != current.current:
+            self.status_energy_changed.emit(current.voltage, current.current)
+        if (previous is None or previous.motion_current != current.motion_current
+                or previous.motion_end != current.motion_end):
+            self.status_motion_time_changed.emit(current.motion_current, current.motion_end)
 
     def handleMainPowerControlAck(self, senderId, payload):
         """메인 전원 제어 응답 처리"""
 
         if len(payload) >= 1:
             power_status = bool(payload[0])
+            # lastStatus 는 sync 프레임으로만 갱신 (다음 sync 가 같은 값이어도 상태 시그널이 나가도록)
             self.main_power_status_changed.emit(power_status)    
 
     def handleUnknownCommand(self, cmd):
         """
         알 수 없는 명령을 수신한 경우의 처리 (필요시 재정의).
         """
-        pass
+        logger.debug("알 수 없는 명령 수신: 0x%04X", cmd)
 
 
     def handleFileReceive(self, senderId, payload):
@@ -425,6 +603,29 @@ class ComProtocol(QObject):
         """
         pass
 
+    def handleSessionSync(self, senderId, payload):
+        """세션 동기화 요청 처리 (장치 측에서 시작한 경우)"""
+        if len(payload) >= 6:
+            authToken = struct.unpack('>H', payload[4:6])[0]
+            if authToken == 0xABCD:
+                self.expectedSequenceNumber = 0
+                logger.info("동기화 성공: 시퀀스 번호 초기화")
+        else:
+            logger.warning("잘못된 동기화 패킷 (%d bytes)", len(payload))
+
+    def handleSessionSyncAck(self, senderId, payload):
+        """세션 동기화 응답 처리"""
+        self._session_sync_acked.emit()
+
+    @Slot()
+    def _on_session_sync_acked(self):
+        """세션 동기화 응답 후처리 (GUI 쓰레드)"""
+        if self.waiting_for_sync:
+            self.sync_timer.stop()
+            self.waiting_for_sync = False
+            self.sync_success.emit()
+            logger.info("동기화 성공")
+
     def handlePlayControlAck(self, senderId, payload):
         """재생 제어 응답 처리"""
         if len(payload) >= 1:
@@ -435,55 +636,34 @@ class ComProtocol(QObject):
 
     def calculateCRC16(self, data, length):
         """
-        테이블을 사용한 CRC16-XMODEM 계산
+        CRC16-XMODEM 계산 (선택된 백엔드 사용, 기본값은 binascii.crc_hqx)
         :param data: bytes-like object
         :param length: 계산할 데이터 길이
         :return: 16비트 CRC 값 (정수)
         """
-        crc = 0x0000  # XMODEM 초기값
-        
-        for i in range(length):
-            crc = ((crc << 8) & 0xFFFF) ^ self.CRC16_TABLE[((crc >> 8) ^ data[i]) & 0xFF]
-            #crc = ((crc >> 8) & 0xFFFF) ^ self.CRC16_TABLE[((crc & 0xFF) ^ data[i]) & 0xFF]
-            
-        return crc
+        if length != len(data):
+            data = memoryview(data)[:length]
+        return self._crc16(data)
 
     # cmd 분류류
     def processCommand(self, senderId, receiverId, cmd, payload, payloadLength):
         """
-        수신한 패킷의 명령어(cmd)에 따라 적절한 핸들러로 전달한다.
-        """
-        if cmd == ComProtocol.CMD_PING:
-            self.handlePing(senderId, payload)
-        elif cmd == ComProtocol.CMD_FILE_RECEIVE:
-            self.handleFileReceive(senderId, payload)
-        elif cmd == ComProtocol.CMD_CONFIG:
-            self.handleConfig(senderId, payload)
-        elif cmd == ComProtocol.CMD_STATUS_SYNC_ACK:
-            self.handleStatusSyncAck(senderId, payload)
-        elif cmd == ComProtocol.CMD_MAIN_POWER_CONTROL_ACK:
-            self.handleMainPowerControlAck(senderId, payload)
-        elif cmd == ComProtocol.CMD_PLAY_CONTROL_ACK:
-            self.handlePlayControlAck(senderId, payload)
-        elif cmd == ComProtocol.CMD_SESSION_SYNC:
-            if len(payload) >= 6:
-                timestamp = struct.unpack('>I', payload[0:4])[0]
-                authToken = struct.unpack('>H', payload[4:6])[0]
-                if authToken == 0xABCD:
-                    self.expectedSequenceNumber = 0
-                    print("동기화 성공: 시퀀스 번호 초기화")
-            else:
-                print("잘못된 동기화 패킷")
-        elif cmd == ComProtocol.CMD_SESSION_SYNC_ACK:
-            if self.waiting_for_sync:
-                self.sync_timer.stop()
-                self.waiting_for_sync = False
-                self.sync_success.emit()
-                print("동기화 성공")
-        else:
+        수신한 패킷의 명령어(cmd)에 따라 등록된 핸들러로 전달한다.
+        """
+        handler = self.commandHandlers.get(cmd)
+        if handler is None:
             self.handleUnknownCommand(cmd)
+            return
 
-
+        start = time.perf_counter_ns()
+        try:
+            handler(senderId, payload)
+        finally:
+            stats = self.commandStats.get(cmd)
+            if stats is None:
+                stats = self.commandStats[cmd] = [0, 0]
+            stats[0] += 1
+            stats[1] += time.perf_counter_ns() - start
 
     def resetFileTransferContext(self):
         """
@@ -1,35 +1,166 @@
 from PySide6.QtCore import QThread, Signal
 from threading import Lock  # threading에서 Lock import
+import logging
+import os
+import selectors
 import time
 import serial
 from serial.serialutil import SerialException
 
 
+logger = logging.getLogger(__name__)
+
+
 class SerialReaderThread(QThread):
     """
     시리얼 포트에서 데이터를 읽어오는 별도 쓰레드.
-    수신된 데이터를 data_received 시그널을 통해 전달합니다.
+    프레임 분리, CRC 검증, 페이로드 해석까지 이 쓰레드에서 수행하며,
+    GUI 쓰레드로는 ComProtocol 의 해석된 이벤트 시그널만 전달됩니다.
+    원시 바이트(data_received)는 set_raw_tap_enabled(True) 인 경우에만 전달합니다.
+
+    읽기 방식(read_mode):
+        'select'   : 포트 fd 에 selectors 로 대기 (Linux 등 POSIX)
+        'blocking' : 짧은 타임아웃의 블로킹 read (Windows 등 fd 가 없는 경우)
+        'poll'     : in_waiting 을 1ms 간격으로 확인 (기존 방식, 폴백용)
+        'auto'     : 가능하면 'select', 아니면 'blocking'
     """
-    data_received = Signal(bytes)
+    data_received = Signal(bytes)  # 원시 수신 바이트 (opt-in)
+    rx_activity = Signal()  # 수신 표시용, RX_ACTIVITY_INTERVAL 마다 최대 1회
     error_occurred = Signal(str)
     connection_lost = Signal()
 
-    def __init__(self, serial_port, parent=None):
+    READ_MODE_AUTO = 'auto'
+    READ_MODE_SELECT = 'select'
+    READ_MODE_BLOCKING = 'blocking'
+    READ_MODE_POLL = 'poll'
+
+    IDLE_WAIT_TIMEOUT = 0.1         # 수신이 없을 때 최대 대기 시간 (초, 중지 요청 확인 주기)
+    BLOCKING_READ_TIMEOUT = 0.02    # 'blocking' 모드 read 타임아웃 (초)
+    RX_ACTIVITY_INTERVAL = 0.05     # rx_activity 시그널 최소 간격 (초)
+
+    # 연결 끊김으로 판단하는 예외 메시지 (소문자, 플랫폼별)
+    DISCONNECT_ERROR_KEYWORDS = (
+        'disconnected', 'access denied', 'access is denied',
+        'input/output error', 'no such device', 'bad file descriptor',
+    )
+
+    def __init__(self, serial_port, parent=None, read_mode: str = READ_MODE_AUTO, protocol=None):
         super().__init__(parent)
         self.serial_port = serial_port
+        self.protocol = protocol
+        self._raw_tap_enabled = False
+        self._last_rx_activity = 0.0
+        self._read_mode = self._resolve_read_mode(read_mode)
+        self._selector = None
         self._running = True
         self._sync_enabled = False
         self._sync_interval = 1000
         self._last_sync_time = 0
         self._error_reported = False
         self._sync_lock = Lock()
+        self._cpu_time = 0.0  # 이 쓰레드의 누적 CPU 시간 (초), 루프마다 갱신
         
         # parent 객체 유효성 검증 추가
         if parent is None or not hasattr(parent, 'protocol'):
             raise ValueError("Invalid parent object")
+        if self.protocol is None:
+            self.protocol = parent.protocol
+
+    def _is_disconnect_error(self, error: Exception) -> bool:
+        """예외가 포트 연결 끊김(장치 제거 등)을 의미하는지 여부"""
+        message = str(error).lower()
+        return any(keyword in message for keyword in self.DISCONNECT_ERROR_KEYWORDS)
+
+    def _resolve_read_mode(self, read_mode: str) -> str:
+        """요청된 읽기 방식을 현재 포트/플랫폼에서 사용 가능한 방식으로 결정합니다."""
+        if read_mode == self.READ_MODE_AUTO:
+            read_mode = self.READ_MODE_SELECT if os.name == 'posix' else self.READ_MODE_BLOCKING
+        if read_mode == self.READ_MODE_SELECT:
+            try:
+                self.serial_port.fileno()
+            except Exception:
+                read_mode = self.READ_MODE_BLOCKING
+        return read_mode
+
+    def get_read_mode(self) -> str:
+        """실제 사용 중인 읽기 방식을 반환합니다."""
+        return self._read_mode
+
+    def _setup_read_mode(self):
+        """읽기 방식에 맞게 포트/셀렉터를 준비합니다. 실패 시 'poll' 로 폴백합니다."""
+        try:
+            if self._read_mode == self.READ_MODE_SELECT:
+                self._selector = selectors.DefaultSelector()
+                self._selector.register(self.serial_port.fileno(), selectors.EVENT_READ)
+            elif self._read_mode == self.READ_MODE_BLOCKING:
+                self.serial_port.timeout = self.BLOCKING_READ_TIMEOUT
+        except Exception:
+            self._close_selector()
+            self._read_mode = self.READ_MODE_POLL
+
+    def _close_selector(self):
+        if self._selector is not None:
+            try:
+                self._selector.close()
+            except Exception:
+                pass
+            self._selector = None
+
+    def _wait_timeout(self) -> float:
+        """다음 sync 전송 시점, 가장 이른 응답 제한 시각까지 남은 시간과 IDLE_WAIT_TIMEOUT 중 작은 값 (초)"""
+        timeout = self.IDLE_WAIT_TIMEOUT
+        if self._sync_enabled:
+            remaining = (self._last_sync_time + self._sync_interval) / 1000 - time.time()
+            timeout = min(max(remaining, 0.0), timeout)
+        deadline = self.protocol.requests.next_deadline() if self.protocol else None
+        if deadline is not None:
+            timeout = min(max(deadline - time.monotonic(), 0.0), timeout)
+        return timeout
+
+    def _read_available(self) -> bytes:
+        """읽기 방식에 따라 데이터가 올 때까지 대기한 뒤 수신된 바이트를 반환합니다."""
+        if self._read_mode == self.READ_MODE_SELECT:
+            if not self._selector.select(self._wait_timeout()):
+                return b''
+            # 읽기 가능 상태인데 대기 바이트가 0이면 read 에서 연결 끊김 예외가 발생함
+            return self.serial_port.read(self.serial_port.in_waiting or 1)
+
+        if self._read_mode == self.READ_MODE_BLOCKING:
+            data = self.serial_port.read(1)
+            if data:
+                bytes_waiting = self.serial_port.in_waiting
+                if bytes_waiting:
+                    data += self.serial_port.read(bytes_waiting)
+            return data
+
+        bytes_waiting = self.serial_port.in_waiting
+        if bytes_waiting:
+            return self.serial_port.read(bytes_waiting)
+        return b''
+
+    def _handle_data(self, data: bytes):
+        """수신 데이터를 이 쓰레드에서 바로 프레임 단위로 해석합니다."""
+        read_ns = time.perf_counter_ns() if self.protocol and self.protocol.tracer.enabled else 0
+        if self._raw_tap_enabled:
+            self.data_received.emit(data)
+
+        now = time.monotonic()
+        if now - self._last_rx_activity >= self.RX_ACTIVITY_INTERVAL:
+            self._last_rx_activity = now
+            self.rx_activity.emit()
+
+        if self.protocol:
+            self.protocol.receiveData(data, read_ns)
+            self.protocol.processReceivedData()
+
+    def set_raw_tap_enabled(self, enabled: bool):
+        """원시 수신 바이트(data_received) 전달 여부 설정"""
+        self._raw_tap_enabled = enabled
 
     def run(self):
+        self._setup_read_mode()
         while self._running:
+            self._cpu_time = time.thread_time()
             try:
                 if not self.serial_port or not self.serial_port.is_open:
                     if not self._error_reported:
@@ -39,49 +170,52 @@ class SerialReaderThread(QThread):
 
                 # 먼저 데이터 수신 처리
                 try:
-                    bytes_waiting = self.serial_port.in_waiting
-                    if bytes_waiting:
-                        data = self.serial_port.read(bytes_waiting)
-                        self.data_received.emit(data)
+                    data = self._read_available()
+                    if data:
+                        self._handle_data(data)
                 except serial.SerialTimeoutException:
                     # 타임아웃은 무시
                     pass
                 except serial.SerialException as e:
                     # 실제 연결 문제는 상위로 전파
                     raise e
-                except:
-                    # 기타 예외는 무시
-                    pass
+                except OSError as e:
+                    # 장치가 사라진 뒤의 ioctl/read 실패 (EIO 등)도 연결 끊김으로 처리
+                    if self._is_disconnect_error(e):
+                        raise serial.SerialException(str(e))
+                    logger.debug("읽기 오류 (무시): %s", e)
+                except Exception:
+                    # 기타 예외(핸들러 오류 등)는 기록하고 계속 수신
+                    logger.exception("수신 데이터 처리 오류")
+
+                # 응답 제한 시간이 지난 요청 처리
+                if self.protocol:
+                    self.protocol.requests.check_timeouts()
 
                 # Sync 패킷 전송 처리 - 실패시 무시
                 if self._sync_enabled:
                     current_time = time.time() * 1000
-                    #print(f"Current time: {current_time}, Last sync: {self._last_sync_time}, Interval: {self._sync_interval}")
                     if current_time - self._last_sync_time >= self._sync_interval:
                         try:
                             with self._sync_lock:
                                 serial_manager = self.parent()
-                                #print(f"Serial manager: {serial_manager}, Protocol: {serial_manager.protocol if serial_manager else None}")
                                 if serial_manager and serial_manager.protocol:
-                                    #print("Attempting to send sync packet...")
                                     serial_manager.protocol.send_sync_packet(0x0001, 0x0000)
-                                    #print("Sync packet sent successfully")
                         except serial.SerialTimeoutException as e:
-                            #print(f"Timeout error: {str(e)}")
-                            pass
+                            logger.debug("sync 전송 타임아웃: %s", e)
                         except serial.SerialException as e:
-                            #print(f"Serial error: {str(e)}")
-                            if "disconnected" in str(e).lower() or "access denied" in str(e).lower():
+                            logger.debug("sync 전송 오류: %s", e)
+                            if self._is_disconnect_error(e):
                                 raise e
                         except Exception as e:
-                            #print(f"Unexpected error during sync: {str(e)}")
-                            pass
+                            logger.warning("sync 전송 중 예상치 못한 오류: %s", e)
                         finally:
                             self._last_sync_time = current_time
 
             except serial.SerialException as e:
                 # 실제 연결 끊김 상황만 처리
-                if "disconnected" in str(e).lower() or "access denied" in str(e).lower():
+                if self._is_disconnect_error(e):
+                    logger.info("시리얼 포트 연결 끊김: %s", e)
                     if not self._error_reported:
                         self.error_occurred.emit("시리얼 포트 연결이 끊어졌습니다.")
                         self.connection_lost.emit()
@@ -91,23 +225,30 @@ class SerialReaderThread(QThread):
                     # 다른 시리얼 예외는 무시하고 계속 진행
                     continue
             except Exception as e:
-                #print(f"예상치 못한 예외 발생: {str(e)}")
+                logger.exception("수신 쓰레드 예외: %s", e)
                 continue
-            
-            self.msleep(1)
+
+            if self._read_mode == self.READ_MODE_POLL:
+                self.msleep(1)
 
         self._cleanup()
+        self._cpu_time = time.thread_time()
 
     def _cleanup(self):
         """리소스 정리"""
         self._running = False
         self._error_reported = False
+        self._close_selector()
         if self.serial_port and self.serial_port.is_open:
             try:
                 self.serial_port.close()
             except:
                 pass
 
+    def get_cpu_time(self) -> float:
+        """이 쓰레드가 사용한 누적 CPU 시간(초)을 반환합니다."""
+        return self._cpu_time
+
     def stop(self):
         """쓰레드를 중지합니다."""
         self._running = False
@@ -0,0 +1,324 @@
+import collections
+import threading
+import time
+from concurrent.futures import CancelledError, Future
+from typing import Dict, Optional
+
+
+class RequestTimeoutError(TimeoutError):
+    """요청에 대한 응답(ACK)이 제한 시간 안에 오지 않음"""
+
+    def __init__(self, cmd: int, timeout: float):
+        super().__init__(f"응답 없음 (CMD 0x{cmd:04X}, {timeout * 1000:.0f}ms)")
+        self.cmd = cmd
+        self.timeout = timeout
+
+
+class RttEstimator:
+    """
+    왕복 시간(RTT) 추정기 (RFC 6298 방식).
+    SRTT/RTTVAR 를 지수 이동 평균으로 갱신하고 RTO = SRTT + 4 * RTTVAR 를 응답 제한 시간으로 사용합니다.
+    시간 단위는 모두 초입니다.
+    """
+    ALPHA = 1 / 8
+    BETA = 1 / 4
+    K = 4
+
+    INITIAL_RTO = 1.0  # 측정값이 없을 때의 제한 시간
+    MIN_RTO = 0.2
+    MAX_RTO = 3.0
+
+    def __init__(self):
+        self.srtt: Optional[float] = None
+        self.rttvar: Optional[float] = None
+        self.last_rtt: Optional[float] = None
+        self.samples = 0
+        self._rto = self.INITIAL_RTO
+
+    def update(self, rtt: float) -> None:
+        """측정한 RTT 로 추정값을 갱신합니다."""
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = (1 - self.BETA) * self.rttvar + self.BETA * abs(self.srtt - rtt)
+            self.srtt = (1 - self.ALPHA) * self.srtt + self.ALPHA * rtt
+        self.last_rtt = rtt
+        self.samples += 1
+        self._rto = min(self.MAX_RTO, max(self.MIN_RTO, self.srtt + self.K * self.rttvar))
+
+    def backoff(self) -> None:
+        """응답 타임아웃 시 제한 시간을 2배로 늘립니다. (다음 측정값으로 다시 계산됨)"""
+        self._rto = min(self.MAX_RTO, self._rto * 2)
+
+    def rto(self) -> float:
+        """현재 응답 제한 시간 (초)"""
+        return self._rto
+
+    def snapshot(self) -> dict:
+        """현재 추정값 (ms 단위)"""
+        to_ms = lambda v: None if v is None else v * 1000.0
+        return {
+            'srtt_ms': to_ms(self.srtt),
+            'rttvar_ms': to_ms(self.rttvar),
+            'last_rtt_ms': to_ms(self.last_rtt),
+            'rto_ms': self._rto * 1000.0,
+            'samples': self.samples,
+        }
+
+
+class SendFuture(Future):
+    """
+    송신 완료 핸들. 송신 쓰레드가 쓰기 시작/완료 시각을 Future 를 완료하기 전에 기록합니다.
+    응답이 송신 완료 콜백보다 먼저 처리되어도 RequestTracker 가 이 시각으로 RTT 를 계산합니다.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.write_start_ns: Optional[int] = None  # time.monotonic_ns, 마지막 쓰기 시도 시작
+        self.sent_ns: Optional[int] = None         # time.monotonic_ns, 쓰기 완료
+
+
+def _send_time_ns(sent, received_ns: Optional[int] = None) -> Optional[int]:
+    """
+    송신 핸들에 기록된 쓰기 완료 시각. 쓰기가 끝나기 전에 응답이 도착했으면 쓰기 시작 시각.
+    (일반 Future 이거나 아직 쓰지 않았으면 None)
+    """
+    sent_ns = getattr(sent, 'sent_ns', None)
+    if sent_ns is None or (received_ns is not None and sent_ns > received_ns):
+        sent_ns = getattr(sent, 'write_start_ns', None)
+    return sent_ns
+
+
+class PendingRequest:
+    """응답을 기다리는 요청 하나. future 는 응답 PacketEvent 또는 예외로 완료됩니다."""
+    __slots__ = ('cmd', 'future', 'timeout', 'match', 'sent', 'sent_at', 'deadline',
+                 'sent_ns', 'received_ns', 'sampled')
+
+    def __init__(self, cmd: int, timeout: Optional[float], match=None):
+        self.cmd = cmd
+        self.future = Future()
+        self.timeout = timeout  # None 이면 전송 시점의 RTO 사용
+        self.match = match  # match(response) 가 참인 응답만 받음 (None 이면 모든 응답)
+        self.sent: Optional[Future] = None  # 송신 완료 핸들
+        self.sent_at: Optional[float] = None
+        self.deadline: Optional[float] = None
+        # 송신 완료/응답 수신 시각 (time.monotonic_ns), future 완료 전에 기록됨
+        self.sent_ns: Optional[int] = None
+        self.received_ns: Optional[int] = None
+        self.sampled = False  # RTT 추정값에 반영했는지 여부
+
+
+class RequestTracker:
+    """
+    요청과 응답(cmd | CMD_ACK_BIT)을 연결하는 테이블.
+    같은 명령의 요청은 보낸 순서(FIFO)대로 응답과 짝지어지며, 명령별 RTT 로 응답 제한 시간을 정합니다.
+    등록 시 match 를 주면 (예: 응답에 되돌아오는 일련번호) 조건에 맞는 응답만 그 요청을 완료합니다.
+
+    쓰레드:
+        register()/cancel_all() 은 어느 쓰레드에서나, resolve()/check_timeouts() 는 수신 쓰레드에서 호출합니다.
+        제한 시간은 실제 전송이 끝난 시점(송신 쓰레드의 Future 완료)부터 계산합니다.
+        응답은 송신 완료 콜백보다 먼저 처리될 수 있으므로, RTT 는 송신 쓰레드가 SendFuture 에 기록한
+        시각으로 계산하고 어느 쪽이 먼저 실행되든 한 번 반영합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Dict[int, collections.deque] = {}  # cmd -> deque[PendingRequest]
+        self._estimators: Dict[int, RttEstimator] = {}
+        self._link = RttEstimator()  # 전체 명령 공통 추정값 (처음 보는 명령의 초기값)
+        self._next_deadline: Optional[float] = None
+        self.timeout_count = 0
+
+    def register(self, cmd: int, timeout: Optional[float] = None, match=None) -> PendingRequest:
+        """
+        응답을 기다릴 요청을 등록합니다. 패킷을 보내기 전에 호출해야 합니다.
+        Args:
+            timeout (float, optional): 응답 제한 시간(초). 기본값은 측정된 RTT 로 계산한 RTO
+            match (callable, optional): match(response) -> bool, 이 요청에 대한 응답인지 판단
+                (맞지 않는 응답은 이 요청을 건너뛰고, 늦게 도착한 이전 응답이 다음 요청을 완료하지 않음)
+        """
+        request = PendingRequest(cmd, timeout, match)
+        with self._lock:
+            self._pending.setdefault(cmd, collections.deque()).append(request)
+        return request
+
+    def attach(self, request: PendingRequest, sent: Optional[Future]) -> Future:
+        """
+        송신 완료 핸들을 연결합니다. 전송이 끝나면 제한 시간 측정을 시작하고, 전송에 실패하면 요청도 실패합니다.
+        Returns:
+            Future: 응답 핸들 (request.future)
+        """
+        if sent is None:
+            self._discard(request, CancelledError())
+        else:
+            with self._lock:
+                request.sent = sent
+                self._sample(request)  # 이미 응답이 처리된 경우
+            sent.add_done_callback(lambda f: self._on_sent(request, f))
+        return request.future
+
+    def _on_sent(self, request: PendingRequest, sent: Future) -> None:
+        if sent.cancelled():
+            self._discard(request, CancelledError())
+            return
+        error = sent.exception()
+        if error is not None:
+            self._discard(request, error)
+            return
+        sent_ns = _send_time_ns(sent) or time.monotonic_ns()
+        now = sent_ns / 1e9
+        with self._lock:
+            if request.received_ns is not None or request.future.done():
+                self._sample(request)  # 응답이 송신 완료 콜백보다 먼저 처리된 경우
+                return
+            request.sent_ns = sent_ns
+            timeout = request.timeout if request.timeout is not None else self._estimator(request.cmd).rto()
+            request.sent_at = now
+            request.deadline = now + timeout
+            if self._next_deadline is None or request.deadline < self._next_deadline:
+                self._next_deadline = request.deadline
+
+    def _discard(self, request: PendingRequest, error: BaseException) -> None:
+        with self._lock:
+            queue = self._pending.get(request.cmd)
+            if queue and request in queue:
+                queue.remove(request)
+                if request.deadline is not None and request.deadline == self._next_deadline:
+                    self._next_deadline = self._earliest_deadline()
+        if request.future.done():
+            return
+        if isinstance(error, CancelledError):
+            request.future.cancel()
+        else:
+            request.future.set_exception(error)
+
+    def _estimator(self, cmd: int) -> RttEstimator:
+        estimator = self._estimators.get(cmd)
+        return estimator if estimator is not None else self._link
+
+    def _earliest_deadline(self) -> Optional[float]:
+        """대기 중인 요청의 가장 이른 제한 시각 (self._lock 보유 상태에서 호출)"""
+        deadlines = [request.deadline for queue in self._pending.values() for request in queue
+                     if request.deadline is not None]
+        return min(deadlines) if deadlines else None
+
+    def _sample(self, request: PendingRequest) -> None:
+        """
+        응답 수신 시각과 송신 시각을 모두 알게 되면 RTT 를 추정값에 한 번 반영합니다.
+        resolve/attach/_on_sent 중 어느 쪽이 먼저 실행되든 호출됩니다. (self._lock 보유 상태에서 호출)
+        """
+        if request.sampled or request.received_ns is None:
+            return
+        sent_ns = request.sent_ns
+        if sent_ns is None or sent_ns > request.received_ns:
+            sent_ns = _send_time_ns(request.sent, request.received_ns)
+        if sent_ns is None:
+            return  # 송신 시각을 아직 모름 (attach/_on_sent 에서 다시 시도)
+        request.sent_ns = sent_ns
+        request.sampled = True
+        rtt = (request.received_ns - sent_ns) / 1e9
+        estimator = self._estimators.get(request.cmd)
+        if estimator is None:
+            estimator = self._estimators[request.cmd] = RttEstimator()
+        estimator.update(rtt)
+        self._link.update(rtt)
+
+    def resolve(self, cmd: int, response) -> bool:
+        """
+        cmd 에 대한 응답이 도착했을 때 호출합니다. 가장 먼저 보낸 요청(match 가 있으면 조건에 맞는 요청 중
+        가장 먼저 보낸 것)이 response 로 완료됩니다.
+        Returns:
+            bool: 기다리던 요청이 있었는지 여부
+        """
+        received_ns = time.monotonic_ns()
+        with self._lock:
+            queue = self._pending.get(cmd)
+            if not queue:
+                return False
+            for request in queue:
+                if request.match is None or request.match(response):
+                    break
+            else:
+                return False  # 기다리는 요청과 맞지 않는 응답 (이미 타임아웃된 요청의 늦은 응답 등)
+            queue.remove(request)
+            request.received_ns = received_ns
+            self._sample(request)
+            if request.deadline is not None and request.deadline == self._next_deadline:
+                self._next_deadline = self._earliest_deadline()
+        if not request.future.done():
+            request.future.set_result(response)
+        return True
+
+    def next_deadline(self) -> Optional[float]:
+        """가장 이른 응답 제한 시각 (time.monotonic 기준, 없으면 None)"""
+        return self._next_deadline
+
+    def check_timeouts(self, now: Optional[float] = None) -> int:
+        """
+        제한 시간이 지난 요청을 RequestTimeoutError 로 완료합니다. 수신 쓰레드 루프에서 주기적으로 호출합니다.
+        Returns:
+            int: 타임아웃 처리된 요청 수
+        """
+        if self._next_deadline is None:
+            return 0
+        if now is None:
+            now = time.monotonic()
+        if now < self._next_deadline:
+            return 0
+
+        expired = []
+        with self._lock:
+            next_deadline = None
+            for cmd, queue in self._pending.items():
+                for request in list(queue):
+                    if request.deadline is None:
+                        continue
+                    if request.deadline <= now:
+                        queue.remove(request)
+                        expired.append(request)
+                    elif next_deadline is None or request.deadline < next_deadline:
+                        next_deadline = request.deadline
+            self._next_deadline = next_deadline
+            for request in expired:
+                self._estimator(request.cmd).backoff()
+            self.timeout_count += len(expired)
+
+        for request in expired:
+            if not request.future.done():
+                request.future.set_exception(
+                    RequestTimeoutError(request.cmd, request.deadline - request.sent_at))
+        return len(expired)
+
+    def cancel_all(self) -> None:
+        """대기 중인 모든 요청을 취소합니다. (연결 해제 시)"""
+        with self._lock:
+            requests = [request for queue in self._pending.values() for request in queue]
+            self._pending.clear()
+            self._next_deadline = None
+        for request in requests:
+            if not request.future.done():
+                request.future.cancel()
+
+    def pending_count(self) -> int:
+        """응답을 기다리는 요청 수"""
+        with self._lock:
+            return sum(len(queue) for queue in self._pending.values())
+
+    def get_rtt_stats(self) -> dict:
+        """
+        RTT 추정값을 반환합니다.
+        Returns:
+            dict: {'link': {...}, 'commands': {cmd: {...}}, 'timeouts': 타임아웃 횟수}
+        """
+        with self._lock:
+            return {
+                'link': self._link.snapshot(),
+                'commands': {cmd: est.snapshot() for cmd, est in self._estimators.items()},
+                'timeouts': self.timeout_count,
+            }
+
+    def rto(self, cmd: int) -> float:
+        """cmd 요청에 적용할 현재 응답 제한 시간 (초)"""
+        with self._lock:
+            return self._estimator(cmd).rto()
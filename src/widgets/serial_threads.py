@@ -0,0 +1,92 @@
+import logging
+import time
+from typing import Dict, Optional
+
+from src.widgets.serial_reader import SerialReaderThread
+from src.widgets.serial_writer import SerialWriterThread
+
+
+logger = logging.getLogger(__name__)
+
+
+class SerialIoThreads:
+    """
+    열린 포트 하나에 대한 수신/송신 쓰레드 쌍의 생명주기를 관리합니다.
+    포트당 수신 쓰레드 1개, 송신 쓰레드 1개만 존재하도록 보장하며,
+    정지 시에는 송신 -> 수신 순서로 종료하고 쓰레드가 끝날 때까지 기다립니다.
+
+    사용 순서:
+        threads.create(port, protocol, owner)   # 쓰레드 생성 (시그널 연결은 이 사이에)
+        threads.start()
+        ...
+        threads.stop()
+    """
+    READER = 'reader'
+    WRITER = 'writer'
+
+    def __init__(self):
+        self.reader: Optional[SerialReaderThread] = None
+        self.writer: Optional[SerialWriterThread] = None
+        self._started_at = 0.0
+        self._last_cpu_times: Dict[str, float] = {}
+
+    def create(self, serial_port, protocol, owner, max_retries: int = 3, retry_delay: float = 0.15):
+        """
+        포트에 대한 수신/송신 쓰레드를 생성합니다. 기존 쓰레드가 있으면 먼저 정지합니다.
+        Args:
+            owner: 쓰레드의 QObject parent (SerialManager)
+        """
+        if self.reader or self.writer:
+            self.stop()
+        self.writer = SerialWriterThread(protocol, owner, max_retries=max_retries, retry_delay=retry_delay)
+        self.reader = SerialReaderThread(serial_port, owner, protocol=protocol)
+        return self.reader, self.writer
+
+    def start(self):
+        """생성된 쓰레드를 시작합니다. 송신 쓰레드를 먼저 시작해 수신 쓰레드의 sync 전송을 받을 수 있게 합니다."""
+        if not self.reader or not self.writer:
+            raise RuntimeError("start() 전에 create()를 호출해야 합니다")
+        self._started_at = time.monotonic()
+        self.writer.start()
+        self.reader.start()
+
+    def stop(self):
+        """송신 -> 수신 순서로 쓰레드를 정지하고 종료될 때까지 기다립니다."""
+        if not self.reader and not self.writer:
+            return
+        self._last_cpu_times = self.cpu_times()
+        if self.writer:
+            self.writer.stop()
+            self.writer = None
+        if self.reader:
+            self.reader.stop()
+            self.reader = None
+        elapsed = time.monotonic() - self._started_at
+        logger.info("시리얼 I/O 쓰레드 종료 (실행 %.1fs, CPU reader=%.3fs writer=%.3fs)",
+                    elapsed,
+                    self._last_cpu_times.get(self.READER, 0.0),
+                    self._last_cpu_times.get(self.WRITER, 0.0))
+
+    def is_running(self) -> bool:
+        """두 쓰레드가 모두 실행 중인지 반환합니다."""
+        return bool(self.reader and self.writer
+                    and self.reader.isRunning() and self.writer.isRunning())
+
+    def cpu_times(self) -> Dict[str, float]:
+        """
+        쓰레드별 누적 CPU 시간(초)을 반환합니다.
+        실행 중인 쓰레드가 없으면 마지막으로 정지한 쓰레드 쌍의 값을 반환합니다.
+        """
+        if not self.reader and not self.writer:
+            return dict(self._last_cpu_times)
+        return {
+            self.READER: self.reader.get_cpu_time() if self.reader else 0.0,
+            self.WRITER: self.writer.get_cpu_time() if self.writer else 0.0,
+        }
+
+    def cpu_usage(self) -> Dict[str, float]:
+        """쓰레드별 평균 CPU 사용률(%, 시작 이후 기준)을 반환합니다."""
+        elapsed = time.monotonic() - self._started_at
+        if elapsed <= 0 or not self.is_running():
+            return {}
+        return {name: 100.0 * cpu / elapsed for name, cpu in self.cpu_times().items()}
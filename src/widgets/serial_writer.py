@@ -0,0 +1,167 @@
+import enum
+import itertools
+import queue
+import threading
+import time
+import serial
+from PySide6.QtCore import QThread, Signal
+
+from src.widgets.serial_protocol import ComProtocol, PlayControlState
+from src.widgets.serial_requests import SendFuture
+
+
+class TxPriority(enum.IntEnum):
+    """송신 우선순위 (값이 작을수록 먼저 전송)"""
+    EMERGENCY = 0  # 정지, 메인 전원 차단
+    CONTROL = 1    # 일반 제어 명령
+    SYNC = 2       # 주기적 상태 동기화
+    BULK = 3       # 파일 등 대용량 전송
+
+
+def classify_priority(cmd: int, data) -> TxPriority:
+    """명령어와 페이로드로 송신 우선순위를 결정합니다."""
+    if cmd == ComProtocol.CMD_PLAY_CONTROL:
+        if len(data) >= 1 and data[0] == PlayControlState.STOP.value:
+            return TxPriority.EMERGENCY
+        return TxPriority.CONTROL
+    if cmd == ComProtocol.CMD_MAIN_POWER_CONTROL:
+        if len(data) >= 1 and data[0] == 0:
+            return TxPriority.EMERGENCY
+        return TxPriority.CONTROL
+    if cmd == ComProtocol.CMD_STATUS_SYNC or cmd == ComProtocol.CMD_PING:
+        return TxPriority.SYNC
+    if (cmd & ~ComProtocol.CMD_ACK_BIT) == ComProtocol.CMD_FILE_RECEIVE:
+        return TxPriority.BULK
+    return TxPriority.CONTROL
+
+
+class SerialWriterThread(QThread):
+    """
+    시리얼 포트 송신을 전담하는 쓰레드.
+    호출한 쪽은 submit()으로 패킷을 큐에 넣고 즉시 반환받으며,
+    패킷 구성(시퀀스 번호 부여)과 쓰기, 타임아웃 재시도는 모두 이 쓰레드에서 수행됩니다.
+    큐는 TxPriority 순으로 처리되며, 같은 우선순위 안에서는 먼저 들어온 패킷이 먼저 전송됩니다.
+    """
+    write_failed = Signal(int, str)  # cmd, 에러 메시지
+
+    def __init__(self, protocol, parent=None, max_retries: int = 3, retry_delay: float = 0.15):
+        super().__init__(parent)
+        self.protocol = protocol
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay  # 초 단위
+        self._queue = queue.PriorityQueue()
+        self._order = itertools.count()  # 같은 우선순위 내 FIFO 보장
+        self._stop_event = threading.Event()
+        self._submit_lock = threading.Lock()  # 중지 확인과 큐 삽입을 stop() 과 원자적으로 처리
+        self._cpu_time = 0.0  # 이 쓰레드의 누적 CPU 시간 (초), 패킷 처리마다 갱신
+
+    def submit(self, receiverId: int, senderId: int, cmd: int, data,
+               retries: int = None, priority: TxPriority = None) -> SendFuture:
+        """
+        패킷 전송을 예약합니다. 블로킹되지 않습니다.
+        Args:
+            retries (int, optional): 쓰기 타임아웃 시 최대 시도 횟수. 기본값은 max_retries
+            priority (TxPriority, optional): 송신 우선순위. 기본값은 classify_priority() 결과
+        Returns:
+            SendFuture: 전송 완료 시 쓴 바이트 수, 실패 시 예외가 설정되는 완료 핸들
+        """
+        future = SendFuture()
+        if priority is None:
+            priority = classify_priority(cmd, data)
+        attempts = self.max_retries if retries is None else max(1, retries)
+        item = (receiverId, senderId, cmd, bytes(data), attempts, future)
+        with self._submit_lock:
+            # stop() 과 겹쳐 종료 후 큐에 들어간 패킷은 완료되지 않으므로 잠금 안에서 확인
+            if self._stop_event.is_set():
+                future.set_exception(serial.SerialException("송신 쓰레드가 중지되었습니다"))
+                return future
+            self._queue.put((int(priority), next(self._order), item))
+        return future
+
+    def submit_many(self, packets, priority: TxPriority = TxPriority.BULK, retries: int = None) -> list:
+        """
+        여러 패킷(예: 파일 청크)을 한 번에 예약합니다.
+        청크마다 별도로 큐에 들어가므로 더 높은 우선순위 패킷이 청크 사이에 끼어들 수 있습니다.
+        Args:
+            packets: (receiverId, senderId, cmd, data) 튜플 목록
+        Returns:
+            list: 패킷별 Future 목록
+        """
+        return [self.submit(receiverId, senderId, cmd, data, retries=retries, priority=priority)
+                for receiverId, senderId, cmd, data in packets]
+
+    def pending_count(self) -> int:
+        """전송 대기 중인 패킷 수"""
+        return self._queue.qsize()
+
+    def get_cpu_time(self) -> float:
+        """이 쓰레드가 사용한 누적 CPU 시간(초)을 반환합니다."""
+        return self._cpu_time
+
+    def run(self):
+        while True:
+            item = self._queue.get()[2]
+            if item is None:
+                break
+            receiverId, senderId, cmd, data, attempts, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            self._write(receiverId, senderId, cmd, data, attempts, future)
+            self._cpu_time = time.thread_time()
+
+        self._cancel_pending()
+        self._cpu_time = time.thread_time()
+
+    def _write(self, receiverId, senderId, cmd, data, attempts, future):
+        """패킷 하나를 전송합니다. 쓰기 타임아웃은 같은 패킷(같은 시퀀스 번호)으로 재시도합니다."""
+        try:
+            packet = self.protocol.buildPacket(receiverId, senderId, cmd, data)
+        except Exception as e:
+            future.set_exception(e)
+            self.write_failed.emit(cmd, str(e))
+            return
+
+        metrics = self.protocol.metrics
+        for attempt in range(1, attempts + 1):
+            try:
+                # 응답이 완료 콜백보다 먼저 처리될 수 있으므로 시각은 Future 완료 전에 기록
+                future.write_start_ns = time.monotonic_ns()
+                written = self.protocol.writePacket(packet)
+                future.sent_ns = time.monotonic_ns()
+                future.set_result(written)
+                return
+            except serial.SerialTimeoutException as e:
+                metrics.tx_write_timeouts += 1
+                if attempt >= attempts or self._stop_event.wait(self.retry_delay):
+                    metrics.tx_failures += 1
+                    future.set_exception(e)
+                    self.write_failed.emit(cmd, f"전송 타임아웃 ({attempt}/{attempts})")
+                    return
+                metrics.tx_retries += 1
+            except Exception as e:
+                metrics.tx_failures += 1
+                future.set_exception(e)
+                self.write_failed.emit(cmd, str(e))
+                return
+
+    def _cancel_pending(self):
+        """중지 시 남아있는 요청을 취소합니다."""
+        while True:
+            try:
+                item = self._queue.get_nowait()[2]
+            except queue.Empty:
+                break
+            if item is not None:
+                item[-1].cancel()
+
+    def stop(self):
+        """
+        쓰레드를 중지합니다. 진행 중인 쓰기와 이미 예약된 EMERGENCY 패킷(정지, 전원 차단)까지 전송한 뒤
+        종료되며, 나머지 대기 중인 패킷은 취소됩니다.
+        """
+        with self._submit_lock:
+            self._stop_event.set()
+            # 종료 표시는 EMERGENCY 패킷 뒤에 넣어 직전에 누른 정지 명령이 취소되지 않도록 한다
+            self._queue.put((int(TxPriority.EMERGENCY), next(self._order), None))
+        self.wait()
+        self._cancel_pending()  # 쓰레드가 시작되지 않았거나 이미 끝난 경우 남은 패킷 정리
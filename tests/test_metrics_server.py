@@ -0,0 +1,96 @@
+import re
+import urllib.error
+import urllib.request
+
+import pytest
+from PySide6.QtCore import QCoreApplication
+
+from src.metrics_server import CONTENT_TYPE, MetricsServer
+from src.widgets.link_monitor import LinkQuality
+from src.widgets.serial_protocol import ComProtocol, StatusSnapshot
+
+_app = QCoreApplication.instance() or QCoreApplication([])  # MetricsServer 의 QTimer 용
+
+_SAMPLE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{[a-zA-Z_][a-zA-Z0-9_]*="[^"]*"'
+                     r'(,[a-zA-Z_][a-zA-Z0-9_]*="[^"]*")*\})? (\S+)$')
+
+
+class _SerialManagerStub:
+    """render_metrics() 가 읽는 SerialManager 조회 메서드만 제공 (연결된 상태)"""
+
+    def __init__(self):
+        self.protocol = ComProtocol(None, None)
+        self.protocol.metrics.rx_frames = 12
+        self.protocol.metrics.rx_commands[ComProtocol.CMD_STATUS_SYNC_ACK] = 12
+        self.protocol.lastStatus = StatusSnapshot.from_payload(bytes(17))
+
+    def is_port_connected(self):
+        return True
+
+    def get_protocol(self):
+        return self.protocol
+
+    def get_protocol_metrics(self):
+        return self.protocol.get_metrics()
+
+    def get_link_quality(self):
+        return LinkQuality(95, 1.5, 2.0, 4.0, 0.25, 0.0, 10, 0, 0)
+
+    def get_rtt_stats(self):
+        return self.protocol.requests.get_rtt_stats()
+
+    def get_thread_cpu_times(self):
+        return {'reader': 0.5, 'writer': 0.25}
+
+
+@pytest.fixture
+def server():
+    metrics_server = MetricsServer(_SerialManagerStub())
+    metrics_server.start(0)
+    yield metrics_server
+    metrics_server.stop()
+
+
+def _get(server, path):
+    return urllib.request.urlopen(f"http://127.0.0.1:{server.port()}{path}", timeout=5)
+
+
+def test_scrape_returns_exposition_format(server):
+    with _get(server, '/metrics') as response:
+        assert response.status == 200
+        assert response.headers['Content-Type'] == CONTENT_TYPE
+        body = response.read().decode('utf-8')
+
+    assert body.endswith('\n')
+    types = {}
+    samples = {}
+    for line in body.splitlines():
+        if line.startswith('# HELP '):
+            continue
+        if line.startswith('# TYPE '):
+            _, _, name, kind = line.split(' ')
+            assert kind in ('counter', 'gauge')
+            types[name] = kind
+            continue
+        match = _SAMPLE.match(line)
+        assert match, line
+        name, labels, value = match.group(1), match.group(2) or '', match.group(4)
+        assert name in types, f"TYPE 없는 샘플: {line}"
+        if types[name] == 'counter':
+            assert name.endswith('_total'), name
+        samples[name + labels] = float(value)
+
+    assert samples['remote_gui_serial_connected'] == 1
+    assert samples['remote_gui_protocol_rx_frames_total'] == 12
+    assert samples['remote_gui_protocol_rx_command_frames_total{cmd="0x8010"}'] == 12
+    assert samples['remote_gui_link_rtt_seconds{quantile="0.9"}'] == pytest.approx(0.002)
+    assert samples['remote_gui_link_jitter_seconds'] == pytest.approx(0.00025)
+    assert samples['remote_gui_thread_cpu_seconds_total{thread="reader"}'] == 0.5
+    assert 'remote_gui_status_voltage_volts' in samples
+    assert not any('milliseconds' in name for name in samples)
+
+
+def test_unknown_path_is_not_found(server):
+    with pytest.raises(urllib.error.HTTPError) as error:
+        _get(server, '/other')
+    assert error.value.code == 404
@@ -0,0 +1,66 @@
+import threading
+
+import pytest
+from PySide6.QtCore import QCoreApplication, QObject, Qt
+
+from src.widgets.packet_tracer import SEGMENTS, STAGE_RENDERED, STAGE_UPDATED, PacketTracer
+from src.widgets.refresh_scheduler import RefreshScheduler
+from src.widgets.serial_protocol import ComProtocol
+
+_app = QCoreApplication.instance() or QCoreApplication([])  # marker 큐잉 시그널과 스케줄러 타이머용
+
+
+class _Page(QObject):
+    """HomePage 처럼 슬롯에서 위젯 갱신을 RefreshScheduler 에 예약하는 수신 측"""
+
+    def __init__(self, scheduler):
+        super().__init__()
+        self.scheduler = scheduler
+        self.shown = []
+
+    def on_packet(self, event):
+        if event.cmd == ComProtocol.CMD_STATUS_SYNC_ACK:
+            self.scheduler.post('status', self.shown.append, event.sequence)
+
+
+@pytest.fixture
+def tracer():
+    packet_tracer = PacketTracer.get_instance()
+    packet_tracer.set_enabled(True)
+    packet_tracer.clear()
+    yield packet_tracer
+    packet_tracer.set_enabled(False)
+    packet_tracer.clear()
+
+
+def test_rendered_stage_follows_scheduled_update(tracer):
+    """슬롯이 예약한 갱신이 실행된 시각이 rendered 단계로 기록되어야 함"""
+    scheduler = RefreshScheduler()
+    page = _Page(scheduler)
+    protocol = ComProtocol(None, None)
+    protocol.packet_received.connect(page.on_packet, Qt.QueuedConnection)
+    device = ComProtocol(None, None)
+    for cmd in (ComProtocol.CMD_STATUS_SYNC_ACK, ComProtocol.CMD_PONG):
+        protocol.receiveData(device.buildPacket(0x0000, 0x0001, cmd, bytes(17)))
+    # 수신 쓰레드처럼 다른 쓰레드에서 처리해야 marker 가 슬롯과 같은 순서로 큐잉됨
+    reader = threading.Thread(target=protocol.processReceivedData)
+    reader.start()
+    reader.join()
+
+    _app.processEvents()  # marker 와 슬롯 처리 (갱신은 예약만 됨)
+    sync, pong = tracer.get_frames()
+    assert sync[STAGE_UPDATED] is not None and sync[STAGE_RENDERED] is None
+    assert page.shown == []
+
+    scheduler._run_frame()
+    sync, pong = tracer.get_frames()
+    assert page.shown == [sync['sequence']]
+    assert sync[STAGE_RENDERED] >= sync[STAGE_UPDATED]
+    assert pong[STAGE_UPDATED] is not None and pong[STAGE_RENDERED] is None  # 위젯 갱신 없는 프레임
+
+    summary = tracer.summary()
+    assert [name for name, _, _ in SEGMENTS] == list(summary)
+    assert summary['refresh']['count'] == 1
+    assert summary['total']['count'] == 1
+    events = tracer.to_chrome_trace()['traceEvents']
+    assert any(event['name'] == 'rendered 0x8010' for event in events)
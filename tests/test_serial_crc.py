@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from src.widgets.serial_crc import (CRC16_BACKENDS, CRC16_CHECK_INPUT, CRC16_CHECK_VALUE,
+                                    crc16_binascii, crc16_table, get_crc16_backend)
+from src.widgets.serial_protocol import ComProtocol
+
+
+def crc16_bytewise(data) -> int:
+    """테이블 없이 바이트마다 8비트를 시프트하는 CRC16-XMODEM (다항식 0x1021, 초기값 0)"""
+    crc = 0x0000
+    for byte in data:
+        crc ^= byte << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021) if crc & 0x8000 else (crc << 1)
+            crc &= 0xFFFF
+    return crc
+
+
+BACKENDS = dict(CRC16_BACKENDS, bytewise=crc16_bytewise)
+
+
+def _payloads(count=200, max_length=2048, seed=0x31C3):
+    rng = random.Random(seed)
+    payloads = [b'', b'\x00', b'\xff', bytes(range(256))]
+    for _ in range(count):
+        payloads.append(rng.randbytes(rng.randrange(max_length + 1)))
+    return payloads
+
+
+@pytest.mark.parametrize('name', sorted(BACKENDS))
+def test_check_value(name):
+    assert BACKENDS[name](CRC16_CHECK_INPUT) == CRC16_CHECK_VALUE
+
+
+def test_backends_agree_on_random_payloads():
+    for payload in _payloads():
+        expected = crc16_bytewise(payload)
+        assert crc16_table(payload) == expected
+        assert crc16_binascii(payload) == expected
+
+
+def test_backends_accept_memoryview_slices():
+    """수신 경로는 수신 버퍼의 memoryview 슬라이스를 넘김"""
+    for payload in _payloads(count=20):
+        view = memoryview(bytearray(b'\x16' + payload + b'\x16'))[1:-1]
+        for name, backend in BACKENDS.items():
+            assert backend(view) == crc16_bytewise(payload), name
+
+
+def test_selected_backend_matches_reference():
+    name, backend = get_crc16_backend()
+    assert name in CRC16_BACKENDS
+    for payload in _payloads(count=20):
+        assert backend(payload) == crc16_table(payload)
+
+
+def test_protocol_crc_uses_length():
+    protocol = ComProtocol(None, None)
+    data = CRC16_CHECK_INPUT + b'extra'
+    assert protocol.calculateCRC16(data, len(CRC16_CHECK_INPUT)) == CRC16_CHECK_VALUE
@@ -0,0 +1,44 @@
+import pytest
+from PySide6.QtCore import QCoreApplication
+
+from src.serial_manager import SerialManager
+
+_app = QCoreApplication.instance() or QCoreApplication([])  # SerialManager 의 QTimer 용
+
+
+@pytest.fixture
+def manager():
+    serial_manager = SerialManager.get_instance()
+    yield serial_manager
+    serial_manager.set_auto_reconnect(False)
+    serial_manager._last_port = None
+
+
+def test_auto_reconnect_is_off_by_default(manager):
+    assert not manager.is_auto_reconnect_enabled()
+
+
+def test_reconnect_gives_up_and_reports_disconnect(manager):
+    """RECONNECT_MAX_ATTEMPTS 번 실패하면 재연결을 멈추고 연결 끊김 에러를 알려야 함"""
+    failed, errors, attempts = [], [], []
+    manager.reconnect_failed.connect(failed.append)
+    manager.error_occurred.connect(errors.append)
+    on_reconnecting = lambda attempt, delay: attempts.append(attempt)
+    manager.reconnecting.connect(on_reconnecting)
+    port = '/dev/remote-gui-test-missing'
+    manager.set_auto_reconnect(True)
+    manager._last_port = port
+    try:
+        manager._start_reconnect(port)
+        for _ in range(SerialManager.RECONNECT_MAX_ATTEMPTS):
+            assert manager.is_reconnecting()
+            manager._try_reconnect()
+    finally:
+        manager.reconnect_failed.disconnect(failed.append)
+        manager.error_occurred.disconnect(errors.append)
+        manager.reconnecting.disconnect(on_reconnecting)
+
+    assert attempts == list(range(1, SerialManager.RECONNECT_MAX_ATTEMPTS + 1))
+    assert failed == [port]
+    assert len(errors) == 1 and "연결이 끊어졌습니다" in errors[0]
+    assert not manager.is_reconnecting()
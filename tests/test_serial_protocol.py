@@ -0,0 +1,98 @@
+import pytest
+
+from src.widgets.serial_protocol import ComProtocol, PlayControlState
+
+
+FRAME_COUNT = 5
+
+
+def _frames():
+    device = ComProtocol(None, None)
+    return [device.buildPacket(0x0000, 0x0001, ComProtocol.CMD_PONG, bytes([i]) * 4)
+            for i in range(FRAME_COUNT)]
+
+
+def _receive(protocol, data, chunk_size=None):
+    chunk_size = chunk_size or len(data) or 1
+    for i in range(0, len(data), chunk_size):
+        protocol.receiveData(data[i:i + chunk_size])
+        protocol.processReceivedData()
+
+
+@pytest.mark.parametrize('noise', [
+    '', '00', '16', '1616', 'aa161616', '16161616', '16161616fff0', '161616160040', '16161616161616',
+])
+@pytest.mark.parametrize('chunk_size', [None, 1, 7])
+def test_frames_after_noise_are_decoded(noise, chunk_size):
+    """시작 마커(0x16)가 섞인 잡음 뒤의 정상 프레임을 모두 해석해야 함"""
+    protocol = ComProtocol(None, None)
+    received = []
+    protocol.packet_received.connect(received.append)
+
+    _receive(protocol, bytes.fromhex(noise) + b''.join(_frames()), chunk_size)
+
+    assert [event.payload for event in received] == [bytes([i]) * 4 for i in range(FRAME_COUNT)]
+    assert protocol.rxFrameCount == FRAME_COUNT
+    assert protocol.missingPacketCount == 0
+
+
+@pytest.mark.parametrize('length', [ComProtocol.MAX_PACKET_LENGTH + 1, 0xFFFF])
+def test_oversized_length_is_rejected(length):
+    """MAX_PACKET_LENGTH 를 넘는 길이 필드는 프레임으로 기다리지 않고 건너뜀"""
+    protocol = ComProtocol(None, None)
+    _receive(protocol, ComProtocol.START_SEQUENCE + length.to_bytes(2, 'big') + b''.join(_frames()))
+    assert protocol.rxFrameCount == FRAME_COUNT
+
+
+@pytest.mark.parametrize('chunk_size', [None, 1, 509])
+def test_maximum_length_frame_is_decoded(chunk_size):
+    """송신 측이 만들 수 있는 가장 긴 프레임도 수신 측에서 해석되어야 함"""
+    assert ComProtocol.MAX_PACKET_LENGTH == 0x15FF  # 재동기화에 쓰는 0x16xx 바로 아래까지 허용
+    device = ComProtocol(None, None)
+    size = ComProtocol.MAX_PAYLOAD_LENGTH
+    payload = bytes(range(256)) * (size // 256) + ComProtocol.START_SEQUENCE * (size % 256 // 4) + b'\x16' * (size % 4)
+    frame = device.buildPacket(0x0000, 0x0001, ComProtocol.CMD_PONG, payload)
+    assert int.from_bytes(frame[4:6], 'big') == ComProtocol.MAX_PACKET_LENGTH
+
+    protocol = ComProtocol(None, None)
+    received = []
+    protocol.packet_received.connect(received.append)
+    _receive(protocol, frame + _frames()[0], chunk_size)
+    assert [event.payload for event in received] == [payload, bytes(4)]
+
+
+def test_oversized_payload_is_not_encoded():
+    device = ComProtocol(None, None)
+    with pytest.raises(ValueError):
+        device.buildPacket(0x0000, 0x0001, ComProtocol.CMD_PONG, bytes(ComProtocol.MAX_PAYLOAD_LENGTH + 1))
+    assert device.currentSequenceNumber == 0
+
+
+def _status_payload(main_power, play_state):
+    return bytes([main_power, play_state.value]) + bytes(15)
+
+
+def test_ack_does_not_hide_next_status_sync():
+    """ACK 로 받은 상태를 lastStatus 에 덮어쓰지 않아야 다음 sync 에서 상태 시그널이 나감"""
+    device = ComProtocol(None, None)
+    protocol = ComProtocol(None, None)
+    events = []
+    protocol.status_play_state_changed.connect(lambda state: events.append(('sync', state)))
+    protocol.status_power_changed.connect(lambda power: events.append(('power', power)))
+    protocol.play_control_status_changed.connect(lambda state: events.append(('ack', state)))
+    protocol.main_power_status_changed.connect(lambda power: events.append(('power_ack', power)))
+
+    for cmd, payload in [
+        (ComProtocol.CMD_STATUS_SYNC_ACK, _status_payload(False, PlayControlState.PLAY_ONE)),
+        (ComProtocol.CMD_PLAY_CONTROL_ACK, bytes([PlayControlState.STOP.value])),
+        (ComProtocol.CMD_MAIN_POWER_CONTROL_ACK, bytes([1])),
+        (ComProtocol.CMD_STATUS_SYNC_ACK, _status_payload(True, PlayControlState.STOP)),
+    ]:
+        _receive(protocol, device.buildPacket(0x0000, 0x0001, cmd, payload))
+
+    assert events == [
+        ('power', False), ('sync', PlayControlState.PLAY_ONE),
+        ('ack', PlayControlState.STOP.value), ('power_ack', True),
+        ('power', True), ('sync', PlayControlState.STOP),
+    ]
+    assert protocol.lastStatus.play_state is PlayControlState.STOP
@@ -0,0 +1,103 @@
+import time
+
+import pytest
+
+from src.widgets.serial_requests import RequestTimeoutError, RequestTracker, SendFuture
+
+CMD = 0x0110
+
+
+def _written(future: SendFuture, rtt_ns: int = 0) -> SendFuture:
+    """송신 쓰레드처럼 쓰기 시각을 기록 (rtt_ns 만큼 과거)"""
+    future.write_start_ns = time.monotonic_ns() - rtt_ns
+    future.sent_ns = future.write_start_ns
+    return future
+
+
+def test_response_before_send_callback_is_sampled():
+    """응답이 송신 완료 콜백보다 먼저 처리되어도 RTT 를 반영해야 함"""
+    tracker = RequestTracker()
+    request = tracker.register(CMD)
+    sent = SendFuture()
+    response = tracker.attach(request, sent)
+
+    _written(sent, rtt_ns=5_000_000)
+    assert tracker.resolve(CMD, 'ack')  # 쓰기는 끝났지만 set_result 전
+    sent.set_result(20)
+
+    assert response.result(timeout=0) == 'ack'
+    assert request.sent_ns is not None and request.received_ns >= request.sent_ns
+    stats = tracker.get_rtt_stats()
+    assert stats['link']['samples'] == 1
+    assert stats['commands'][CMD]['last_rtt_ms'] >= 5.0
+
+
+def test_response_before_attach_is_sampled():
+    """송신 쓰레드가 attach() 호출 전에 전송을 끝내고 응답까지 처리된 경우"""
+    tracker = RequestTracker()
+    request = tracker.register(CMD)
+    sent = _written(SendFuture(), rtt_ns=1_000_000)
+    assert tracker.resolve(CMD, 'ack')
+    sent.set_result(20)
+    tracker.attach(request, sent)
+
+    assert request.future.result(timeout=0) == 'ack'
+    assert tracker.get_rtt_stats()['link']['samples'] == 1
+
+
+def test_send_callback_then_response():
+    tracker = RequestTracker()
+    request = tracker.register(CMD)
+    sent = SendFuture()
+    tracker.attach(request, sent)
+    _written(sent).set_result(20)
+    assert request.deadline is not None
+    assert tracker.resolve(CMD, 'ack')
+    assert tracker.get_rtt_stats()['link']['samples'] == 1
+
+
+def test_resolve_recomputes_next_deadline():
+    tracker = RequestTracker()
+    first = tracker.register(CMD, timeout=0.5)
+    second = tracker.register(CMD, timeout=5.0)
+    for request in (first, second):
+        tracker.attach(request, _written(SendFuture()))
+        request.sent.set_result(20)
+    assert tracker.next_deadline() == first.deadline
+
+    tracker.resolve(CMD, 'ack')
+    assert tracker.next_deadline() == second.deadline
+    tracker.resolve(CMD, 'ack')
+    assert tracker.next_deadline() is None
+
+
+def test_unanswered_request_times_out():
+    tracker = RequestTracker()
+    request = tracker.register(CMD, timeout=0.01)
+    tracker.attach(request, _written(SendFuture()))
+    request.sent.set_result(20)
+    assert tracker.check_timeouts(request.deadline + 0.001) == 1
+    with pytest.raises(RequestTimeoutError):
+        request.future.result(timeout=0)
+    assert tracker.next_deadline() is None
+
+
+def test_match_skips_late_response_for_expired_request():
+    """늦게 도착한 이전 응답은 다음 요청을 완료하지 않고 RTT 에도 반영되지 않아야 함"""
+    tracker = RequestTracker()
+    first = tracker.register(CMD, timeout=0.01, match=lambda response: response == 1)
+    tracker.attach(first, _written(SendFuture()))
+    first.sent.set_result(20)
+    tracker.check_timeouts(first.deadline + 0.001)
+
+    second = tracker.register(CMD, match=lambda response: response == 2)
+    tracker.attach(second, _written(SendFuture()))
+    second.sent.set_result(20)
+
+    assert not tracker.resolve(CMD, 1)  # 첫 요청의 늦은 응답
+    assert not second.future.done()
+    assert tracker.get_rtt_stats()['link']['samples'] == 0
+
+    assert tracker.resolve(CMD, 2)
+    assert second.future.result(timeout=0) == 2
+    assert tracker.get_rtt_stats()['link']['samples'] == 1
@@ -0,0 +1,100 @@
+import threading
+import time
+
+import pytest
+
+from src.widgets.serial_protocol import ComProtocol, PlayControlState
+from src.widgets.serial_writer import SerialWriterThread, TxPriority
+
+
+class _BlockingSink:
+    """첫 쓰기를 release 될 때까지 붙잡아 두는 송신 대상 (쓴 명령어를 기록)"""
+    is_open = True
+
+    def __init__(self):
+        self.writing = threading.Event()
+        self.release = threading.Event()
+        self.commands = []
+
+    def write(self, data) -> int:
+        if not self.commands:
+            self.writing.set()
+            self.release.wait(5)
+        self.commands.append(int.from_bytes(data[ComProtocol.FRAME_PREFIX_LENGTH + 4:
+                                                   ComProtocol.FRAME_PREFIX_LENGTH + 6], 'big'))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+@pytest.fixture
+def writer():
+    sink = _BlockingSink()
+    thread = SerialWriterThread(ComProtocol(sink, None))
+    thread.sink = sink
+    thread.start()
+    yield thread
+    sink.release.set()
+    thread.stop()
+
+
+def _stop_in_background(writer):
+    """stop() 을 다른 쓰레드에서 호출하고 종료 표시가 큐에 들어갈 때까지 기다림"""
+    queued = writer.pending_count()
+    stopper = threading.Thread(target=writer.stop)
+    stopper.start()
+    while writer.pending_count() <= queued:
+        time.sleep(0.001)
+    return stopper
+
+
+def test_stop_sends_queued_emergency_packets(writer):
+    """중지 직전에 예약된 정지 명령은 전송하고 나머지 대기 패킷만 취소해야 함"""
+    first = writer.submit(0x0001, 0x0000, ComProtocol.CMD_STATUS_SYNC, b'')
+    assert writer.sink.writing.wait(5)
+    control = writer.submit(0x0001, 0x0000, ComProtocol.CMD_MAIN_POWER_CONTROL, b'\x01')
+    stop = writer.submit(0x0001, 0x0000, ComProtocol.CMD_PLAY_CONTROL,
+                         bytes([PlayControlState.STOP.value]))
+
+    stopper = _stop_in_background(writer)
+    writer.sink.release.set()
+    stopper.join(5)
+
+    assert first.result(timeout=0) > 0
+    assert stop.result(timeout=0) > 0
+    assert control.cancelled()
+    assert writer.sink.commands == [ComProtocol.CMD_STATUS_SYNC, ComProtocol.CMD_PLAY_CONTROL]
+
+
+def test_submit_after_stop_fails(writer):
+    writer.stop()
+    future = writer.submit(0x0001, 0x0000, ComProtocol.CMD_PLAY_CONTROL, b'\x04',
+                           priority=TxPriority.EMERGENCY)
+    assert future.exception(timeout=0) is not None
+
+
+def test_submit_racing_stop_always_completes():
+    """stop() 과 동시에 들어온 요청도 전송, 취소, 실패 중 하나로 끝나야 함"""
+    for _ in range(20):
+        sink = _BlockingSink()
+        sink.release.set()
+        thread = SerialWriterThread(ComProtocol(sink, None))
+        thread.start()
+        futures = []
+        running = threading.Event()
+
+        def submit_loop():
+            running.set()
+            while not thread._stop_event.is_set():
+                futures.append(thread.submit(0x0001, 0x0000, ComProtocol.CMD_STATUS_SYNC, b''))
+            futures.append(thread.submit(0x0001, 0x0000, ComProtocol.CMD_STATUS_SYNC, b''))
+
+        submitters = [threading.Thread(target=submit_loop) for _ in range(4)]
+        for submitter in submitters:
+            submitter.start()
+        running.wait(5)
+        thread.stop()
+        for submitter in submitters:
+            submitter.join(5)
+        assert all(future.done() for future in futures)